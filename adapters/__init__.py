@@ -3,18 +3,56 @@ Unsloth to Brev Notebook Adapter Package
 
 This package provides adapters for converting Unsloth Colab notebooks
 to NVIDIA Brev-compatible launchables.
+
+Public names are imported on first access (PEP 562), so importing the
+package, or a light submodule such as adapters.build_time, does not pull
+in nbformat and jinja2.
 """
 
-from .base_adapter import NotebookAdapter
-from .colab_to_brev import ColabToBrevAdapter
-from .model_configs import MODEL_CONFIGS, get_config_for_notebook
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from .base_adapter import NotebookAdapter
+    from .colab_to_brev import ColabToBrevAdapter
+    from .launchables_index import LaunchablesIndex
+    from .model_configs import MODEL_CONFIGS, ModelConfig, get_config_for_notebook
+    from .session import AdapterSession
 
 __all__ = [
     'NotebookAdapter',
     'ColabToBrevAdapter',
+    'AdapterSession',
+    'LaunchablesIndex',
     'MODEL_CONFIGS',
+    'ModelConfig',
     'get_config_for_notebook',
 ]
 
 __version__ = '1.0.0'
 
+# Public name -> submodule defining it
+_LAZY_ATTRIBUTES = {
+    'NotebookAdapter': 'base_adapter',
+    'ColabToBrevAdapter': 'colab_to_brev',
+    'AdapterSession': 'session',
+    'LaunchablesIndex': 'launchables_index',
+    'MODEL_CONFIGS': 'model_configs',
+    'ModelConfig': 'model_configs',
+    'get_config_for_notebook': 'model_configs',
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its submodule on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    # Later lookups find the attribute directly and skip this hook
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -4,47 +4,221 @@ Base Notebook Adapter Class
 Provides the foundation for converting notebooks between different platforms.
 """
 
+import hashlib
+import inspect
 import json
 import logging
 from abc import ABC, abstractmethod
+from collections import Counter
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
 
 import nbformat
 from nbformat.v4 import new_markdown_cell
 
+from .cell_cache import CellCache, cell_cache_key
+from .model_configs import ModelConfig
+from .notebook_io import Notebook, read_notebook
+from .profiler import ConversionProfiler
+from .rewrite_engine import LiteralScanner
+
 logger = logging.getLogger(__name__)
 
+# Notebook cell types a conversion can be scoped to
+CELL_TYPES = ('code', 'markdown', 'raw')
+
+# Conversions registered without an explicit scope run on these cell types
+DEFAULT_CELL_TYPES = ('code', 'markdown')
+
+# Cell id of the generated Brev header cell
+HEADER_CELL_ID = 'brev-header'
+
+
+class GeneratedSource(str):
+    """
+    Cell source produced wholesale by a terminal conversion.
+
+    Returning a GeneratedSource from a conversion registered with
+    ``terminal=True`` marks the cell as final: the remaining conversions in
+    the pipeline are skipped instead of rescanning generated text.
+    """
+
 
 class NotebookAdapter(ABC):
     """Base class for notebook adapters."""
 
+    # Modules of this package whose code does the conversions' matching and
+    # rewriting; their source is part of rule_version()
+    rule_modules: Tuple[str, ...] = ('rewrite_engine',)
+
     def __init__(self):
         """Initialize the adapter with a registry of conversion functions."""
         self.conversions: Dict[str, Callable] = {}
+        self.conversion_triggers: Dict[str, Optional[FrozenSet[str]]] = {}
+        self.conversion_scopes: Dict[str, FrozenSet[str]] = {}
+        self.terminal_conversions: set = set()
+        self.conversion_config_keys: Dict[str, Optional[FrozenSet[str]]] = {}
+        self._rule_version: Optional[str] = None
+        # Optional persistent cache of converted cells (see adapters.cell_cache)
+        self.cell_cache: Optional[CellCache] = None
+        # Load notebooks as plain dicts without schema validation (see adapters.notebook_io)
+        self.fast_io = False
+        # Fixed timestamp for generated files; None uses the current time (see adapters.build_time)
+        self.build_time: Optional[datetime] = None
+        # Per-cell-type (steps, trigger scanner), rebuilt when the registry changes
+        self._pipelines: Optional[Dict[str, Tuple[list, LiteralScanner]]] = None
+        # Per-adapter counters (conversion calls made/skipped, ...)
+        self.stats: Counter = Counter()
+        # Optional per-conversion instrumentation (see adapters.profiler)
+        self.profiler: Optional[ConversionProfiler] = None
         self._register_default_conversions()
 
     def _register_default_conversions(self):
         """Register default conversion functions. Override in subclasses."""
         pass
 
-    def register_conversion(self, name: str, func: Callable) -> None:
+    def register_conversion(
+        self,
+        name: str,
+        func: Callable,
+        triggers: Optional[Iterable[str]] = None,
+        cell_types: Iterable[str] = DEFAULT_CELL_TYPES,
+        terminal: bool = False,
+        config_keys: Optional[Iterable[str]] = None
+    ) -> None:
         """
         Register a conversion function.
 
         Args:
             name: Name of the conversion (e.g., 'installation', 'magic_commands')
             func: Callable that takes (code: str, config: dict) and returns str
+            triggers: ASCII literals (matched case-insensitively) at least one of
+                which must occur in a cell for the conversion to change it; the
+                conversion is skipped for cells containing none of them. None
+                means the conversion runs on every cell.
+            cell_types: Cell types ('code', 'markdown', 'raw') the conversion
+                applies to
+            terminal: The conversion may return a GeneratedSource, which ends
+                the pipeline for that cell
+            config_keys: Config fields the conversion reads. Used to key the
+                cell cache; None means it may read any field.
         """
+        scope = frozenset(cell_types)
+        unknown = scope.difference(CELL_TYPES)
+        if unknown:
+            raise ValueError(f"Unknown cell type(s) for conversion '{name}': {sorted(unknown)}")
+
         self.conversions[name] = func
-        logger.debug(f"Registered conversion: {name}")
+        self.conversion_triggers[name] = (
+            None if triggers is None else frozenset(t.lower() for t in triggers)
+        )
+        self.conversion_scopes[name] = scope
+        if terminal:
+            self.terminal_conversions.add(name)
+        else:
+            self.terminal_conversions.discard(name)
+        self.conversion_config_keys[name] = (
+            None if config_keys is None else frozenset(config_keys)
+        )
+        self._pipelines = None
+        self._rule_version = None
+        logger.debug(f"Registered conversion: {name} (cell types: {', '.join(sorted(scope))})")
+
+    def _get_pipeline(self, cell_type: str) -> Tuple[list, LiteralScanner]:
+        """
+        Get the conversions that apply to a cell type, in registration order.
+
+        Args:
+            cell_type: Notebook cell type
+
+        Returns:
+            Tuple of ([(name, func, triggers), ...], scanner over their triggers)
+        """
+        if self._pipelines is None:
+            pipelines = {}
+            for scoped_type in CELL_TYPES:
+                steps = [
+                    (name, func, self.conversion_triggers[name])
+                    for name, func in self.conversions.items()
+                    if scoped_type in self.conversion_scopes[name]
+                ]
+                self._validate_conversion_order(scoped_type, steps)
+                scanner = LiteralScanner(
+                    trigger for _, _, triggers in steps if triggers for trigger in triggers
+                )
+                pipelines[scoped_type] = (steps, scanner)
+            self._pipelines = pipelines
+        return self._pipelines[cell_type]
+
+    def rule_version(self) -> str:
+        """
+        Get a fingerprint of the conversion rules.
+
+        Derived from the source of the pipeline driver, of every registered
+        conversion and of the helper modules in rule_modules, plus their
+        registration options and any extra rule data from
+        _rule_version_parts(), so editing a conversion or the engine that
+        runs it invalidates cached results automatically.
+
+        Returns:
+            Hex digest of the conversion rules
+        """
+        if self._rule_version is None:
+            digest = hashlib.sha256()
+            digest.update(_source_of(NotebookAdapter._apply_conversions).encode('utf-8'))
+            for module_name in self.rule_modules:
+                digest.update(_module_source(module_name))
+            for name, func in self.conversions.items():
+                options = (
+                    name,
+                    sorted(self.conversion_scopes[name]),
+                    sorted(self.conversion_triggers[name] or ()),
+                    name in self.terminal_conversions,
+                )
+                digest.update(repr(options).encode('utf-8'))
+                digest.update(_source_of(func).encode('utf-8'))
+            for part in self._rule_version_parts():
+                digest.update(part.encode('utf-8'))
+            self._rule_version = digest.hexdigest()
+        return self._rule_version
+
+    def _rule_version_parts(self) -> List[str]:
+        """Extra data the conversions depend on (e.g. rule tables). Override in subclasses."""
+        return []
+
+    def _validate_conversion_order(self, cell_type: str, steps: list) -> None:
+        """
+        Check that no conversion can rewrite a cell out from under a terminal one.
+
+        A terminal conversion claims the cells its triggers describe. Any
+        conversion ordered before it in the same pipeline that can fire on
+        those cells (shared triggers, or no triggers at all) could rewrite the
+        cell first and silently change or defeat the terminal rewrite.
+
+        Args:
+            cell_type: Cell type of the pipeline
+            steps: Pipeline steps, in order
+
+        Raises:
+            ValueError: If a terminal conversion is ordered after an overlapping one
+        """
+        for index, (name, _, triggers) in enumerate(steps):
+            if name not in self.terminal_conversions:
+                continue
+            for earlier, _, earlier_triggers in steps[:index]:
+                if triggers is None or earlier_triggers is None or not triggers.isdisjoint(earlier_triggers):
+                    raise ValueError(
+                        f"Terminal conversion '{name}' must be registered before "
+                        f"'{earlier}' in the {cell_type} pipeline: both can fire "
+                        f"on the same cells"
+                    )
 
     def adapt(
         self,
         notebook_path: Path,
         config: Dict[str, Any]
-    ) -> Tuple[nbformat.NotebookNode, Dict[str, str]]:
+    ) -> Tuple[Notebook, Dict[str, str]]:
         """
         Adapt a notebook to the target platform.
 
@@ -56,33 +230,31 @@ class NotebookAdapter(ABC):
             Tuple of (adapted_notebook, companion_files_dict)
         """
         logger.info(f"Adapting notebook: {notebook_path}")
+        if self.profiler is not None:
+            self.profiler.begin_notebook(Path(notebook_path).name)
+
+        # Load the notebook (item access below works for both loaders)
+        notebook = read_notebook(notebook_path, fast=self.fast_io)
+
+        # Run each cell through the pipeline for its cell type
+        for cell in notebook['cells']:
+            cell_type = cell.get('cell_type')
+            if cell_type not in CELL_TYPES:
+                continue
+            cell['source'] = self._convert_cell(cell.get('source', ''), config, cell_type)
+            if cell_type == 'code':
+                # Clear outputs and execution state
+                cell['outputs'] = []
+                cell['execution_count'] = None
 
-        # Load the notebook
-        with open(notebook_path, 'r', encoding='utf-8') as f:
-            notebook = nbformat.read(f, as_version=4)
-
-        # Add header cell
+        # Add header cell; it is generated Brev content, so it is inserted
+        # after the conversions rather than rewritten by them
         header_cell = self.create_header_cell(notebook_path, config)
-        notebook.cells.insert(0, header_cell)
-
-        # Process each code and markdown cell
-        for cell in notebook.cells:
-            if cell.cell_type == 'code':
-                original_source = cell.source
-                adapted_source = self._apply_conversions(original_source, config)
-                cell.source = adapted_source
-                # Clear outputs and execution state
-                cell.outputs = []
-                cell.execution_count = None
-            elif cell.cell_type == 'markdown':
-                # Apply conversions to markdown cells too (for cleaning links, etc.)
-                original_source = cell.source
-                adapted_source = self._apply_conversions(original_source, config)
-                cell.source = adapted_source
+        notebook['cells'].insert(0, header_cell)
 
         # Clean notebook-level metadata (remove widget state from Colab)
-        if 'widgets' in notebook.metadata:
-            del notebook.metadata['widgets']
+        if 'widgets' in notebook['metadata']:
+            del notebook['metadata']['widgets']
             logger.debug("Removed widget state metadata from notebook")
 
         # Generate companion files
@@ -91,23 +263,117 @@ class NotebookAdapter(ABC):
         logger.info(f"Adaptation complete for {notebook_path}")
         return notebook, companion_files
 
-    def _apply_conversions(self, code: str, config: Dict[str, Any]) -> str:
+    def _convert_cell(self, source: str, config: Dict[str, Any], cell_type: str) -> str:
+        """
+        Convert a cell's source, consulting the cell cache when one is attached.
+
+        Args:
+            source: Cell source
+            config: Configuration dictionary
+            cell_type: Notebook cell type
+
+        Returns:
+            Converted source
+        """
+        if self.cell_cache is None:
+            return self._apply_conversions(source, config, cell_type)
+
+        key = cell_cache_key(
+            source, cell_type, self._config_fields(config, cell_type), self.rule_version()
+        )
+        cached = self.cell_cache.get(key)
+        if cached is not None:
+            self.stats['cell_cache_hits'] += 1
+            return cached
+
+        self.stats['cell_cache_misses'] += 1
+        result = self._apply_conversions(source, config, cell_type)
+        self.cell_cache.put(key, result)
+        return result
+
+    def _config_fields(self, config: Dict[str, Any], cell_type: str) -> Dict[str, Any]:
         """
-        Apply all registered conversions to code.
+        Select the config fields the conversions for a cell type can read.
+
+        Args:
+            config: Configuration dictionary
+            cell_type: Notebook cell type
+
+        Returns:
+            The relevant subset of config (all of it if any conversion did not
+            declare its config_keys)
+        """
+        steps, _ = self._get_pipeline(cell_type)
+        keys = set()
+        for name, _, _ in steps:
+            declared = self.conversion_config_keys.get(name)
+            if declared is None:
+                return dict(config)
+            keys.update(declared)
+        return {key: config[key] for key in sorted(keys) if key in config}
+
+    def _apply_conversions(
+        self,
+        code: str,
+        config: Dict[str, Any],
+        cell_type: str = 'code'
+    ) -> str:
+        """
+        Apply the registered conversions scoped to a cell type.
+
+        Conversions that declared triggers are only called when one of their
+        triggers occurs in the current code. The code is scanned for triggers
+        once, and rescanned only after a conversion changes it. A terminal
+        conversion that returns a GeneratedSource ends the pipeline.
 
         Args:
             code: Source code to convert
             config: Configuration dictionary
+            cell_type: Type of the cell the code came from
 
         Returns:
             Converted code
         """
+        steps, scanner = self._get_pipeline(cell_type)
+        if isinstance(code, GeneratedSource):
+            self.stats['conversion_calls_short_circuited'] += len(steps)
+            return str(code)
+
+        profiler = self.profiler
         result = code
-        for name, func in self.conversions.items():
+        present = None
+        for index, (name, func, triggers) in enumerate(steps):
+            if triggers is not None:
+                if present is None:
+                    present = scanner.scan(result)
+                if triggers.isdisjoint(present):
+                    self.stats['conversion_calls_skipped'] += 1
+                    if profiler is not None:
+                        profiler.skip(cell_type, name)
+                    continue
+
+            self.stats['conversion_calls'] += 1
             try:
-                result = func(result, config)
+                if profiler is None:
+                    converted = func(result, config)
+                else:
+                    converted = profiler.call(cell_type, name, func, result, config)
             except Exception as e:
                 logger.warning(f"Conversion '{name}' failed: {e}")
+                continue
+            if isinstance(converted, GeneratedSource):
+                if name not in self.terminal_conversions:
+                    raise TypeError(
+                        f"Conversion '{name}' returned generated source but was "
+                        f"not registered with terminal=True"
+                    )
+                remaining = len(steps) - index - 1
+                self.stats['conversion_calls_short_circuited'] += remaining
+                logger.debug(f"Conversion '{name}' produced final source, skipping {remaining} conversion(s)")
+                return str(converted)
+            if converted != result:
+                present = None
+            result = converted
         return result
 
     def create_header_cell(
@@ -125,12 +391,13 @@ class NotebookAdapter(ABC):
         Returns:
             Markdown cell with styled header
         """
-        model_name = config.get('model_name', 'Unknown Model')
-        upstream_url = config.get('upstream_notebook_url', '#')
-        gpu = config.get('recommended_gpu', 'N/A')
-        vram = config.get('min_vram_gb', 'N/A')
-        batch_size = config.get('recommended_batch_size', 'N/A')
-        categories = ', '.join(config.get('categories', []))
+        record = ModelConfig.from_mapping(config)
+        model_name = record.model_name
+        upstream_url = record.upstream_notebook_url
+        gpu = record.recommended_gpu
+        vram = record.min_vram_gb
+        batch_size = record.recommended_batch_size
+        categories = ', '.join(record.categories)
 
         # Convert Colab URL to GitHub URL
         if 'colab.research.google.com' in upstream_url:
@@ -200,7 +467,8 @@ class NotebookAdapter(ABC):
 - [Brev Documentation](https://docs.nvidia.com/brev)
 - [Original Notebook]({upstream_url})
 """
-        return new_markdown_cell(header_markdown)
+        # A fixed id keeps reconverted notebooks byte-identical when nothing changed
+        return new_markdown_cell(header_markdown, id=HEADER_CELL_ID)
 
     @abstractmethod
     def generate_companion_files(
@@ -220,3 +488,18 @@ class NotebookAdapter(ABC):
         """
         pass
 
+
+def _module_source(module_name: str) -> bytes:
+    """Read the source file of a module of this package without importing it."""
+    return (Path(__file__).parent / f'{module_name}.py').read_bytes()
+
+
+def _source_of(func: Callable) -> str:
+    """Get the source of a function, falling back to its bytecode."""
+    try:
+        return inspect.getsource(func)
+    except (OSError, TypeError):
+        code = getattr(func, '__code__', None)
+        if code is None:
+            return repr(func)
+        return code.co_code.hex() + repr(code.co_consts)
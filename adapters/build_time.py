@@ -0,0 +1,112 @@
+"""
+Build Time
+
+Resolves the timestamp embedded in generated artifacts. In reproducible mode
+it comes from ``SOURCE_DATE_EPOCH`` or the upstream commit time recorded in
+``metadata/last_sync.txt`` instead of the wall clock, so unchanged inputs
+produce byte-identical outputs.
+"""
+
+import logging
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# Default location of the sync record (commit hash, then commit time)
+DEFAULT_LAST_SYNC_PATH = Path(__file__).parent.parent / 'metadata' / 'last_sync.txt'
+
+
+def source_date_epoch() -> Optional[datetime]:
+    """
+    Read the build time from the ``SOURCE_DATE_EPOCH`` environment variable.
+
+    See https://reproducible-builds.org/specs/source-date-epoch/
+
+    Returns:
+        UTC datetime, or None if the variable is unset or empty
+
+    Raises:
+        ValueError: If the variable is not an integer number of seconds
+    """
+    value = os.environ.get('SOURCE_DATE_EPOCH', '').strip()
+    if not value:
+        return None
+    try:
+        return datetime.fromtimestamp(int(value), tz=timezone.utc)
+    except ValueError:
+        raise ValueError(f"SOURCE_DATE_EPOCH must be an integer, got {value!r}")
+
+
+def last_sync_time(path: Path = DEFAULT_LAST_SYNC_PATH) -> Optional[datetime]:
+    """
+    Read the upstream commit time from a last_sync.txt file.
+
+    Args:
+        path: Path to last_sync.txt (commit hash on the first line, ISO 8601
+            time on the second)
+
+    Returns:
+        UTC datetime, or None if the file or timestamp is missing or malformed
+    """
+    try:
+        lines = Path(path).read_text(encoding='utf-8').splitlines()
+    except OSError:
+        return None
+    if len(lines) < 2 or not lines[1].strip():
+        return None
+    try:
+        timestamp = datetime.fromisoformat(lines[1].strip().replace('Z', '+00:00'))
+    except ValueError:
+        logger.warning(f"Malformed timestamp in {path}: {lines[1]!r}")
+        return None
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.astimezone(timezone.utc)
+
+
+def resolve_build_time(
+    reproducible: bool = False,
+    last_sync_path: Path = DEFAULT_LAST_SYNC_PATH
+) -> Optional[datetime]:
+    """
+    Get the fixed build time to embed in generated artifacts.
+
+    ``SOURCE_DATE_EPOCH`` always wins when it is set. Otherwise reproducible
+    mode falls back to the upstream commit time in last_sync.txt.
+
+    Args:
+        reproducible: Require a fixed build time
+        last_sync_path: Path to last_sync.txt
+
+    Returns:
+        UTC datetime, or None to use the current time
+
+    Raises:
+        ValueError: If reproducible mode is requested but no build time is available
+    """
+    build_time = source_date_epoch()
+    if build_time is None and reproducible:
+        build_time = last_sync_time(last_sync_path)
+        if build_time is None:
+            raise ValueError(
+                f"Reproducible mode needs SOURCE_DATE_EPOCH or a timestamp in {last_sync_path}"
+            )
+    if build_time is not None:
+        logger.info(f"Using fixed build time: {build_time.isoformat()}")
+    return build_time
+
+
+def format_build_time(build_time: Optional[datetime]) -> str:
+    """
+    Format a build time for embedding, using the current time if none is fixed.
+
+    Args:
+        build_time: Fixed build time from resolve_build_time(), or None
+
+    Returns:
+        ISO 8601 timestamp in UTC
+    """
+    return (build_time or datetime.now(timezone.utc)).isoformat()
@@ -0,0 +1,191 @@
+"""
+Cell Cache
+
+Persistent, content-addressed cache of converted cell sources.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+# Default number of cells kept before least-recently-used entries are evicted
+DEFAULT_MAX_ENTRIES = 100_000
+
+
+def default_cache_dir() -> Path:
+    """
+    Get the cache directory used when none is given.
+
+    Honours ``UNSLOTH_BREV_CACHE_DIR``, then ``XDG_CACHE_HOME``.
+
+    Returns:
+        Path to the cache directory
+    """
+    override = os.environ.get('UNSLOTH_BREV_CACHE_DIR')
+    if override:
+        return Path(override)
+    xdg_cache = os.environ.get('XDG_CACHE_HOME')
+    base = Path(xdg_cache) if xdg_cache else Path.home() / '.cache'
+    return base / 'unsloth-brev'
+
+
+def cell_cache_key(
+    source: str,
+    cell_type: str,
+    config_fields: Dict[str, Any],
+    rule_version: str
+) -> str:
+    """
+    Build the content address of a converted cell.
+
+    Args:
+        source: Original cell source
+        cell_type: Notebook cell type
+        config_fields: Config values the conversions for this cell type read
+        rule_version: Version of the conversion rules (see NotebookAdapter.rule_version)
+
+    Returns:
+        Hex digest identifying the conversion result
+    """
+    digest = hashlib.sha256()
+    digest.update(rule_version.encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(cell_type.encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(json.dumps(config_fields, sort_keys=True, default=str).encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(source.encode('utf-8', 'surrogatepass'))
+    return digest.hexdigest()
+
+
+class CellCache:
+    """
+    SQLite-backed map from cell content address to converted source.
+
+    Reads and writes are batched and committed by ``flush()``; entries beyond
+    ``max_entries`` are evicted least-recently-used first by ``prune()``.
+    Each process should open its own CellCache on the shared database file.
+    """
+
+    def __init__(self, cache_dir: Path, max_entries: int = DEFAULT_MAX_ENTRIES):
+        """
+        Open (creating if needed) the cache database.
+
+        Args:
+            cache_dir: Directory holding the cache database
+            max_entries: Number of entries kept by prune()
+        """
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.path = self.cache_dir / 'cells.sqlite'
+        self.max_entries = max_entries
+        self._conn = sqlite3.connect(str(self.path), timeout=60)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute(
+            'CREATE TABLE IF NOT EXISTS cells ('
+            ' key TEXT PRIMARY KEY,'
+            ' value TEXT NOT NULL,'
+            ' last_used REAL NOT NULL)'
+        )
+        self._conn.execute('CREATE INDEX IF NOT EXISTS cells_last_used ON cells (last_used)')
+        self._conn.commit()
+        self._touched = set()
+        self._pending: Dict[str, str] = {}
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a converted cell.
+
+        Args:
+            key: Content address from cell_cache_key()
+
+        Returns:
+            Converted source, or None on a miss
+        """
+        if key in self._pending:
+            return self._pending[key]
+        row = self._conn.execute('SELECT value FROM cells WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        self._touched.add(key)
+        return row[0]
+
+    def put(self, key: str, value: str) -> None:
+        """
+        Store a converted cell (written on the next flush).
+
+        Args:
+            key: Content address from cell_cache_key()
+            value: Converted source
+        """
+        self._pending[key] = value
+
+    def flush(self) -> None:
+        """Commit pending entries and refresh last-used times of cache hits."""
+        if not self._pending and not self._touched:
+            return
+        now = time.time()
+        try:
+            with self._conn:
+                self._conn.executemany(
+                    'INSERT OR REPLACE INTO cells (key, value, last_used) VALUES (?, ?, ?)',
+                    ((key, value, now) for key, value in self._pending.items())
+                )
+                self._conn.executemany(
+                    'UPDATE cells SET last_used = ? WHERE key = ?',
+                    ((now, key) for key in self._touched)
+                )
+        except (sqlite3.Error, UnicodeEncodeError) as e:
+            # A cache write failure only costs a recomputation next run
+            logger.warning(f"Could not update cell cache {self.path}: {e}")
+        self._pending.clear()
+        self._touched.clear()
+
+    def prune(self) -> int:
+        """
+        Evict least-recently-used entries beyond max_entries.
+
+        Returns:
+            Number of entries evicted
+        """
+        self.flush()
+        count = len(self)
+        excess = count - self.max_entries
+        if excess <= 0:
+            return 0
+        with self._conn:
+            self._conn.execute(
+                'DELETE FROM cells WHERE key IN ('
+                ' SELECT key FROM cells ORDER BY last_used ASC LIMIT ?)',
+                (excess,)
+            )
+        logger.info(f"Evicted {excess} least-recently-used cell(s) from {self.path}")
+        return excess
+
+    def clear(self) -> None:
+        """Remove every entry."""
+        self._pending.clear()
+        self._touched.clear()
+        with self._conn:
+            self._conn.execute('DELETE FROM cells')
+
+    def close(self) -> None:
+        """Flush and close the database."""
+        self.flush()
+        self._conn.close()
+
+    def __len__(self) -> int:
+        return self._conn.execute('SELECT COUNT(*) FROM cells').fetchone()[0]
+
+    def keys(self) -> Iterable[str]:
+        """Iterate over stored keys (least recently used first)."""
+        for (key,) in self._conn.execute('SELECT key FROM cells ORDER BY last_used ASC'):
+            yield key
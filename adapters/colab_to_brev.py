@@ -4,49 +4,368 @@ Colab to Brev Adapter
 Converts Google Colab notebooks with Unsloth to NVIDIA Brev-compatible notebooks.
 """
 
+import inspect
 import json
 import logging
 import re
-from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 from jinja2 import Environment, FileSystemLoader
 
-from .base_adapter import NotebookAdapter
+from .base_adapter import GeneratedSource, NotebookAdapter
+from .build_time import format_build_time
+from .model_configs import ModelConfig
+from .rewrite_engine import ChainMatcher, RewriteEngine, RewriteRule
+from .template_cache import TEMPLATE_OPTIONS, TemplateBytecodeCache
 
 logger = logging.getLogger(__name__)
 
+COLAB_INSTALL_REPLACEMENT = '''import subprocess
+import sys
+
+# Install Unsloth with conda variant for Brev
+subprocess.check_call([
+    sys.executable, "-m", "pip", "install",
+    "unsloth[conda] @ git+https://github.com/unslothai/unsloth.git"
+])'''
+
+BREV_LINKS_REPLACEMENT = '''**Additional Resources:**
+
+- 📚 [Unsloth Documentation](https://docs.unsloth.ai) - Complete guides and examples
+- 💬 [Unsloth Discord](https://discord.gg/unsloth) - Community support
+- 📖 [More Notebooks](https://github.com/unslothai/notebooks) - Full collection on GitHub
+- 🚀 [Brev Documentation](https://docs.nvidia.com/brev) - Deploy and scale on NVIDIA GPUs'''
+
+
+def _add_device_map(match: re.Match) -> str:
+    """Append device_map="auto" to a from_pretrained call that lacks one."""
+    call = match.group(1)
+    # Check if device_map already present
+    if 'device_map' not in call:
+        # Strip any trailing whitespace and commas before adding device_map
+        call = call.rstrip()
+        if call.endswith(','):
+            call = call.rstrip(',').rstrip()
+        # Add device_map before the closing parenthesis
+        return call + ',\n    device_map="auto"'
+    return call
+
+
+# Regex rewrites used by the conversions. Anchors are literals that must all
+# be present (case-insensitively) for the pattern to have any chance of
+# matching; rules whose anchors are missing from a cell are never run.
+# Patterns that would backtrack on large cells also carry an equivalent
+# linear-time ChainMatcher, which is what actually runs.
+REWRITE_RULES = (
+    # Colab Unsloth installation
+    RewriteRule(
+        'colab_install',
+        r'!pip install\s+"?unsloth\[colab-new\].*?"?',
+        COLAB_INSTALL_REPLACEMENT,
+        flags=re.IGNORECASE,
+        anchors=('!pip install', 'unsloth[colab-new]')
+    ),
+    # Standalone %%capture magic
+    RewriteRule('capture_magic', r'%%capture\s*\n', '', anchors=('%%capture',)),
+    # "To run this, press "*Runtime*" and press "*Run all*"..." instructions
+    RewriteRule(
+        'runtime_instructions',
+        r'To run this,\s+press\s+["\'\*]*Runtime["\'\*]*\s+and press\s+["\'\*]*Run all["\'\*]*\s+on.*?(?:Google Colab|Colab).*?(?:instance|notebook)[^\n]*',
+        '',
+        flags=re.IGNORECASE,
+        anchors=('to run this,', 'press', 'runtime', 'run all', 'colab'),
+        matcher=ChainMatcher(
+            r'To run this,\s+press\s+["\'\*]*Runtime["\'\*]*\s+and press\s+["\'\*]*Run all["\'\*]*\s+on',
+            steps=(r'Google Colab|Colab', r'instance|notebook'),
+            tail=r'[^\n]*',
+            flags=re.IGNORECASE
+        )
+    ),
+    RewriteRule(
+        'runtime_press_run_all',
+        r'press\s+["\'\*]*Runtime["\'\*]*.*?["\'\*]*Run all["\'\*]*.*?(?:Google Colab|Colab)',
+        '',
+        flags=re.IGNORECASE,
+        anchors=('press', 'runtime', 'run all', 'colab'),
+        # The optional quotes around "Run all" fall inside the lazy gaps
+        matcher=ChainMatcher(
+            r'press\s+["\'\*]*Runtime',
+            steps=(r'Run all', r'Google Colab|Colab'),
+            flags=re.IGNORECASE
+        )
+    ),
+    # https://colab.research.google.com/github/... -> https://github.com/...
+    RewriteRule(
+        'colab_github_link',
+        r'https://colab\.research\.google\.com/github/([^\s\)]+)',
+        r'https://github.com/\1',
+        anchors=('https://colab.research.google.com/github/',)
+    ),
+    # Google Drive Colab links (can't be converted)
+    RewriteRule(
+        'colab_drive_link',
+        r'\[([^\]]+)\]\(https://colab\.research\.google\.com/drive/[^\)]+\)',
+        r'(additional notebook - see Unsloth documentation)',
+        anchors=('](https://colab.research.google.com/drive/',),
+        # [^\]]+ ends at the first ']', so it is a non-empty gap without ']'
+        matcher=ChainMatcher(
+            r'\[[^\]]',
+            steps=(r'\]\(https://colab\.research\.google\.com/drive/[^\)]+\)',),
+            gap_excludes=']'
+        )
+    ),
+    # Colab badge images (markdown format)
+    RewriteRule(
+        'colab_badge_markdown',
+        r'!\[Open In Colab\]\(https://colab\.research\.google\.com/assets/colab-badge\.svg\)',
+        '',
+        flags=re.IGNORECASE,
+        anchors=('![open in colab](https://colab.research.google.com/assets/colab-badge.svg)',)
+    ),
+    RewriteRule(
+        'colab_badge_linked',
+        r'\[!\[.*?\]\(https://colab\.research\.google\.com/assets/colab-badge\.svg\)\]\([^\)]+\)',
+        '',
+        anchors=('[![', '](https://colab.research.google.com/assets/colab-badge.svg)]('),
+        matcher=ChainMatcher(
+            r'\[!\[',
+            steps=(r'\]\(https://colab\.research\.google\.com/assets/colab-badge\.svg\)\]\([^\)]+\)',)
+        )
+    ),
+    # Colab badge images (HTML format)
+    RewriteRule(
+        'colab_badge_html',
+        r'<a\s+href="[^"]*"\s+target="_parent"><img\s+src="https://colab\.research\.google\.com/assets/colab-badge\.svg"[^>]*></a>',
+        '',
+        flags=re.IGNORECASE,
+        anchors=('<a', 'target="_parent"><img', 'src="https://colab.research.google.com/assets/colab-badge.svg"')
+    ),
+    # "Some other links" section with Colab references
+    RewriteRule(
+        'colab_links_section',
+        r'Some other links:.*?(?:Free Colab|Free notebook).*?(?=\n\n[A-Z]|\Z)',
+        BREV_LINKS_REPLACEMENT,
+        flags=re.DOTALL | re.IGNORECASE,
+        anchors=('some other links:', 'free '),
+        matcher=ChainMatcher(
+            r'Some other links:',
+            steps=(r'Free Colab|Free notebook',),
+            until=r'\n\n[A-Z]',
+            flags=re.IGNORECASE,
+            gap_excludes=''
+        )
+    ),
+    # Google Drive imports and mounts
+    RewriteRule(
+        'drive_import',
+        r'from google\.colab import drive.*?\n',
+        '',
+        anchors=('from google.colab import drive',),
+        matcher=ChainMatcher(r'from google\.colab import drive', steps=(r'\n',))
+    ),
+    RewriteRule(
+        'drive_mount',
+        r'drive\.mount\(.*?\).*?\n',
+        '',
+        anchors=('drive.mount(',),
+        matcher=ChainMatcher(r'drive\.mount\(', steps=(r'\)', r'\n'))
+    ),
+    # Colab paths
+    RewriteRule('content_my_drive', '/content/drive/MyDrive', '/workspace', literal=True),
+    RewriteRule('content_drive', '/content/drive', '/workspace', literal=True),
+    RewriteRule('content_dir', '/content/', '/workspace/', literal=True),
+    # Model loading and training arguments
+    RewriteRule(
+        'from_pretrained_call',
+        r'(FastLanguageModel\.from_pretrained\s*\([^)]+)',
+        _add_device_map,
+        anchors=('FastLanguageModel.from_pretrained',)
+    ),
+    RewriteRule(
+        'output_dir',
+        r'output_dir\s*=\s*["\'][^"\']*["\']',
+        'output_dir="/workspace/outputs"',
+        anchors=('output_dir',)
+    ),
+    RewriteRule(
+        'batch_size',
+        r'per_device_train_batch_size\s*=\s*\d+',
+        anchors=('per_device_train_batch_size',)
+    ),
+    RewriteRule(
+        'generation_call',
+        r'(model\.generate|FastLanguageModel\.generate|trainer\.generate)',
+        anchors=('.generate',)
+    ),
+)
+
+# Companion-file templates, compiled once per adapter
+TEMPLATE_NAMES = (
+    'requirements.txt.jinja2',
+    'setup.sh.jinja2',
+    'docker-compose.yml.jinja2',
+    'README.md.jinja2',
+)
+
+# Rendered companion files kept per adapter before the oldest are dropped
+RENDER_CACHE_SIZE = 1024
+
+# Backends for the Python-level code conversions (model_config and the
+# generation_cache call check)
+CODE_BACKENDS = ('regex', 'cst')
+
+# Calls the generation_cache conversion sets up the torch cache for
+GENERATION_CALLS = ('model.generate', 'FastLanguageModel.generate', 'trainer.generate')
+
 
 class ColabToBrevAdapter(NotebookAdapter):
     """Adapter for converting Colab notebooks to Brev format."""
 
-    def __init__(self, templates_dir: Path):
+    # The libcst backend (--code-backend cst) runs the code conversions too
+    rule_modules = NotebookAdapter.rule_modules + ('cst_backend',)
+
+    def __init__(self, templates_dir: Path, template_cache_dir: Optional[Path] = None):
         """
         Initialize the adapter.
 
         Args:
             templates_dir: Path to Jinja2 templates directory
+            template_cache_dir: Directory for compiled template bytecode, reused
+                across runs and processes until a .jinja2 file changes (None
+                compiles the templates in memory)
         """
         super().__init__()
         self.templates_dir = templates_dir
+        self.rewrites = RewriteEngine(REWRITE_RULES)
+        self.template_cache = (
+            TemplateBytecodeCache(template_cache_dir) if template_cache_dir is not None else None
+        )
         self.jinja_env = Environment(
             loader=FileSystemLoader(str(templates_dir)),
-            trim_blocks=True,
-            lstrip_blocks=True
+            bytecode_cache=self.template_cache,
+            **TEMPLATE_OPTIONS
         )
+        # Hold the compiled templates for the adapter's lifetime so repeated
+        # renders skip the loader's up-to-date check and re-parse
+        self.templates = {
+            name: self.jinja_env.get_template(name) for name in TEMPLATE_NAMES
+        }
+        if self.template_cache is not None:
+            self.stats['templates_loaded'] += self.template_cache.hits
+            self.stats['templates_compiled'] += self.template_cache.compiles
+        # (template name, template variables) -> rendered text
+        self._rendered: Dict[Any, str] = {}
+        self._code_backend = 'regex'
+        self._cst = None
+
+    @property
+    def code_backend(self) -> str:
+        """Backend for the Python-level code conversions: 'regex' or 'cst'."""
+        return self._code_backend
+
+    @code_backend.setter
+    def code_backend(self, backend: str) -> None:
+        """
+        Select the backend for the Python-level code conversions.
+
+        Args:
+            backend: 'regex' (default) or 'cst', which parses each code cell
+                once with libcst (see adapters.cst_backend)
+
+        Raises:
+            ValueError: If the backend is unknown
+            ImportError: If 'cst' is requested and libcst is not installed
+        """
+        if backend not in CODE_BACKENDS:
+            raise ValueError(f"Unknown code backend {backend!r} (expected one of {', '.join(CODE_BACKENDS)})")
+        if backend == 'cst' and self._cst is None:
+            try:
+                from .cst_backend import CstBackend
+            except ImportError as e:
+                raise ImportError(
+                    "The 'cst' code backend requires libcst (pip install 'unsloth-brev-adapter[cst]')"
+                ) from e
+            self._cst = CstBackend()
+        self._code_backend = backend
+        # Cached cells converted by the other backend must not be reused
+        self._rule_version = None
 
     def _register_default_conversions(self):
         """Register all conversion functions."""
-        self.register_conversion('installation', self.convert_installation)
-        self.register_conversion('colab_conditionals', self.clean_colab_conditionals)
-        self.register_conversion('colab_runtime_instructions', self.clean_colab_runtime_instructions)
-        self.register_conversion('colab_links', self.clean_colab_links)
-        self.register_conversion('magic_commands', self.convert_magic_commands)
-        self.register_conversion('gpu_check', self.convert_gpu_check)
-        self.register_conversion('storage', self.convert_storage)
-        self.register_conversion('model_config', self.adapt_model_config)
-        self.register_conversion('generation_cache', self.setup_generation_cache)
+        # Triggers are literals a cell must contain for the conversion to
+        # have any effect; keep them in sync with the conversion bodies.
+        # Code rewrites are scoped to code cells so they never fire on
+        # examples quoted in markdown prose.
+        self.register_conversion(
+            'installation', self.convert_installation,
+            triggers=('colab-new',),
+            cell_types=('code',),
+            config_keys=()
+        )
+        self.register_conversion(
+            'colab_conditionals', self.clean_colab_conditionals,
+            triggers=('%%capture',),
+            cell_types=('code',),
+            terminal=True,
+            config_keys=()
+        )
+        self.register_conversion(
+            'colab_runtime_instructions', self.clean_colab_runtime_instructions,
+            triggers=('runtime',),
+            cell_types=('markdown',),
+            config_keys=()
+        )
+        self.register_conversion(
+            'colab_links', self.clean_colab_links,
+            triggers=('colab.research.google.com', 'some other links:'),
+            cell_types=('code', 'markdown'),
+            config_keys=()
+        )
+        self.register_conversion(
+            'magic_commands', self.convert_magic_commands,
+            triggers=('!', '%pip'),
+            cell_types=('code',),
+            config_keys=()
+        )
+        self.register_conversion(
+            'gpu_check', self.convert_gpu_check,
+            triggers=('gpu_stats', 'torch.cuda'),
+            cell_types=('code',),
+            config_keys=()
+        )
+        self.register_conversion(
+            'storage', self.convert_storage,
+            triggers=('from google.colab import drive', 'drive.mount(', '/content'),
+            cell_types=('code', 'markdown'),
+            config_keys=()
+        )
+        self.register_conversion(
+            'model_config', self.adapt_model_config,
+            triggers=('from_pretrained', 'output_dir', 'per_device_train_batch_size'),
+            cell_types=('code',),
+            config_keys=('recommended_batch_size',)
+        )
+        self.register_conversion(
+            'generation_cache', self.setup_generation_cache,
+            triggers=('.generate',),
+            cell_types=('code',),
+            config_keys=()
+        )
+
+    def _rule_version_parts(self) -> List[str]:
+        """Include the rewrite rule table in the rule version."""
+        parts = []
+        for rule in REWRITE_RULES:
+            repl = rule.repl
+            if callable(repl):
+                repl = inspect.getsource(repl)
+            parts.append(repr((
+                rule.name, rule.pattern, rule.flags, repl, sorted(rule.anchors), rule.literal,
+                repr(rule.matcher)
+            )))
+        parts.append(f'code_backend={self.code_backend}')
+        return parts
 
     def convert_installation(self, code: str, config: Dict[str, Any]) -> str:
         """
@@ -59,22 +378,9 @@ class ColabToBrevAdapter(NotebookAdapter):
         Returns:
             Converted code
         """
-        # Pattern for Colab Unsloth installation
-        colab_pattern = r'!pip install\s+"?unsloth\[colab-new\].*?"?'
-        
-        if re.search(colab_pattern, code, re.IGNORECASE):
+        code, count = self.rewrites.subn('colab_install', code)
+        if count:
             logger.debug("Converting Colab installation to Brev")
-            
-            replacement = '''import subprocess
-import sys
-
-# Install Unsloth with conda variant for Brev
-subprocess.check_call([
-    sys.executable, "-m", "pip", "install",
-    "unsloth[conda] @ git+https://github.com/unslothai/unsloth.git"
-])'''
-            
-            code = re.sub(colab_pattern, replacement, code, flags=re.IGNORECASE)
         
         return code
 
@@ -93,8 +399,9 @@ subprocess.check_call([
         # (Has %%capture and COLAB_ environment check)
         if '%%capture' in code and 'COLAB_' in code:
             logger.debug("Removing Colab conditional installation block")
-            # Replace with environment check + installation using uv
-            return '''# Environment Check for Brev
+            # Replace with environment check + installation using uv; the
+            # generated cell is final, so later conversions skip it
+            return GeneratedSource('''# Environment Check for Brev
 import sys
 import os
 import shutil
@@ -225,12 +532,12 @@ except ImportError:
         print("✅ Unsloth is now available")
     except ImportError as e:
         print(f"❌ Unsloth still not available: {e}")
-        print("⚠️  Please check setup script ran successfully or restart instance")'''
+        print("⚠️  Please check setup script ran successfully or restart instance")''')
         
         # Remove standalone %%capture magic commands (won't work outside IPython)
         if '%%capture' in code:
             logger.debug("Removing standalone %%capture magic command")
-            code = re.sub(r'%%capture\s*\n', '', code)
+            code = self.rewrites.sub('capture_magic', code)
         
         return code
 
@@ -247,15 +554,10 @@ except ImportError:
         """
         # Pattern: "To run this, press "*Runtime*" and press "*Run all*"..."
         # This appears in markdown cells and is Colab-specific
-        colab_run_patterns = [
-            r'To run this,\s+press\s+["\'\*]*Runtime["\'\*]*\s+and press\s+["\'\*]*Run all["\'\*]*\s+on.*?(?:Google Colab|Colab).*?(?:instance|notebook)[^\n]*',
-            r'press\s+["\'\*]*Runtime["\'\*]*.*?["\'\*]*Run all["\'\*]*.*?(?:Google Colab|Colab)',
-        ]
-        
-        for pattern in colab_run_patterns:
-            if re.search(pattern, code, re.IGNORECASE):
+        for rule in ('runtime_instructions', 'runtime_press_run_all'):
+            code, count = self.rewrites.subn(rule, code)
+            if count:
                 logger.debug("Removing Colab runtime instructions")
-                code = re.sub(pattern, '', code, flags=re.IGNORECASE)
         
         return code
 
@@ -271,56 +573,21 @@ except ImportError:
             Cleaned code
         """
         # 1. Replace inline Colab/GitHub links with direct GitHub links
-        # Pattern: https://colab.research.google.com/github/... -> https://github.com/...
-        code = re.sub(
-            r'https://colab\.research\.google\.com/github/([^\s\)]+)',
-            r'https://github.com/\1',
-            code
-        )
-        
         # 2. Remove Google Drive Colab links (can't be converted)
-        # Pattern: https://colab.research.google.com/drive/... -> generic message
-        code = re.sub(
-            r'\[([^\]]+)\]\(https://colab\.research\.google\.com/drive/[^\)]+\)',
-            r'(additional notebook - see Unsloth documentation)',
-            code
-        )
-        
-        # 3. Remove Colab badge images (markdown format)
-        code = re.sub(
-            r'!\[Open In Colab\]\(https://colab\.research\.google\.com/assets/colab-badge\.svg\)',
-            '',
-            code,
-            flags=re.IGNORECASE
-        )
-        code = re.sub(
-            r'\[!\[.*?\]\(https://colab\.research\.google\.com/assets/colab-badge\.svg\)\]\([^\)]+\)',
-            '',
-            code
-        )
-        
-        # 4. Remove Colab badge images (HTML format)
-        code = re.sub(
-            r'<a\s+href="[^"]*"\s+target="_parent"><img\s+src="https://colab\.research\.google\.com/assets/colab-badge\.svg"[^>]*></a>',
-            '',
-            code,
-            flags=re.IGNORECASE
-        )
-        
-        # 2. Pattern for "Some other links" section with Colab references
-        links_pattern = r'Some other links:.*?(?:Free Colab|Free notebook).*?(?=\n\n[A-Z]|\Z)'
+        # 3. Remove Colab badge images (markdown and HTML format)
+        for rule in (
+            'colab_github_link',
+            'colab_drive_link',
+            'colab_badge_markdown',
+            'colab_badge_linked',
+            'colab_badge_html',
+        ):
+            code = self.rewrites.sub(rule, code)
         
-        if re.search(links_pattern, code, re.DOTALL | re.IGNORECASE):
+        # 4. Replace "Some other links" section with Brev-specific links
+        code, count = self.rewrites.subn('colab_links_section', code)
+        if count:
             logger.debug("Removing Colab links section")
-            # Replace with Brev-specific links
-            replacement = '''**Additional Resources:**
-
-- 📚 [Unsloth Documentation](https://docs.unsloth.ai) - Complete guides and examples
-- 💬 [Unsloth Discord](https://discord.gg/unsloth) - Community support
-- 📖 [More Notebooks](https://github.com/unslothai/notebooks) - Full collection on GitHub
-- 🚀 [Brev Documentation](https://docs.nvidia.com/brev) - Deploy and scale on NVIDIA GPUs'''
-            
-            code = re.sub(links_pattern, replacement, code, flags=re.DOTALL | re.IGNORECASE)
         
         return code
 
@@ -468,14 +735,15 @@ print("=" * 60)
         Returns:
             Converted code
         """
-        # Remove Google Drive imports
-        code = re.sub(r'from google\.colab import drive.*?\n', '', code)
-        code = re.sub(r'drive\.mount\(.*?\).*?\n', '', code)
-        
-        # Replace paths
-        code = code.replace('/content/drive/MyDrive', '/workspace')
-        code = code.replace('/content/drive', '/workspace')
-        code = code.replace('/content/', '/workspace/')
+        # Remove Google Drive imports, then replace paths
+        for rule in (
+            'drive_import',
+            'drive_mount',
+            'content_my_drive',
+            'content_drive',
+            'content_dir',
+        ):
+            code = self.rewrites.sub(rule, code)
         
         return code
 
@@ -490,32 +758,29 @@ print("=" * 60)
         Returns:
             Converted code
         """
-        # Look for from_pretrained calls
-        pattern = r'(FastLanguageModel\.from_pretrained\s*\([^)]+)'
-        
-        def add_device_map(match):
-            call = match.group(1)
-            # Check if device_map already present
-            if 'device_map' not in call:
-                # Strip any trailing whitespace and commas before adding device_map
-                call = call.rstrip()
-                if call.endswith(','):
-                    call = call.rstrip(',').rstrip()
-                # Add device_map before the closing parenthesis
-                return call + ',\n    device_map="auto"'
-            return call
-        
-        code = re.sub(pattern, add_device_map, code)
+        if self.code_backend == 'cst':
+            from .cst_backend import model_config_transformers
+            # One parse of the cell for all three rewrites
+            converted = self._cst.transform(
+                code, model_config_transformers(config.get('recommended_batch_size'))
+            )
+            if converted is not None:
+                return converted
+            # Not valid Python even with magics masked (e.g. a %%bash cell)
+            self.stats['cst_fallbacks'] += 1
+
+        # Add device_map to from_pretrained calls
+        code = self.rewrites.sub('from_pretrained_call', code)
         
         # Update output directories
-        code = re.sub(r'output_dir\s*=\s*["\'][^"\']*["\']', 
-                     'output_dir="/workspace/outputs"', code)
+        code = self.rewrites.sub('output_dir', code)
         
         # Adjust batch sizes if specified in config
         if 'recommended_batch_size' in config:
             batch_size = config['recommended_batch_size']
-            code = re.sub(r'per_device_train_batch_size\s*=\s*\d+',
-                         f'per_device_train_batch_size={batch_size}', code)
+            code = self.rewrites.sub(
+                'batch_size', code, f'per_device_train_batch_size={batch_size}'
+            )
         
         return code
 
@@ -531,7 +796,14 @@ print("=" * 60)
             Converted code with cache setup
         """
         # Check if this cell has model.generate() or similar generation calls
-        if not re.search(r'(model\.generate|FastLanguageModel\.generate|trainer\.generate)', code):
+        has_call = None
+        if self.code_backend == 'cst':
+            has_call = self._cst.contains_call(code, GENERATION_CALLS)
+            if has_call is None:
+                self.stats['cst_fallbacks'] += 1
+        if has_call is None:
+            has_call = self.rewrites.search('generation_call', code) is not None
+        if not has_call:
             return code
         
         # Check if cache setup is already present
@@ -590,68 +862,105 @@ print(f"✅ Temp dir: {tmpdir}")
         
         return cache_setup + code
 
+    def render_template(self, name: str, **variables: Any) -> str:
+        """
+        Render a companion-file template, memoized on its exact variables.
+
+        Notebooks of the same launchable pass identical variables, so each
+        distinct rendering is produced once per adapter.
+
+        Args:
+            name: Template file name (one of TEMPLATE_NAMES)
+            **variables: Template variables
+
+        Returns:
+            Rendered text
+        """
+        try:
+            key = (name, tuple(sorted(variables.items())))
+            rendered = self._rendered.get(key)
+        except TypeError:
+            # An unhashable variable (e.g. a list); render without the memo
+            key = rendered = None
+        if rendered is not None:
+            self.stats['template_render_hits'] += 1
+            return rendered
+
+        rendered = self.templates[name].render(**variables)
+        self.stats['template_renders'] += 1
+        if key is not None:
+            if len(self._rendered) >= RENDER_CACHE_SIZE:
+                del self._rendered[next(iter(self._rendered))]
+            self._rendered[key] = rendered
+        return rendered
+
     def _generate_requirements(self, config: Dict[str, Any]) -> str:
         """Generate requirements.txt from template."""
-        template = self.jinja_env.get_template('requirements.txt.jinja2')
-        return template.render(
-            model_name=config.get('model_name', 'Unknown'),
-            timestamp=datetime.now(timezone.utc).isoformat(),
-            categories=config.get('categories', []),
-            has_vision='vision' in config.get('categories', []),
-            has_audio='audio' in config.get('categories', [])
+        record = ModelConfig.from_mapping(config)
+        return self.render_template(
+            'requirements.txt.jinja2',
+            model_name=record.model_name,
+            timestamp=format_build_time(self.build_time),
+            categories=record.categories,
+            has_vision='vision' in record.categories,
+            has_audio='audio' in record.categories
         )
 
     def _generate_setup_script(self, config: Dict[str, Any]) -> str:
         """Generate setup.sh from template."""
-        template = self.jinja_env.get_template('setup.sh.jinja2')
-        return template.render(
-            model_name=config.get('model_name', 'Unknown'),
-            has_vision='vision' in config.get('categories', []),
-            has_audio='audio' in config.get('categories', [])
+        record = ModelConfig.from_mapping(config)
+        return self.render_template(
+            'setup.sh.jinja2',
+            model_name=record.model_name,
+            has_vision='vision' in record.categories,
+            has_audio='audio' in record.categories
         )
 
     def _generate_docker_compose(self, config: Dict[str, Any]) -> str:
         """Generate docker-compose.yml from template."""
-        template = self.jinja_env.get_template('docker-compose.yml.jinja2')
-        return template.render(
-            model_name=config.get('model_name', 'Unknown'),
-            launchable_name=config.get('launchable_name', 'unknown')
+        record = ModelConfig.from_mapping(config)
+        return self.render_template(
+            'docker-compose.yml.jinja2',
+            model_name=record.model_name,
+            launchable_name=record.launchable_name
         )
 
     def _generate_readme(self, config: Dict[str, Any]) -> str:
         """Generate README.md from template."""
-        template = self.jinja_env.get_template('README.md.jinja2')
-        return template.render(
-            model_name=config.get('model_name', 'Unknown'),
-            launchable_name=config.get('launchable_name', 'unknown'),
-            recommended_gpu=config.get('recommended_gpu', 'L4'),
-            min_vram_gb=config.get('min_vram_gb', 16),
-            recommended_batch_size=config.get('recommended_batch_size', 2),
-            categories=config.get('categories', []),
-            difficulty=config.get('difficulty', 'intermediate'),
-            upstream_url=config.get('upstream_notebook_url', '#')
+        record = ModelConfig.from_mapping(config)
+        return self.render_template(
+            'README.md.jinja2',
+            model_name=record.model_name,
+            launchable_name=record.launchable_name,
+            recommended_gpu=record.recommended_gpu,
+            min_vram_gb=record.min_vram_gb,
+            recommended_batch_size=record.recommended_batch_size,
+            categories=record.categories,
+            difficulty=record.difficulty,
+            upstream_url=record.upstream_notebook_url
         )
 
     def _generate_brev_config(self, config: Dict[str, Any]) -> str:
         """Generate .brevconfig.json."""
+        record = ModelConfig.from_mapping(config)
         brev_config = {
-            "name": config.get('model_name', 'Unknown Model'),
-            "description": f"Fine-tune {config.get('model_name')} with Unsloth on NVIDIA GPUs",
+            "name": record.model_name,
+            "description": f"Fine-tune {record.model_name} with Unsloth on NVIDIA GPUs",
             "version": "1.0.0",
             "gpu": {
-                "tier": config.get('recommended_gpu', 'L4'),
-                "min_vram_gb": config.get('min_vram_gb', 16),
-                "multi_gpu": config.get('multi_gpu', False)
+                "tier": record.recommended_gpu,
+                "min_vram_gb": record.min_vram_gb,
+                "multi_gpu": record.multi_gpu
             },
             "ports": [8888],
             "environment": {
                 "JUPYTER_ENABLE_LAB": "yes"
             },
-            "tags": ["unsloth", "fine-tuning"] + config.get('categories', []),
+            "tags": ["unsloth", "fine-tuning"] + list(record.categories),
             "upstream": {
                 "source": "unslothai/notebooks",
-                "notebook_url": config.get('upstream_notebook_url', '#'),
-                "last_synced": datetime.now(timezone.utc).isoformat()
+                "notebook_url": record.upstream_notebook_url,
+                "last_synced": format_build_time(self.build_time)
             }
         }
         return json.dumps(brev_config, indent=2)
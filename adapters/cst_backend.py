@@ -0,0 +1,326 @@
+"""
+CST Backend
+
+Optional libcst backend for the Python-level code conversions. A code cell
+is parsed once into a concrete syntax tree, with IPython magics masked as
+placeholder statements, every code transformer visits that single tree and
+the tree is rendered back to source. Calls and keyword arguments are
+matched structurally, so nested parentheses, multi-line calls and look-alike
+text in strings and comments are handled correctly.
+
+Requires libcst (``pip install 'unsloth-brev-adapter[cst]'``).
+"""
+
+import re
+from typing import Iterable, List, Optional, Sequence, Tuple, Union
+
+import libcst as cst
+
+# A line starting with a shell escape or magic (after indentation), or
+# assigning the output of one (``files = !ls``)
+_MAGIC_LINE = re.compile(r'[ \t]*(?:[!%]|[A-Za-z_][\w.]*[ \t]*=[ \t]*[!%])')
+
+# Placeholder statement for a masked magic line
+_PLACEHOLDER = 'pass  # brev-magic-{}'
+
+# Indentation of an argument added to a multi-line call
+_ARG_INDENT = '    '
+
+
+def mask_magics(code: str) -> Tuple[str, List[str]]:
+    """
+    Replace IPython magic lines with placeholder statements.
+
+    Backslash-continued magic lines are masked together. Placeholders keep
+    the line's indentation, so a magic in an indented block stays valid.
+
+    Args:
+        code: Cell source
+
+    Returns:
+        Tuple of (masked source, original text of each masked line)
+    """
+    lines = code.split('\n')
+    masked = []
+    magics: List[str] = []
+    index = 0
+    while index < len(lines):
+        line = lines[index]
+        if not _MAGIC_LINE.match(line):
+            masked.append(line)
+            index += 1
+            continue
+        end = index
+        while lines[end].endswith('\\') and end + 1 < len(lines):
+            end += 1
+        indent = line[:len(line) - len(line.lstrip())]
+        masked.append(indent + _PLACEHOLDER.format(len(magics)))
+        magics.append('\n'.join(lines[index:end + 1])[len(indent):])
+        index = end + 1
+    return '\n'.join(masked), magics
+
+
+def unmask_magics(code: str, magics: Sequence[str]) -> str:
+    """
+    Restore magic lines masked by mask_magics().
+
+    Args:
+        code: Masked source
+        magics: Original magic lines from mask_magics()
+
+    Returns:
+        Source with the magic lines restored
+    """
+    for index, magic in enumerate(magics):
+        code = code.replace(_PLACEHOLDER.format(index), magic, 1)
+    return code
+
+
+def dotted_name(node: cst.BaseExpression) -> Optional[str]:
+    """
+    Get the dotted name of a Name or Attribute chain.
+
+    Args:
+        node: Expression node
+
+    Returns:
+        Name such as ``FastLanguageModel.from_pretrained``, or None for other expressions
+    """
+    if isinstance(node, cst.Name):
+        return node.value
+    if isinstance(node, cst.Attribute):
+        base = dotted_name(node.value)
+        return None if base is None else f'{base}.{node.attr.value}'
+    return None
+
+
+def _name_matches(name: Optional[str], targets: Iterable[str]) -> bool:
+    """Check whether a dotted name is, or ends with, one of the targets."""
+    if name is None:
+        return False
+    return any(name == target or name.endswith('.' + target) for target in targets)
+
+
+def _tight_equal() -> cst.AssignEqual:
+    """An ``=`` without surrounding spaces, as the regex rewrites produce."""
+    return cst.AssignEqual(
+        whitespace_before=cst.SimpleWhitespace(''),
+        whitespace_after=cst.SimpleWhitespace('')
+    )
+
+
+class AddDeviceMap(cst.CSTTransformer):
+    """Add ``device_map="auto"`` to ``FastLanguageModel.from_pretrained`` calls."""
+
+    def leave_Call(self, original_node: cst.Call, updated_node: cst.Call) -> cst.Call:
+        """Append the keyword to calls that do not already pass one."""
+        if not _name_matches(dotted_name(updated_node.func), ('FastLanguageModel.from_pretrained',)):
+            return updated_node
+        args = list(updated_node.args)
+        # A **kwargs spread may already carry device_map
+        if not args or any(
+            arg.star == '**' or (arg.keyword is not None and arg.keyword.value == 'device_map')
+            for arg in args
+        ):
+            return updated_node
+
+        # Put the new argument on its own line after the last one, keeping
+        # any comment that followed it
+        last = args[-1]
+        trailing = last.comma.whitespace_after if isinstance(last.comma, cst.Comma) else last.whitespace_after_arg
+        if isinstance(trailing, cst.ParenthesizedWhitespace):
+            after_comma = trailing.with_changes(indent=True, last_line=cst.SimpleWhitespace(_ARG_INDENT))
+        else:
+            after_comma = cst.ParenthesizedWhitespace(indent=True, last_line=cst.SimpleWhitespace(_ARG_INDENT))
+        args[-1] = last.with_changes(
+            comma=cst.Comma(whitespace_after=after_comma),
+            whitespace_after_arg=cst.SimpleWhitespace('')
+        )
+        args.append(cst.Arg(
+            keyword=cst.Name('device_map'),
+            equal=_tight_equal(),
+            value=cst.SimpleString('"auto"')
+        ))
+        return updated_node.with_changes(args=args)
+
+
+class SetKeywordValue(cst.CSTTransformer):
+    """
+    Rewrite the value of a setting passed as a keyword or assigned to a name.
+
+    Matches ``name=<value>`` keyword arguments and ``name = <value>`` or
+    ``obj.name = <value>`` assignments whose value is of the given node type.
+    """
+
+    def __init__(self, name: str, value: cst.BaseExpression, value_type: type):
+        """
+        Initialize the transformer.
+
+        Args:
+            name: Keyword or variable name (e.g. 'output_dir')
+            value: Replacement value
+            value_type: Node type the current value must have (e.g. cst.SimpleString)
+        """
+        super().__init__()
+        self.name = name
+        self.value = value
+        self.value_type = value_type
+
+    def _replaceable(self, value: cst.BaseExpression) -> bool:
+        """Check whether a current value is a plain literal of the expected type."""
+        if not isinstance(value, self.value_type):
+            return False
+        # Only plain, non-triple-quoted strings, as the regex rewrites match
+        if isinstance(value, cst.SimpleString):
+            return value.prefix == '' and len(value.quote) == 1
+        return True
+
+    def leave_Arg(self, original_node: cst.Arg, updated_node: cst.Arg) -> cst.Arg:
+        """Rewrite matching keyword arguments."""
+        if (updated_node.keyword is None or updated_node.keyword.value != self.name
+                or not self._replaceable(updated_node.value)):
+            return updated_node
+        return updated_node.with_changes(equal=_tight_equal(), value=self.value)
+
+    def leave_Assign(self, original_node: cst.Assign, updated_node: cst.Assign) -> cst.Assign:
+        """Rewrite matching single-target assignments."""
+        if len(updated_node.targets) != 1 or not self._replaceable(updated_node.value):
+            return updated_node
+        target = updated_node.targets[0]
+        name = dotted_name(target.target)
+        if name is None or name.rsplit('.', 1)[-1] != self.name:
+            return updated_node
+        return updated_node.with_changes(
+            targets=[target.with_changes(
+                whitespace_before_equal=cst.SimpleWhitespace(''),
+                whitespace_after_equal=cst.SimpleWhitespace('')
+            )],
+            value=self.value
+        )
+
+
+class CallFinder(cst.CSTVisitor):
+    """Find calls to any of a set of dotted names."""
+
+    def __init__(self, names: Iterable[str]):
+        """
+        Initialize the finder.
+
+        Args:
+            names: Dotted names; a call matches when its callee is or ends with one
+        """
+        super().__init__()
+        self.names = tuple(names)
+        self.found = False
+
+    def visit_Call(self, node: cst.Call) -> Optional[bool]:
+        """Record a matching call and stop descending once one is found."""
+        if not self.found and _name_matches(dotted_name(node.func), self.names):
+            self.found = True
+        return not self.found
+
+
+class CstBackend:
+    """
+    Parses code cells into libcst trees and runs transformers over them.
+
+    Like RewriteEngine, the backend remembers the last cell it handled, so
+    consecutive code conversions on the same cell text share one parse.
+    """
+
+    def __init__(self):
+        """Initialize the backend with an empty parse cache."""
+        self._last_code: Optional[str] = None
+        self._last_parsed: Optional[Tuple[cst.Module, List[str]]] = None
+
+    def parse(self, code: str) -> Optional[Tuple[cst.Module, List[str]]]:
+        """
+        Parse a cell with its magics masked.
+
+        Args:
+            code: Cell source
+
+        Returns:
+            Tuple of (module, masked magic lines), or None if the cell is not
+            valid Python once masked (e.g. a ``%%bash`` cell)
+        """
+        if code == self._last_code:
+            return self._last_parsed
+
+        parsed = None
+        # A cell that already contains placeholder text cannot be unmasked safely
+        if _PLACEHOLDER.format('') not in code:
+            masked, magics = mask_magics(code)
+            try:
+                parsed = (cst.parse_module(masked), magics)
+            except cst.ParserSyntaxError:
+                parsed = None
+        self._last_code = code
+        self._last_parsed = parsed
+        return parsed
+
+    def transform(self, code: str, transformers: Iterable[cst.CSTTransformer]) -> Optional[str]:
+        """
+        Run transformers over a cell's tree and render the result.
+
+        Args:
+            code: Cell source
+            transformers: Transformers to apply, in order, to the same tree
+
+        Returns:
+            Transformed source (the original object when nothing changed), or
+            None if the cell could not be parsed
+        """
+        parsed = self.parse(code)
+        if parsed is None:
+            return None
+        module, magics = parsed
+        for transformer in transformers:
+            module = module.visit(transformer)
+        converted = unmask_magics(module.code, magics)
+        if converted == code:
+            return code
+
+        # The next conversion sees the converted text; reuse this tree for it
+        self._last_code = converted
+        self._last_parsed = (module, magics)
+        return converted
+
+    def contains_call(self, code: str, names: Iterable[str]) -> Optional[bool]:
+        """
+        Check whether a cell calls any of the given functions.
+
+        Args:
+            code: Cell source
+            names: Dotted callee names (matched on their trailing components)
+
+        Returns:
+            True or False, or None if the cell could not be parsed
+        """
+        parsed = self.parse(code)
+        if parsed is None:
+            return None
+        finder = CallFinder(names)
+        parsed[0].visit(finder)
+        return finder.found
+
+
+def model_config_transformers(batch_size: Optional[Union[int, str]] = None) -> List[cst.CSTTransformer]:
+    """
+    Build the transformers behind the model_config conversion.
+
+    Args:
+        batch_size: Batch size to set for per_device_train_batch_size, if any
+
+    Returns:
+        Transformers adding device_map, redirecting output_dir and setting the batch size
+    """
+    transformers = [
+        AddDeviceMap(),
+        SetKeywordValue('output_dir', cst.SimpleString('"/workspace/outputs"'), cst.SimpleString),
+    ]
+    if batch_size is not None:
+        transformers.append(
+            SetKeywordValue('per_device_train_batch_size', cst.Integer(str(batch_size)), cst.Integer)
+        )
+    return transformers
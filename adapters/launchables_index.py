@@ -0,0 +1,208 @@
+"""
+Launchables Index
+
+Queryable in-memory index over the launchables registry
+(metadata/launchables.json). The registry is loaded once into inverted
+indexes by tag, GPU tier and category plus a sorted VRAM index, so a query
+such as "vision launchables that fit in 24 GB" touches only the launchables
+in its most selective posting list instead of the whole registry.
+"""
+
+import json
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Sequence
+
+# Default location of the registry written by generate_metadata.py
+DEFAULT_REGISTRY_PATH = Path(__file__).parent.parent / 'metadata' / 'launchables.json'
+
+# Tags every launchable carries; they never name its category
+GENERIC_TAGS = frozenset({'unsloth', 'fine-tuning'})
+
+# Category of launchables whose tags are all generic
+OTHER_CATEGORY = 'Other'
+
+_EMPTY: FrozenSet[int] = frozenset()
+
+
+def launchable_category(launchable: Dict[str, Any]) -> str:
+    """
+    Get the category a launchable is listed under.
+
+    Args:
+        launchable: Launchable metadata dictionary
+
+    Returns:
+        Its first non-generic tag, title-cased, or 'Other'
+    """
+    for tag in launchable.get('tags', []):
+        if tag not in GENERIC_TAGS:
+            return tag.title()
+    return OTHER_CATEGORY
+
+
+def launchable_min_vram(launchable: Dict[str, Any]) -> Optional[float]:
+    """
+    Get the GPU memory a launchable needs.
+
+    Args:
+        launchable: Launchable metadata dictionary
+
+    Returns:
+        Its gpu.min_vram_gb, or None if missing or not a number
+    """
+    min_vram = (launchable.get('gpu') or {}).get('min_vram_gb')
+    if isinstance(min_vram, (int, float)) and not isinstance(min_vram, bool):
+        return min_vram
+    return None
+
+
+class LaunchablesIndex:
+    """
+    Launchables with inverted indexes by tag, GPU tier and category.
+
+    Positions refer to the registry order, which query results keep. Tags
+    and tiers match case-insensitively, categories as shown by
+    launchable_category in any case. Launchables without a numeric
+    ``gpu.min_vram_gb`` never match a VRAM bound.
+    """
+
+    def __init__(self, launchables: Sequence[Dict[str, Any]]):
+        """
+        Build the indexes.
+
+        Args:
+            launchables: Launchable metadata dictionaries, in registry order
+        """
+        self.launchables = list(launchables)
+
+        by_tag: Dict[str, set] = {}
+        by_tier: Dict[str, set] = {}
+        by_category: Dict[str, set] = {}
+        self._min_vram = [launchable_min_vram(launchable) for launchable in self.launchables]
+        vram = sorted(
+            (min_vram, position) for position, min_vram in enumerate(self._min_vram)
+            if min_vram is not None
+        )
+        for position, launchable in enumerate(self.launchables):
+            for tag in launchable.get('tags', []):
+                by_tag.setdefault(tag.lower(), set()).add(position)
+            gpu = launchable.get('gpu') or {}
+            tier = gpu.get('tier')
+            if tier:
+                by_tier.setdefault(tier.upper(), set()).add(position)
+            by_category.setdefault(launchable_category(launchable).lower(), set()).add(position)
+
+        self._by_tag = {tag: frozenset(positions) for tag, positions in by_tag.items()}
+        self._by_tier = {tier: frozenset(positions) for tier, positions in by_tier.items()}
+        self._by_category = {category: frozenset(positions) for category, positions in by_category.items()}
+        self._vram_values = [value for value, _ in vram]
+        self._vram_positions = [position for _, position in vram]
+
+    @classmethod
+    def from_registry(cls, registry: Dict[str, Any]) -> 'LaunchablesIndex':
+        """
+        Index a loaded registry.
+
+        Args:
+            registry: Contents of launchables.json
+
+        Returns:
+            LaunchablesIndex over its launchables
+        """
+        return cls(registry.get('launchables', []))
+
+    @classmethod
+    def from_file(cls, registry_path: Path = DEFAULT_REGISTRY_PATH) -> 'LaunchablesIndex':
+        """
+        Load and index a registry file.
+
+        Args:
+            registry_path: Path to launchables.json
+
+        Returns:
+            LaunchablesIndex over its launchables
+        """
+        with open(registry_path, 'r', encoding='utf-8') as f:
+            return cls.from_registry(json.load(f))
+
+    def __len__(self) -> int:
+        return len(self.launchables)
+
+    def tags(self) -> Dict[str, int]:
+        """Get the number of launchables carrying each tag."""
+        return {tag: len(positions) for tag, positions in sorted(self._by_tag.items())}
+
+    def tiers(self) -> Dict[str, int]:
+        """Get the number of launchables recommending each GPU tier."""
+        return {tier: len(positions) for tier, positions in sorted(self._by_tier.items())}
+
+    def categories(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Group the launchables by category.
+
+        Returns:
+            Category name -> its launchables in registry order, by category name
+        """
+        groups: Dict[str, List[Dict[str, Any]]] = {}
+        for launchable in self.launchables:
+            groups.setdefault(launchable_category(launchable), []).append(launchable)
+        return dict(sorted(groups.items()))
+
+    def _vram_range(self, min_vram_gb: Optional[float], max_vram_gb: Optional[float]) -> range:
+        """Get the slice of the VRAM index within the bounds."""
+        start = 0 if min_vram_gb is None else bisect_left(self._vram_values, min_vram_gb)
+        stop = len(self._vram_values) if max_vram_gb is None else bisect_right(self._vram_values, max_vram_gb)
+        return range(start, max(start, stop))
+
+    def query(self, tags: Iterable[str] = (), tier: Optional[str] = None,
+              category: Optional[str] = None, min_vram_gb: Optional[float] = None,
+              max_vram_gb: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Find the launchables matching every given condition.
+
+        The posting lists of the conditions are intersected starting from
+        the smallest, and the VRAM bounds are checked either on those
+        candidates or by walking the matching slice of the VRAM index,
+        whichever is shorter; the cost follows the most selective condition
+        rather than the registry size.
+
+        Args:
+            tags: Tags a launchable must all carry
+            tier: GPU tier it must recommend (e.g. 'L4')
+            category: Category it must be listed under (e.g. 'Vision')
+            min_vram_gb: Lowest gpu.min_vram_gb to include
+            max_vram_gb: Highest gpu.min_vram_gb to include, i.e. launchables
+                that fit on a GPU with this much memory
+
+        Returns:
+            Matching launchables in registry order
+        """
+        postings = [self._by_tag.get(tag.lower(), _EMPTY) for tag in tags]
+        if tier is not None:
+            postings.append(self._by_tier.get(tier.upper(), _EMPTY))
+        if category is not None:
+            postings.append(self._by_category.get(category.lower(), _EMPTY))
+        postings.sort(key=len)
+
+        if min_vram_gb is None and max_vram_gb is None:
+            if not postings:
+                return list(self.launchables)
+            positions = postings[0].intersection(*postings[1:])
+        else:
+            vram_range = self._vram_range(min_vram_gb, max_vram_gb)
+            if postings and len(postings[0]) < len(vram_range):
+                # Intersect the sets, then bound each candidate's VRAM
+                positions = [
+                    position for position in postings[0].intersection(*postings[1:])
+                    if self._min_vram[position] is not None
+                    and (min_vram_gb is None or self._min_vram[position] >= min_vram_gb)
+                    and (max_vram_gb is None or self._min_vram[position] <= max_vram_gb)
+                ]
+            else:
+                positions = [
+                    position for position in (self._vram_positions[i] for i in vram_range)
+                    if all(position in posting for posting in postings)
+                ]
+
+        return [self.launchables[position] for position in sorted(positions)]
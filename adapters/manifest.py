@@ -0,0 +1,237 @@
+"""
+Conversion Manifest
+
+Records the inputs each converted notebook was built from, so unchanged
+notebooks can be skipped on the next run.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_VERSION = 1
+
+# Adapter modules whose changes do not affect conversion output on their own;
+# model_configs is covered by each notebook's config hash instead
+_ADAPTER_VERSION_EXCLUDES = {'model_configs.py'}
+
+
+def file_sha256(path: Path) -> str:
+    """
+    Hash a file's contents.
+
+    Args:
+        path: File to hash
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def config_hash(config: Dict[str, Any]) -> str:
+    """
+    Hash a resolved notebook configuration.
+
+    Args:
+        config: Configuration dictionary
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON form
+    """
+    canonical = json.dumps(dict(config), sort_keys=True, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def template_hashes(templates_dir: Path) -> Dict[str, str]:
+    """
+    Hash every Jinja2 template.
+
+    Args:
+        templates_dir: Path to Jinja2 templates directory
+
+    Returns:
+        Mapping of template filename to hex digest
+    """
+    return {
+        path.name: file_sha256(path)
+        for path in sorted(Path(templates_dir).glob('*.jinja2'))
+    }
+
+
+def adapter_version(extra_files: Iterable[Path] = ()) -> str:
+    """
+    Fingerprint the adapter code that produces converted output.
+
+    Args:
+        extra_files: Additional source files to include (e.g. the converter script)
+
+    Returns:
+        Hex SHA-256 digest over the adapter package sources
+    """
+    from . import __version__
+
+    digest = hashlib.sha256(__version__.encode('utf-8'))
+    package_dir = Path(__file__).parent
+    sources = [
+        path for path in sorted(package_dir.glob('*.py'))
+        if path.name not in _ADAPTER_VERSION_EXCLUDES
+    ]
+    for path in sources + [Path(p) for p in extra_files]:
+        digest.update(path.name.encode('utf-8'))
+        digest.update(file_sha256(path).encode('utf-8'))
+    return digest.hexdigest()
+
+
+class ConversionManifest:
+    """
+    Per-notebook record of conversion inputs, stored as JSON.
+
+    Entries are keyed by the notebook path relative to the source directory
+    and hold the source, config and template hashes plus the adapter version
+    the notebook was converted with.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        templates_dir: Path,
+        extra_files: Iterable[Path] = (),
+        entries: Optional[Dict[str, Dict[str, str]]] = None
+    ):
+        """
+        Initialize the manifest.
+
+        Args:
+            path: Location of the manifest JSON file
+            templates_dir: Path to Jinja2 templates directory
+            extra_files: Extra source files included in the adapter version
+            entries: Existing notebook entries
+        """
+        self.path = Path(path)
+        self.templates = template_hashes(templates_dir)
+        self.templates_hash = hashlib.sha256(
+            json.dumps(self.templates, sort_keys=True).encode('utf-8')
+        ).hexdigest()
+        self.adapter_version = adapter_version(extra_files)
+        self.entries: Dict[str, Dict[str, str]] = entries or {}
+
+    @classmethod
+    def load(
+        cls,
+        path: Path,
+        templates_dir: Path,
+        extra_files: Iterable[Path] = ()
+    ) -> 'ConversionManifest':
+        """
+        Load a manifest, starting empty if it is missing or unreadable.
+
+        Args:
+            path: Location of the manifest JSON file
+            templates_dir: Path to Jinja2 templates directory
+            extra_files: Extra source files included in the adapter version
+
+        Returns:
+            ConversionManifest instance
+        """
+        entries = {}
+        path = Path(path)
+        if path.exists():
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                if data.get('version') == MANIFEST_VERSION:
+                    entries = data.get('notebooks', {})
+                else:
+                    logger.info(f"Ignoring manifest with unsupported version: {path}")
+            except (OSError, ValueError) as e:
+                logger.warning(f"Could not read conversion manifest {path}: {e}")
+        return cls(path, templates_dir, extra_files, entries)
+
+    def fingerprint(
+        self,
+        notebook_path: Path,
+        config: Dict[str, Any],
+        output_dir: Path,
+        code_backend: str = 'regex'
+    ) -> Dict[str, str]:
+        """
+        Describe the inputs a notebook would be converted from.
+
+        Args:
+            notebook_path: Path to the source notebook
+            config: Resolved configuration for the notebook
+            output_dir: Base output directory the notebook is written under
+            code_backend: Backend for the Python-level code conversions
+
+        Returns:
+            Manifest entry for the notebook
+        """
+        return {
+            'source_hash': file_sha256(notebook_path),
+            'config_hash': config_hash(config),
+            'templates_hash': self.templates_hash,
+            'adapter_version': self.adapter_version,
+            'code_backend': code_backend,
+            'output': (Path(output_dir) / config['launchable_name'] / Path(notebook_path).name).as_posix(),
+        }
+
+    def is_up_to_date(self, key: str, fingerprint: Dict[str, str]) -> bool:
+        """
+        Check whether a notebook's recorded inputs match and its output exists.
+
+        Args:
+            key: Notebook key (path relative to the source directory)
+            fingerprint: Current fingerprint from fingerprint()
+
+        Returns:
+            True if the notebook can be skipped
+        """
+        if self.entries.get(key) != fingerprint:
+            return False
+        return Path(fingerprint['output']).exists()
+
+    def record(self, key: str, fingerprint: Dict[str, str]) -> None:
+        """Record a successful conversion."""
+        self.entries[key] = fingerprint
+
+    def forget(self, key: str) -> None:
+        """Drop a notebook so it is converted again next run."""
+        self.entries.pop(key, None)
+
+    def retain(self, keys: Iterable[str]) -> int:
+        """
+        Drop entries for notebooks that no longer exist upstream.
+
+        Args:
+            keys: Keys of every notebook currently in the source directory
+
+        Returns:
+            Number of entries removed
+        """
+        keep = set(keys)
+        stale = [key for key in self.entries if key not in keep]
+        for key in stale:
+            del self.entries[key]
+        return len(stale)
+
+    def save(self) -> None:
+        """Write the manifest to disk."""
+        data = {
+            'version': MANIFEST_VERSION,
+            'adapter_version': self.adapter_version,
+            'templates': self.templates,
+            'notebooks': dict(sorted(self.entries.items())),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+            f.write('\n')
@@ -2,270 +2,156 @@
 Model Configurations
 
 Contains metadata and configuration for each supported model/notebook.
+The registry itself lives in data/model_configs.json and is loaded lazily.
 """
 
+import hashlib
+import json
+import logging
 import re
+import sys
+from bisect import bisect_right
+from collections.abc import Mapping as MappingABC
 from pathlib import Path
-from typing import Dict, Optional
+from types import MappingProxyType
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Shared category tuples, so records with the same categories share one tuple
+_CATEGORY_TUPLES: Dict[Tuple[str, ...], Tuple[str, ...]] = {}
+
+
+def intern_categories(categories: Any) -> Tuple[str, ...]:
+    """
+    Get the shared tuple for a sequence of categories.
+
+    Args:
+        categories: Category names
+
+    Returns:
+        Tuple of interned strings, identical for equal inputs
+    """
+    key = tuple(sys.intern(str(category)) for category in categories)
+    return _CATEGORY_TUPLES.setdefault(key, key)
+
+
+class ModelConfig(MappingABC):
+    """
+    Immutable configuration record for one model/notebook.
+
+    Fields are stored in slots and read as attributes. Defaults live in
+    __init__ and nowhere else. The record is also a read-only Mapping, so
+    conversion functions that take a config dictionary (``config['x']``,
+    ``config.get('x')``, ``dict(config)``) accept it unchanged.
+    """
+
+    __slots__ = (
+        'model_name',
+        'launchable_name',
+        'recommended_gpu',
+        'min_vram_gb',
+        'recommended_batch_size',
+        'categories',
+        'difficulty',
+        'upstream_notebook_url',
+        'multi_gpu',
+    )
+
+    model_name: str
+    launchable_name: str
+    recommended_gpu: str
+    min_vram_gb: int
+    recommended_batch_size: int
+    categories: Tuple[str, ...]
+    difficulty: str
+    upstream_notebook_url: str
+    multi_gpu: bool
+
+    def __init__(
+        self,
+        model_name: str = "Unknown Model",
+        launchable_name: str = "unknown-model",
+        recommended_gpu: str = "L4",
+        min_vram_gb: int = 16,
+        recommended_batch_size: int = 2,
+        categories: Tuple[str, ...] = ("fine-tuning",),
+        difficulty: str = "intermediate",
+        upstream_notebook_url: str = "#",
+        multi_gpu: bool = False
+    ):
+        """
+        Create a record; omitted fields take the defaults for unknown models.
+
+        Args:
+            model_name: Display name (e.g. 'Llama 3.1 (8B)')
+            launchable_name: Output directory / launchable slug
+            recommended_gpu: GPU tier (e.g. 'L4', 'A100-80GB')
+            min_vram_gb: Minimum GPU memory in GB
+            recommended_batch_size: Per-device training batch size
+            categories: Category tags
+            difficulty: 'beginner', 'intermediate' or 'advanced'
+            upstream_notebook_url: URL of the source notebook
+            multi_gpu: Whether the notebook supports multiple GPUs
+        """
+        setattr_ = object.__setattr__
+        setattr_(self, 'model_name', model_name)
+        setattr_(self, 'launchable_name', launchable_name)
+        setattr_(self, 'recommended_gpu', sys.intern(recommended_gpu))
+        setattr_(self, 'min_vram_gb', min_vram_gb)
+        setattr_(self, 'recommended_batch_size', recommended_batch_size)
+        setattr_(self, 'categories', intern_categories(categories))
+        setattr_(self, 'difficulty', sys.intern(difficulty))
+        setattr_(self, 'upstream_notebook_url', upstream_notebook_url)
+        setattr_(self, 'multi_gpu', multi_gpu)
+
+    @classmethod
+    def from_mapping(cls, config: Mapping[str, Any]) -> 'ModelConfig':
+        """
+        Build a record from a configuration dictionary.
+
+        Args:
+            config: Configuration dictionary (or a record, returned as is);
+                missing fields take their defaults, unknown keys are ignored
+
+        Returns:
+            Model config record
+        """
+        if isinstance(config, cls):
+            return config
+        return cls(**{field: config[field] for field in cls.__slots__ if field in config})
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.__slots__)
+
+    def __len__(self) -> int:
+        return len(self.__slots__)
+
+    def __hash__(self) -> int:
+        return hash(tuple(self.values()))
+
+    def __reduce__(self):
+        # Slots with a blocking __setattr__ need explicit pickling (worker processes)
+        return (type(self), tuple(self.values()))
+
+    def __repr__(self) -> str:
+        fields = ', '.join(f'{field}={getattr(self, field)!r}' for field in self.__slots__)
+        return f'{type(self).__name__}({fields})'
 
-# Model configurations registry
-MODEL_CONFIGS: Dict[str, Dict] = {
-    # gpt-oss models
-    "gpt-oss-20b": {
-        "model_name": "gpt-oss-20b",
-        "launchable_name": "gpt-oss-20b-fine-tuning",
-        "recommended_gpu": "A100-40GB",
-        "min_vram_gb": 24,
-        "recommended_batch_size": 2,
-        "categories": ["reasoning", "fine-tuning", "large-model"],
-        "difficulty": "advanced",
-        "upstream_notebook_url": "https://github.com/unslothai/notebooks/blob/main/nb/gpt-oss-20b.ipynb",
-        "multi_gpu": True
-    },
-    "gpt-oss-20b-grpo": {
-        "model_name": "gpt-oss-20b-GRPO",
-        "launchable_name": "gpt-oss-20b-grpo-rl",
-        "recommended_gpu": "A100-80GB",
-        "min_vram_gb": 40,
-        "recommended_batch_size": 1,
-        "categories": ["reasoning", "reinforcement-learning", "grpo"],
-        "difficulty": "advanced",
-        "upstream_notebook_url": "https://github.com/unslothai/notebooks/blob/main/nb/gpt-oss-20b-grpo.ipynb",
-        "multi_gpu": True
-    },
-    "gpt-oss-120b": {
-        "model_name": "gpt-oss-120b",
-        "launchable_name": "gpt-oss-120b-fine-tuning",
-        "recommended_gpu": "A100-80GB",
-        "min_vram_gb": 80,
-        "recommended_batch_size": 1,
-        "categories": ["reasoning", "fine-tuning", "large-model"],
-        "difficulty": "advanced",
-        "upstream_notebook_url": "https://github.com/unslothai/notebooks/blob/main/nb/gpt-oss-120b.ipynb",
-        "multi_gpu": True
-    },
-
-    # Gemma models
-    "gemma-3-4b": {
-        "model_name": "Gemma 3 (4B)",
-        "launchable_name": "gemma-3-4b-fine-tuning",
-        "recommended_gpu": "L4",
-        "min_vram_gb": 16,
-        "recommended_batch_size": 4,
-        "categories": ["text-generation", "fine-tuning"],
-        "difficulty": "beginner",
-        "upstream_notebook_url": "https://github.com/unslothai/notebooks/blob/main/nb/Gemma_3_(4B).ipynb",
-        "multi_gpu": False
-    },
-    "gemma-3-4b-vision": {
-        "model_name": "Gemma 3 (4B) Vision",
-        "launchable_name": "gemma-3-4b-vision",
-        "recommended_gpu": "L4",
-        "min_vram_gb": 20,
-        "recommended_batch_size": 2,
-        "categories": ["vision", "multimodal", "fine-tuning"],
-        "difficulty": "intermediate",
-        "upstream_notebook_url": "https://github.com/unslothai/notebooks/blob/main/nb/Gemma_3_(4B)_vision.ipynb",
-        "multi_gpu": False
-    },
-    "gemma-3-1b-grpo": {
-        "model_name": "Gemma 3 (1B) GRPO",
-        "launchable_name": "gemma-3-1b-grpo-rl",
-        "recommended_gpu": "T4",
-        "min_vram_gb": 12,
-        "recommended_batch_size": 4,
-        "categories": ["reinforcement-learning", "grpo", "reasoning"],
-        "difficulty": "intermediate",
-        "upstream_notebook_url": "https://github.com/unslothai/notebooks/blob/main/nb/Gemma_3_(1B)_grpo.ipynb",
-        "multi_gpu": False
-    },
-    "gemma-3n-e4b": {
-        "model_name": "Gemma 3n (E4B)",
-        "launchable_name": "gemma-3n-e4b-multimodal",
-        "recommended_gpu": "L4",
-        "min_vram_gb": 16,
-        "recommended_batch_size": 2,
-        "categories": ["multimodal", "text", "vision", "audio"],
-        "difficulty": "intermediate",
-        "upstream_notebook_url": "https://github.com/unslothai/notebooks/blob/main/nb/Gemma_3n_(E4B).ipynb",
-        "multi_gpu": False
-    },
-
-    # Llama models
-    "llama-3.1-8b": {
-        "model_name": "Llama 3.1 (8B)",
-        "launchable_name": "llama-3.1-8b-fine-tuning",
-        "recommended_gpu": "L4",
-        "min_vram_gb": 16,
-        "recommended_batch_size": 4,
-        "categories": ["text-generation", "fine-tuning"],
-        "difficulty": "beginner",
-        "upstream_notebook_url": "https://github.com/unslothai/notebooks/blob/main/nb/Llama_3.1_(8B).ipynb",
-        "multi_gpu": False
-    },
-    "llama-3.2-1b": {
-        "model_name": "Llama 3.2 (1B)",
-        "launchable_name": "llama-3.2-1b-fine-tuning",
-        "recommended_gpu": "T4",
-        "min_vram_gb": 8,
-        "recommended_batch_size": 8,
-        "categories": ["text-generation", "fine-tuning", "small-model"],
-        "difficulty": "beginner",
-        "upstream_notebook_url": "https://github.com/unslothai/notebooks/blob/main/nb/Llama_3.2_(1B).ipynb",
-        "multi_gpu": False
-    },
-    "llama-3.2-3b": {
-        "model_name": "Llama 3.2 (3B)",
-        "launchable_name": "llama-3.2-3b-fine-tuning",
-        "recommended_gpu": "T4",
-        "min_vram_gb": 12,
-        "recommended_batch_size": 4,
-        "categories": ["text-generation", "fine-tuning"],
-        "difficulty": "beginner",
-        "upstream_notebook_url": "https://github.com/unslothai/notebooks/blob/main/nb/Llama_3.2_(3B).ipynb",
-        "multi_gpu": False
-    },
-    "llama-3.2-3b-grpo": {
-        "model_name": "Llama 3.2 (3B) GRPO",
-        "launchable_name": "llama-3.2-3b-grpo-rl",
-        "recommended_gpu": "L4",
-        "min_vram_gb": 16,
-        "recommended_batch_size": 2,
-        "categories": ["reinforcement-learning", "grpo", "reasoning"],
-        "difficulty": "intermediate",
-        "upstream_notebook_url": "https://github.com/unslothai/notebooks/blob/main/nb/Llama_3.2_(3B)_grpo.ipynb",
-        "multi_gpu": False
-    },
-    "llama-3.2-vision-11b": {
-        "model_name": "Llama 3.2 Vision (11B)",
-        "launchable_name": "llama-3.2-vision-11b",
-        "recommended_gpu": "A100-40GB",
-        "min_vram_gb": 24,
-        "recommended_batch_size": 2,
-        "categories": ["vision", "multimodal", "fine-tuning"],
-        "difficulty": "intermediate",
-        "upstream_notebook_url": "https://github.com/unslothai/notebooks/blob/main/nb/Llama_3.2_Vision_(11B).ipynb",
-        "multi_gpu": False
-    },
-
-    # Qwen models
-    "qwen3-14b": {
-        "model_name": "Qwen3 (14B)",
-        "launchable_name": "qwen3-14b-fine-tuning",
-        "recommended_gpu": "A100-40GB",
-        "min_vram_gb": 24,
-        "recommended_batch_size": 2,
-        "categories": ["text-generation", "fine-tuning"],
-        "difficulty": "intermediate",
-        "upstream_notebook_url": "https://github.com/unslothai/notebooks/blob/main/nb/Qwen3_(14B).ipynb",
-        "multi_gpu": False
-    },
-    "qwen3-4b-grpo": {
-        "model_name": "Qwen3 (4B) GRPO",
-        "launchable_name": "qwen3-4b-grpo-rl",
-        "recommended_gpu": "L4",
-        "min_vram_gb": 16,
-        "recommended_batch_size": 2,
-        "categories": ["reinforcement-learning", "grpo", "reasoning"],
-        "difficulty": "intermediate",
-        "upstream_notebook_url": "https://github.com/unslothai/notebooks/blob/main/nb/Qwen3_(4B)_grpo.ipynb",
-        "multi_gpu": False
-    },
-    "qwen3-vl-8b": {
-        "model_name": "Qwen3-VL (8B)",
-        "launchable_name": "qwen3-vl-8b-vision",
-        "recommended_gpu": "A100-40GB",
-        "min_vram_gb": 24,
-        "recommended_batch_size": 2,
-        "categories": ["vision", "multimodal", "fine-tuning"],
-        "difficulty": "intermediate",
-        "upstream_notebook_url": "https://github.com/unslothai/notebooks/blob/main/nb/Qwen3-VL_(8B).ipynb",
-        "multi_gpu": False
-    },
-    "qwen3-vl-8b-grpo": {
-        "model_name": "Qwen3-VL (8B) GRPO",
-        "launchable_name": "qwen3-vl-8b-grpo-vision-rl",
-        "recommended_gpu": "A100-40GB",
-        "min_vram_gb": 32,
-        "recommended_batch_size": 1,
-        "categories": ["vision", "reinforcement-learning", "grpo"],
-        "difficulty": "advanced",
-        "upstream_notebook_url": "https://github.com/unslothai/notebooks/blob/main/nb/Qwen3-VL_(8B)_grpo.ipynb",
-        "multi_gpu": False
-    },
-
-    # Phi models
-    "phi-4-14b": {
-        "model_name": "Phi-4 (14B)",
-        "launchable_name": "phi-4-14b-fine-tuning",
-        "recommended_gpu": "A100-40GB",
-        "min_vram_gb": 24,
-        "recommended_batch_size": 2,
-        "categories": ["text-generation", "fine-tuning", "reasoning"],
-        "difficulty": "intermediate",
-        "upstream_notebook_url": "https://github.com/unslothai/notebooks/blob/main/nb/Phi-4_(14B).ipynb",
-        "multi_gpu": False
-    },
-    "phi-4-14b-grpo": {
-        "model_name": "Phi-4 (14B) GRPO",
-        "launchable_name": "phi-4-14b-grpo-rl",
-        "recommended_gpu": "A100-40GB",
-        "min_vram_gb": 32,
-        "recommended_batch_size": 1,
-        "categories": ["reinforcement-learning", "grpo", "reasoning"],
-        "difficulty": "advanced",
-        "upstream_notebook_url": "https://github.com/unslothai/notebooks/blob/main/nb/Phi-4_(14B)_grpo.ipynb",
-        "multi_gpu": False
-    },
-
-    # Audio models
-    "whisper-large-v3": {
-        "model_name": "Whisper Large V3",
-        "launchable_name": "whisper-large-v3-stt",
-        "recommended_gpu": "L4",
-        "min_vram_gb": 16,
-        "recommended_batch_size": 4,
-        "categories": ["audio", "speech-to-text", "fine-tuning"],
-        "difficulty": "intermediate",
-        "upstream_notebook_url": "https://github.com/unslothai/notebooks/blob/main/nb/Whisper_Large_V3.ipynb",
-        "multi_gpu": False
-    },
-    "sesame-csm-1b": {
-        "model_name": "Sesame-CSM (1B)",
-        "launchable_name": "sesame-csm-1b-tts",
-        "recommended_gpu": "T4",
-        "min_vram_gb": 12,
-        "recommended_batch_size": 4,
-        "categories": ["audio", "text-to-speech", "fine-tuning"],
-        "difficulty": "intermediate",
-        "upstream_notebook_url": "https://github.com/unslothai/notebooks/blob/main/nb/Sesame-CSM_(1B).ipynb",
-        "multi_gpu": False
-    },
-    "orpheus-tts-3b": {
-        "model_name": "Orpheus-TTS (3B)",
-        "launchable_name": "orpheus-tts-3b",
-        "recommended_gpu": "L4",
-        "min_vram_gb": 16,
-        "recommended_batch_size": 2,
-        "categories": ["audio", "text-to-speech", "fine-tuning"],
-        "difficulty": "intermediate",
-        "upstream_notebook_url": "https://github.com/unslothai/notebooks/blob/main/nb/Orpheus-TTS_(3B).ipynb",
-        "multi_gpu": False
-    },
-}
 
 # Default configuration for unknown models
-DEFAULT_CONFIG = {
-    "model_name": "Unknown Model",
-    "launchable_name": "unknown-model",
-    "recommended_gpu": "L4",
-    "min_vram_gb": 16,
-    "recommended_batch_size": 2,
-    "categories": ["fine-tuning"],
-    "difficulty": "intermediate",
-    "upstream_notebook_url": "#",
-    "multi_gpu": False
-}
+DEFAULT_CONFIG = ModelConfig()
 
 
 def create_unique_default_config(notebook_name: str) -> Dict:
@@ -300,33 +186,30 @@ def create_unique_default_config(notebook_name: str) -> Dict:
         if slug.endswith(suffix):
             slug = slug[:-len(suffix)]
     
-    return {
-        "model_name": model_name,
-        "launchable_name": slug,
-        "recommended_gpu": "L4",
-        "min_vram_gb": 16,
-        "recommended_batch_size": 2,
-        "categories": ["fine-tuning"],
-        "difficulty": "intermediate",
-        "upstream_notebook_url": f"https://github.com/unslothai/notebooks/blob/main/nb/{stem}.ipynb",
-        "multi_gpu": False
-    }
+    return dict(ModelConfig(
+        model_name=model_name,
+        launchable_name=slug,
+        upstream_notebook_url=f"https://github.com/unslothai/notebooks/blob/main/nb/{stem}.ipynb"
+    ))
 
 
-def get_config_for_notebook(notebook_name: str) -> Dict:
+# Suffixes stripped from normalized notebook names before matching
+NOTEBOOK_NAME_SUFFIXES = ('-alpaca', '-conversational', '-inference', '-a100', '-grpo', '-vision')
+
+# Shortest fuzzy match accepted between a notebook name and a config key
+MIN_MATCH_LENGTH = 5
+
+
+def normalize_notebook_name(notebook_name: str) -> str:
     """
-    Get configuration for a notebook by matching its name.
-    
-    Handles various naming patterns:
-    - Gemma3_(4B).ipynb → gemma-3-4b
-    - Llama3_1_(8B)-Alpaca.ipynb → llama-3.1-8b
-    - Qwen2_5_(7B)-Alpaca.ipynb → qwen-2.5-7b
+    Normalize a notebook name for matching against config keys.
 
     Args:
         notebook_name: Name or path of the notebook
 
     Returns:
-        Configuration dictionary
+        Lower-case name without parentheses, with dashes for underscores and
+        one common suffix removed
     """
     # Extract just the filename stem
     stem = Path(notebook_name).stem.lower()
@@ -337,38 +220,332 @@ def get_config_for_notebook(notebook_name: str) -> Dict:
     clean_name = re.sub(r'-+', '-', clean_name) # Multiple dashes to single
     
     # Remove common suffixes
-    for suffix in ['-alpaca', '-conversational', '-inference', '-a100', '-grpo', '-vision']:
+    for suffix in NOTEBOOK_NAME_SUFFIXES:
         if clean_name.endswith(suffix):
             clean_name = clean_name[:-len(suffix)]
             break
+    return clean_name
+
+
+class ConfigResolver:
+    """
+    Resolves notebook names to model configurations.
+
+    The config keys are indexed once: an exact name is a dict lookup, keys
+    contained in a name are found through an index of their leading
+    ``min_match_length`` characters (one lookup per position in the name),
+    and a key containing the whole name is found with one search of all the
+    keys joined into a single string. Ranking matches a linear scan over all keys: the longest
+    overlap wins, ties go to the key registered first.
+
+    Results are memoized per notebook stem and returned as ModelConfig
+    records shared between callers; use ``dict(config)`` for a mutable copy.
+    The index can be saved with to_index() and restored with from_index().
+    """
+
+    def __init__(
+        self,
+        configs: Mapping[str, Mapping[str, Any]],
+        min_match_length: int = MIN_MATCH_LENGTH
+    ):
+        """
+        Build the index.
+
+        Args:
+            configs: Config records or dictionaries keyed by normalized model name (snapshotted)
+            min_match_length: Shortest fuzzy match accepted
+        """
+        self.min_match_length = min_match_length
+        self._configs: Dict[str, ModelConfig] = {
+            key: ModelConfig.from_mapping(config) for key, config in configs.items()
+        }
+        self._order = {key: index for index, key in enumerate(self._configs)}
+        # Leading characters of each key long enough to count -> keys, in order
+        self._by_prefix: Dict[str, List[str]] = {}
+        for key in self._configs:
+            if len(key) >= min_match_length:
+                self._by_prefix.setdefault(key[:min_match_length], []).append(key)
+        self._build_key_search()
+        self._resolved: Dict[str, ModelConfig] = {}
+
+    def _build_key_search(self) -> None:
+        """Join the keys, in order, for finding the first key containing a name."""
+        keys = list(self._configs)
+        self._joined_keys = '\n'.join(keys)
+        self._key_starts: List[int] = []
+        offset = 0
+        for key in keys:
+            self._key_starts.append(offset)
+            offset += len(key) + 1
+        self._keys = keys
+
+    def _first_key_containing(self, clean_name: str) -> Optional[str]:
+        """Get the first registered key containing a name, if any."""
+        if '\n' in clean_name:
+            return None
+        position = self._joined_keys.find(clean_name)
+        if position < 0:
+            return None
+        return self._keys[bisect_right(self._key_starts, position) - 1]
+
+    @property
+    def configs(self) -> Mapping[str, ModelConfig]:
+        """Read-only view of the indexed config records, in registration order."""
+        return MappingProxyType(self._configs)
+
+    def to_index(self) -> Dict[str, Any]:
+        """
+        Serialize the records and lookup tables to a JSON-compatible dict.
+
+        Keys are stored once; the tables refer to them by position. The
+        stems of the upstream notebooks are resolved up front, so lookups
+        for known notebooks skip matching after from_index().
+
+        Returns:
+            Index data for from_index()
+        """
+        keys = list(self._configs)
+        stems = {}
+        for key, config in self._configs.items():
+            # Resolved exactly as resolve() would for this file name
+            notebook_name = Path(config.upstream_notebook_url).name
+            match = self.match(normalize_notebook_name(notebook_name))
+            if match is not None:
+                stems[Path(notebook_name).stem] = self._order[match]
+        return {
+            'min_match_length': self.min_match_length,
+            'fields': list(ModelConfig.__slots__),
+            'keys': keys,
+            'records': [list(config.values()) for config in self._configs.values()],
+            'stems': stems,
+            'prefixes': {
+                prefix: [self._order[key] for key in prefix_keys]
+                for prefix, prefix_keys in self._by_prefix.items()
+            },
+        }
+
+    @classmethod
+    def from_index(cls, index: Mapping[str, Any]) -> 'ConfigResolver':
+        """
+        Restore a resolver from to_index() data without rebuilding the tables.
+
+        Args:
+            index: Index data
+
+        Returns:
+            Config resolver
+
+        Raises:
+            ValueError: If the records were saved with different ModelConfig fields
+        """
+        if list(index['fields']) != list(ModelConfig.__slots__):
+            raise ValueError(f"Index has fields {index['fields']}, expected {list(ModelConfig.__slots__)}")
+        resolver = cls.__new__(cls)
+        keys = index['keys']
+        resolver.min_match_length = index['min_match_length']
+        resolver._configs = {key: ModelConfig(*values) for key, values in zip(keys, index['records'])}
+        resolver._order = {key: position for position, key in enumerate(keys)}
+        resolver._by_prefix = {
+            prefix: [keys[position] for position in positions]
+            for prefix, positions in index['prefixes'].items()
+        }
+        resolver._build_key_search()
+        resolver._resolved = {
+            stem: resolver._configs[keys[position]] for stem, position in index['stems'].items()
+        }
+        return resolver
+
+    def match(self, clean_name: str) -> Optional[str]:
+        """
+        Find the config key for a normalized notebook name.
+
+        Args:
+            clean_name: Name from normalize_notebook_name()
+
+        Returns:
+            Best matching config key, or None if no key overlaps enough
+        """
+        if clean_name in self._configs:
+            return clean_name
+
+        best_key = None
+        best_score = 0
+        # Longest config key contained in the name
+        width = self.min_match_length
+        for start in range(len(clean_name) - width + 1):
+            for key in self._by_prefix.get(clean_name[start:start + width], ()):
+                if not clean_name.startswith(key, start):
+                    continue
+                if len(key) > best_score or (
+                    len(key) == best_score and self._order[key] < self._order[best_key]
+                ):
+                    best_key = key
+                    best_score = len(key)
+
+        # Config key containing the whole name
+        if len(clean_name) > best_score and len(clean_name) >= self.min_match_length:
+            containing = self._first_key_containing(clean_name)
+            if containing is not None:
+                best_key = containing
+        return best_key
+
+    def resolve(self, notebook_name: str) -> ModelConfig:
+        """
+        Get the configuration for a notebook.
+
+        Args:
+            notebook_name: Name or path of the notebook
+
+        Returns:
+            Model config record
+        """
+        stem = Path(notebook_name).stem
+        config = self._resolved.get(stem)
+        if config is None:
+            key = self.match(normalize_notebook_name(notebook_name))
+            if key is not None:
+                config = self._configs[key]
+            else:
+                # No good match found - create unique config from filename
+                config = ModelConfig.from_mapping(create_unique_default_config(notebook_name))
+            self._resolved[stem] = config
+        return config
+
+
+# Registry source, edited by hand; new models are added here
+REGISTRY_PATH = Path(__file__).parent / 'data' / 'model_configs.json'
+
+# Pre-built index of the registry (scripts/build_config_index.py)
+REGISTRY_INDEX_PATH = Path(__file__).parent / 'data' / 'model_configs.index.json'
+
+# Bump when the layout of ConfigResolver.to_index() changes
+REGISTRY_INDEX_FORMAT = 2
+
+
+def build_registry_index(
+    source_path: Path = REGISTRY_PATH,
+    min_match_length: int = MIN_MATCH_LENGTH
+) -> Dict[str, Any]:
+    """
+    Build the pre-indexed form of a registry file.
+
+    Args:
+        source_path: Registry JSON (config dictionaries keyed by model name)
+        min_match_length: Shortest fuzzy match accepted
+
+    Returns:
+        Index data, tagged with its format and a hash of the source
+    """
+    source = Path(source_path).read_bytes()
+    resolver = ConfigResolver(json.loads(source), min_match_length)
+    return {
+        'format': REGISTRY_INDEX_FORMAT,
+        'source_sha256': hashlib.sha256(source).hexdigest(),
+        **resolver.to_index(),
+    }
+
+
+def load_registry(
+    source_path: Path = REGISTRY_PATH,
+    index_path: Optional[Path] = REGISTRY_INDEX_PATH
+) -> ConfigResolver:
+    """
+    Load a registry, from its pre-built index when that is up to date.
+
+    Args:
+        source_path: Registry JSON
+        index_path: Pre-built index (None to always index the source)
+
+    Returns:
+        Config resolver over the registry
+
+    Raises:
+        FileNotFoundError: If the registry file does not exist
+    """
+    source = Path(source_path).read_bytes()
+    if index_path is not None and Path(index_path).exists():
+        try:
+            index = json.loads(Path(index_path).read_bytes())
+            if (index.get('format') == REGISTRY_INDEX_FORMAT
+                    and index.get('source_sha256') == hashlib.sha256(source).hexdigest()
+                    and index.get('min_match_length') == MIN_MATCH_LENGTH):
+                return ConfigResolver.from_index(index)
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring unreadable registry index {index_path}: {e}")
+    logger.debug(f"Registry index for {source_path} is missing or stale; indexing the source")
+    return ConfigResolver(json.loads(source))
+
+
+class ModelRegistry(MappingABC):
+    """
+    Read-only mapping of model name to ModelConfig, loaded on first access.
+
+    Importing the package does not read the registry file; the first lookup
+    loads it (see load_registry()) together with the resolver used by
+    get_config_for_notebook().
+    """
+
+    def __init__(self, source_path: Path = REGISTRY_PATH, index_path: Optional[Path] = REGISTRY_INDEX_PATH):
+        """
+        Initialize the registry without loading it.
+
+        Args:
+            source_path: Registry JSON
+            index_path: Pre-built index (None to always index the source)
+        """
+        self.source_path = Path(source_path)
+        self.index_path = index_path
+        self._resolver: Optional[ConfigResolver] = None
+
+    @property
+    def resolver(self) -> ConfigResolver:
+        """Resolver over the registry, loading it on first use."""
+        if self._resolver is None:
+            self._resolver = load_registry(self.source_path, self.index_path)
+        return self._resolver
+
+    def __getitem__(self, key: str) -> ModelConfig:
+        return self.resolver.configs[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.resolver.configs)
+
+    def __len__(self) -> int:
+        return len(self.resolver.configs)
+
+    def __repr__(self) -> str:
+        state = 'loaded' if self._resolver is not None else 'not loaded'
+        return f'{type(self).__name__}({str(self.source_path)!r}, {state})'
+
+
+# Model configurations registry
+MODEL_CONFIGS = ModelRegistry()
+
+
+def get_config_resolver() -> ConfigResolver:
+    """
+    Get the shared resolver over MODEL_CONFIGS, loading the registry on first use.
+
+    Returns:
+        Config resolver
+    """
+    return MODEL_CONFIGS.resolver
+
+
+def get_config_for_notebook(notebook_name: str) -> ModelConfig:
+    """
+    Get configuration for a notebook by matching its name.
     
-    # Try exact match first
-    if clean_name in MODEL_CONFIGS:
-        return MODEL_CONFIGS[clean_name].copy()
-    
-    # Try fuzzy matching with scoring
-    best_match = None
-    best_score = 0
-    
-    for config_key in MODEL_CONFIGS.keys():
-        # Calculate similarity score
-        if config_key in clean_name:
-            # Config key is substring of cleaned name
-            score = len(config_key)
-            if score > best_score:
-                best_score = score
-                best_match = config_key
-        elif clean_name in config_key:
-            # Cleaned name is substring of config key
-            score = len(clean_name)
-            if score > best_score:
-                best_score = score
-                best_match = config_key
-    
-    # Only use match if it's reasonably good (at least 5 characters)
-    if best_match and best_score >= 5:
-        return MODEL_CONFIGS[best_match].copy()
-    
-    # No good match found - create unique config from filename
-    return create_unique_default_config(notebook_name)
+    Handles various naming patterns:
+    - Gemma3_(4B).ipynb → gemma-3-4b
+    - Llama3_1_(8B)-Alpaca.ipynb → llama-3.1-8b
+    - Qwen2_5_(7B)-Alpaca.ipynb → qwen-2.5-7b
+
+    Args:
+        notebook_name: Name or path of the notebook
 
+    Returns:
+        Immutable model config record, shared between calls (use
+        ``dict(config)`` for a mutable copy)
+    """
+    return get_config_resolver().resolve(notebook_name)
@@ -0,0 +1,238 @@
+"""
+Notebook I/O
+
+Reading and writing notebooks, with an opt-in fast path that works on plain
+dicts instead of validated NotebookNode objects.
+
+The fast path parses the raw JSON (with orjson when it is installed),
+rejoins the multi-line fields nbformat would rejoin and writes the same bytes
+``nbformat.write`` produces, but skips the per-notebook jsonschema validation.
+Validation can instead be run once over the written files with
+``validate_notebooks()``.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Tuple, Union
+
+import nbformat
+
+from .output_writer import write_if_changed
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+# Notebook major version the fast path understands; anything else is read
+# with nbformat so it can be converted
+FAST_PATH_NBFORMAT = 4
+
+# Metadata nbformat strips on read and write (see nbformat.v4.rwbase.strip_transient)
+_TRANSIENT_NOTEBOOK_METADATA = ('orig_nbformat', 'orig_nbformat_minor', 'signature')
+_TRANSIENT_CELL_METADATA = ('trusted',)
+
+# Non-text mimetypes nbformat splits into lines when writing
+_NON_TEXT_SPLIT_MIMES = {'application/javascript', 'image/svg+xml'}
+
+Notebook = Union[nbformat.NotebookNode, Dict[str, Any]]
+
+
+def _is_json_mime(mime: str) -> bool:
+    """Check whether a mimetype holds JSON data that is never split or rejoined."""
+    return mime == 'application/json' or (mime.startswith('application/') and mime.endswith('+json'))
+
+
+def _rejoin_mimebundle(data: Dict[str, Any]) -> None:
+    """Join multi-line string fields of a mimebundle in place."""
+    for key, value in data.items():
+        if (
+            isinstance(value, list)
+            and not _is_json_mime(key)
+            and all(isinstance(line, str) for line in value)
+        ):
+            data[key] = ''.join(value)
+
+
+def _split_mimebundle(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of a mimebundle with text fields split into lines."""
+    return {
+        key: value.splitlines(True)
+        if isinstance(value, str) and (key.startswith('text/') or key in _NON_TEXT_SPLIT_MIMES)
+        else value
+        for key, value in data.items()
+    }
+
+
+def _parse_json(raw: bytes) -> Dict[str, Any]:
+    """Parse notebook JSON, preferring orjson when available."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def read_notebook(path: Path, fast: bool = False) -> Notebook:
+    """
+    Read a notebook.
+
+    Args:
+        path: Path to the notebook
+        fast: Parse into plain dicts without schema validation
+
+    Returns:
+        NotebookNode, or a plain dict when fast is True and the notebook is nbformat 4
+    """
+    if not fast:
+        with open(path, 'r', encoding='utf-8') as f:
+            return nbformat.read(f, as_version=4)
+
+    with open(path, 'rb') as f:
+        raw = f.read()
+    notebook = _parse_json(raw)
+    if not isinstance(notebook, dict) or notebook.get('nbformat') != FAST_PATH_NBFORMAT:
+        # Older formats need nbformat's upgrade path
+        logger.debug(f"Falling back to nbformat for {path}")
+        return nbformat.reads(raw.decode('utf-8'), as_version=4)
+
+    metadata = notebook.setdefault('metadata', {})
+    for key in _TRANSIENT_NOTEBOOK_METADATA:
+        metadata.pop(key, None)
+
+    for cell in notebook.setdefault('cells', []):
+        source = cell.get('source')
+        if isinstance(source, list):
+            cell['source'] = ''.join(source)
+        for key in _TRANSIENT_CELL_METADATA:
+            cell.get('metadata', {}).pop(key, None)
+        for attachment in cell.get('attachments', {}).values():
+            _rejoin_mimebundle(attachment)
+        if cell.get('cell_type') == 'code':
+            for output in cell.get('outputs', []):
+                output_type = output.get('output_type', '')
+                if output_type in ('execute_result', 'display_data'):
+                    _rejoin_mimebundle(output.get('data', {}))
+                elif output_type and isinstance(output.get('text', ''), list):
+                    output['text'] = ''.join(output['text'])
+    return notebook
+
+
+def _split_cell(cell: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a copy of a cell in on-disk form (multi-line fields split)."""
+    cell = dict(cell)
+    source = cell.get('source')
+    if isinstance(source, str):
+        cell['source'] = source.splitlines(True)
+    if 'metadata' in cell and any(key in cell['metadata'] for key in _TRANSIENT_CELL_METADATA):
+        cell['metadata'] = {
+            key: value for key, value in cell['metadata'].items()
+            if key not in _TRANSIENT_CELL_METADATA
+        }
+    if cell.get('attachments'):
+        cell['attachments'] = {
+            name: _split_mimebundle(bundle) for name, bundle in cell['attachments'].items()
+        }
+    if cell.get('cell_type') == 'code' and cell.get('outputs'):
+        outputs = []
+        for output in cell['outputs']:
+            output = dict(output)
+            if output.get('output_type') in ('execute_result', 'display_data'):
+                output['data'] = _split_mimebundle(output.get('data', {}))
+            elif output.get('output_type') == 'stream' and isinstance(output.get('text'), str):
+                output['text'] = output['text'].splitlines(True)
+            outputs.append(output)
+        cell['outputs'] = outputs
+    return cell
+
+
+def _bytes_default(obj: Any) -> str:
+    """Encode base64 bytes the way nbformat's BytesEncoder does."""
+    if isinstance(obj, bytes):
+        return obj.decode('ascii')
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def notebook_to_json(notebook: Notebook) -> str:
+    """
+    Serialize a notebook exactly as ``nbformat.write`` would, without validation.
+
+    The notebook is not modified.
+
+    Args:
+        notebook: Notebook as a NotebookNode or plain dict
+
+    Returns:
+        Notebook JSON, ending with a newline
+    """
+    on_disk = dict(notebook)
+    on_disk['metadata'] = {
+        key: value for key, value in notebook.get('metadata', {}).items()
+        if key not in _TRANSIENT_NOTEBOOK_METADATA
+    }
+    on_disk['cells'] = [_split_cell(cell) for cell in notebook.get('cells', [])]
+    text = json.dumps(
+        on_disk,
+        indent=1,
+        sort_keys=True,
+        separators=(',', ': '),
+        ensure_ascii=False,
+        default=_bytes_default
+    )
+    return text if text.endswith('\n') else text + '\n'
+
+
+def serialize_notebook(notebook: Notebook, fast: bool = False) -> str:
+    """
+    Serialize a notebook to the text ``nbformat.write`` writes.
+
+    Args:
+        notebook: Notebook to serialize
+        fast: Serialize directly without schema validation
+
+    Returns:
+        Notebook JSON, ending with a newline
+    """
+    if fast:
+        return notebook_to_json(notebook)
+    text = nbformat.writes(notebook)
+    return text if text.endswith('\n') else text + '\n'
+
+
+def write_notebook(notebook: Notebook, path: Path, fast: bool = False) -> bool:
+    """
+    Write a notebook if it differs from the file on disk.
+
+    Args:
+        notebook: Notebook to write
+        path: Destination file
+        fast: Serialize directly without schema validation
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    return write_if_changed(path, serialize_notebook(notebook, fast))
+
+
+def validate_notebooks(paths: Iterable[Path]) -> List[Tuple[Path, str]]:
+    """
+    Validate written notebooks against the nbformat schema in one pass.
+
+    Intended as the end-of-run check for notebooks produced by the fast path.
+
+    Args:
+        paths: Notebook files to validate
+
+    Returns:
+        List of (path, error message) for invalid or unreadable notebooks
+    """
+    errors = []
+    for path in paths:
+        try:
+            with open(path, 'rb') as f:
+                notebook = nbformat.from_dict(_parse_json(f.read()))
+            nbformat.validate(notebook)
+        except (OSError, ValueError, nbformat.ValidationError) as e:
+            errors.append((Path(path), str(e).splitlines()[0] if str(e) else type(e).__name__))
+    return errors
@@ -0,0 +1,68 @@
+"""
+Output Writer
+
+Atomic, write-if-changed file output for converted launchables.
+"""
+
+import logging
+import os
+import tempfile
+from pathlib import Path
+from typing import Optional, Union
+
+logger = logging.getLogger(__name__)
+
+_default_mode: Optional[int] = None
+
+
+def _new_file_mode() -> int:
+    """Get the permissions open() would give a new file under the current umask."""
+    global _default_mode
+    if _default_mode is None:
+        umask = os.umask(0)
+        os.umask(umask)
+        _default_mode = 0o666 & ~umask
+    return _default_mode
+
+
+def write_if_changed(path: Path, content: Union[str, bytes]) -> bool:
+    """
+    Write a file only if its content differs from what is already on disk.
+
+    Changed files are written to a temporary file in the same directory and
+    renamed over the destination, so readers never see a partial file.
+    Unchanged files keep their mtime.
+
+    Args:
+        path: Destination file
+        content: File content (str is encoded as UTF-8)
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    path = Path(path)
+    data = content.encode('utf-8') if isinstance(content, str) else content
+
+    try:
+        existing = path.stat()
+    except FileNotFoundError:
+        existing = None
+    if existing is not None and existing.st_size == len(data):
+        with open(path, 'rb') as f:
+            if f.read() == data:
+                return False
+
+    mode = existing.st_mode & 0o777 if existing is not None else _new_file_mode()
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f'.{path.name}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.chmod(tmp_name, mode)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    return True
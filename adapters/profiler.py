@@ -0,0 +1,160 @@
+"""
+Conversion Profiler
+
+Optional per-conversion instrumentation for NotebookAdapter: wall time, call
+count, "changed the cell" count, trigger skips and errors, broken down by
+notebook and cell type.
+"""
+
+import time
+from collections import Counter
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+# Metrics recorded for each (notebook, cell type, conversion)
+METRICS = ('calls', 'changed', 'skipped', 'errors', 'seconds')
+
+
+class ConversionProfiler:
+    """
+    Accumulates conversion timings into a Counter.
+
+    Counter keys are ``(notebook, cell_type, conversion, metric)`` tuples, so
+    profiles from worker processes merge with ``merge()``. The adapter only
+    touches the profiler when one is attached; without one, conversions run
+    uninstrumented.
+    """
+
+    def __init__(self):
+        """Initialize an empty profile."""
+        self.counts: Counter = Counter()
+        self.notebook = ''
+
+    def begin_notebook(self, name: str) -> None:
+        """
+        Attribute subsequent records to a notebook.
+
+        Args:
+            name: Notebook file name
+        """
+        self.notebook = name
+
+    def call(
+        self,
+        cell_type: str,
+        name: str,
+        func: Callable[[str, Dict[str, Any]], str],
+        code: str,
+        config: Dict[str, Any]
+    ) -> str:
+        """
+        Call a conversion, recording its time and whether it changed the code.
+
+        Args:
+            cell_type: Type of the cell being converted
+            name: Conversion name
+            func: Conversion function
+            code: Current cell source
+            config: Configuration dictionary
+
+        Returns:
+            The conversion's result (exceptions are recorded and re-raised)
+        """
+        key = (self.notebook, cell_type, name)
+        start = time.perf_counter()
+        try:
+            converted = func(code, config)
+        except Exception:
+            self.counts[key + ('errors',)] += 1
+            raise
+        finally:
+            self.counts[key + ('seconds',)] += time.perf_counter() - start
+            self.counts[key + ('calls',)] += 1
+        if converted != code:
+            self.counts[key + ('changed',)] += 1
+        return converted
+
+    def skip(self, cell_type: str, name: str) -> None:
+        """
+        Record a conversion skipped because none of its triggers occurred.
+
+        Args:
+            cell_type: Type of the cell being converted
+            name: Conversion name
+        """
+        self.counts[(self.notebook, cell_type, name, 'skipped')] += 1
+
+    def merge(self, counts: Counter) -> None:
+        """
+        Add counts drained from another profiler (e.g. a worker process).
+
+        Args:
+            counts: Counter returned by drain()
+        """
+        self.counts.update(counts)
+
+    def drain(self) -> Counter:
+        """
+        Collect and reset the counts recorded since the last drain.
+
+        Returns:
+            Counter keyed by (notebook, cell_type, conversion, metric)
+        """
+        counts = self.counts
+        self.counts = Counter()
+        return counts
+
+    def _group(self, fields: Iterable[int]) -> Dict[Tuple, Dict[str, float]]:
+        """Sum metrics grouped by the given key positions."""
+        fields = tuple(fields)
+        grouped: Dict[Tuple, Dict[str, float]] = {}
+        for key, value in self.counts.items():
+            group = tuple(key[i] for i in fields)
+            metrics = grouped.setdefault(group, dict.fromkeys(METRICS, 0))
+            metrics[key[3]] += value
+        return grouped
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Build a JSON-serializable report.
+
+        Returns:
+            Dictionary with per-conversion totals, a per-cell-type breakdown
+            and per-notebook detail
+        """
+        conversions: Dict[str, Any] = {}
+        for (name,), metrics in sorted(self._group([2]).items()):
+            conversions[name] = dict(metrics, cell_types={})
+        for (cell_type, name), metrics in sorted(self._group([1, 2]).items()):
+            conversions[name]['cell_types'][cell_type] = metrics
+
+        notebooks: Dict[str, Dict[str, Any]] = {}
+        for (notebook, name), metrics in sorted(self._group([0, 2]).items()):
+            notebooks.setdefault(notebook, {})[name] = metrics
+
+        return {
+            'total_seconds': sum(m['seconds'] for m in conversions.values()),
+            'conversions': conversions,
+            'notebooks': notebooks,
+        }
+
+    def table(self) -> List[str]:
+        """
+        Format per-conversion totals as a text table, slowest first.
+
+        Returns:
+            Table lines
+        """
+        totals = self._group([2])
+        total_seconds = sum(m['seconds'] for m in totals.values()) or 1.0
+        lines = [
+            f"{'Conversion':<28}{'Calls':>8}{'Changed':>9}{'Skipped':>9}"
+            f"{'Errors':>8}{'Total ms':>10}{'Mean µs':>9}{'Time %':>8}"
+        ]
+        for (name,), m in sorted(totals.items(), key=lambda item: -item[1]['seconds']):
+            mean = m['seconds'] / m['calls'] * 1e6 if m['calls'] else 0.0
+            lines.append(
+                f"{name:<28}{int(m['calls']):>8}{int(m['changed']):>9}{int(m['skipped']):>9}"
+                f"{int(m['errors']):>8}{m['seconds'] * 1000:>10.2f}{mean:>9.1f}"
+                f"{m['seconds'] / total_seconds:>8.1%}"
+            )
+        return lines
@@ -0,0 +1,429 @@
+"""
+Rewrite Engine
+
+Compiles the regex rewrites used by the conversion functions once, and
+prefilters them with required literals so each cell is scanned a single time
+for candidate rules and only the rules that can actually match are run.
+
+Patterns built from lazy ``.*?`` gaps backtrack quadratically (or worse) on
+large cells that contain many partial matches, so rules of that shape use a
+ChainMatcher, which finds the same matches in linear time.
+"""
+
+import re
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, Optional, Tuple, Union
+
+# Characters that re.IGNORECASE matches against ASCII letters but that
+# str.lower() leaves alone (or expands into two characters)
+_IGNORECASE_EXTRAS = str.maketrans({'İ': 'i', 'ı': 'i', 'ſ': 's'})
+
+Replacement = Union[str, Callable[[re.Match], str]]
+
+# Re-matches a span found by a ChainMatcher to produce a real re.Match
+_SPAN = re.compile(r'.*', re.DOTALL)
+
+
+def fold_case(text: str) -> str:
+    """
+    Lower-case text the way re.IGNORECASE compares ASCII letters.
+
+    A literal found in the folded text is a superset of what a case-sensitive
+    or case-insensitive regex containing that literal could match, so it is
+    safe to use as a prefilter.
+
+    Args:
+        text: Text to fold
+
+    Returns:
+        Folded text
+    """
+    if text.isascii() or not ('İ' in text or 'ı' in text or 'ſ' in text):
+        return text.lower()
+    return text.translate(_IGNORECASE_EXTRAS).lower()
+
+
+class LiteralScanner:
+    """Report which of a fixed set of ASCII literals occur in a text."""
+
+    def __init__(self, literals: Iterable[str]):
+        """
+        Initialize the scanner.
+
+        Args:
+            literals: ASCII literals to look for (matched case-insensitively)
+        """
+        folded = []
+        for literal in literals:
+            if not literal or not literal.isascii():
+                raise ValueError(f"Scanner literals must be non-empty ASCII, got {literal!r}")
+            folded.append(literal.lower())
+        # Longest first so the most selective literals are checked early
+        self.literals: Tuple[str, ...] = tuple(
+            sorted(dict.fromkeys(folded), key=len, reverse=True)
+        )
+
+    def scan(self, text: str) -> FrozenSet[str]:
+        """
+        Find the literals present in text.
+
+        The text is folded once and each literal is located with a substring
+        search; this beats a combined IGNORECASE alternation regex by an order
+        of magnitude on real notebook cells.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Set of present literals, in lower case
+        """
+        folded = fold_case(text)
+        return frozenset(literal for literal in self.literals if literal in folded)
+
+
+class _ForwardSearch:
+    """
+    Leftmost-match search over a single text that never rescans a region.
+
+    Queries at non-decreasing positions reuse the previous result while it
+    still lies ahead of the query, so a sequence of queries costs one pass.
+    """
+
+    def __init__(self, pattern: re.Pattern, text: str):
+        """
+        Initialize the search.
+
+        Args:
+            pattern: Compiled pattern to search for
+            text: Text to search
+        """
+        self.pattern = pattern
+        self.text = text
+        self.origin = -1
+        self.match: Optional[re.Match] = None
+
+    def next(self, pos: int) -> Optional[re.Match]:
+        """
+        Find the leftmost match starting at or after pos.
+
+        Args:
+            pos: Position to search from
+
+        Returns:
+            Match object, or None
+        """
+        if 0 <= self.origin <= pos and (self.match is None or self.match.start() >= pos):
+            return self.match
+        self.origin = pos
+        self.match = self.pattern.search(self.text, pos)
+        return self.match
+
+
+class ChainMatcher:
+    """
+    Linear-time matcher for ``HEAD.*?STEP.*?STEP...`` patterns.
+
+    A match starts with ``head`` and continues through each step in turn,
+    where the gap before a step is the shortest run of characters that
+    contains none of ``gap_excludes`` (``.*?`` is ``gap_excludes='\\n'``,
+    ``.*?`` with re.DOTALL is ``gap_excludes=''``). It then optionally runs
+    lazily up to the first position where ``until`` matches (or the end of
+    the text), and finally through ``tail``.
+
+    The backtracking engine retries every later occurrence of a step when a
+    following step fails, and every start position scans to the end of its
+    line. Taking the first occurrence of each step is equivalent for heads
+    that match at most one way at a given position and steps whose matches
+    end in the order they start (plain literals and literal alternations),
+    and memoized forward searches keep the whole scan linear in the length
+    of the text.
+
+    ``search()``, ``subn()`` and ``sub()`` follow the re.Pattern methods of
+    the same name; match objects only carry the whole match (group 0).
+    """
+
+    def __init__(
+        self,
+        head: str,
+        steps: Iterable[str] = (),
+        until: Optional[str] = None,
+        tail: Optional[str] = None,
+        flags: int = 0,
+        gap_excludes: str = '\n'
+    ):
+        """
+        Compile the matcher.
+
+        Args:
+            head: Regex that starts a match
+            steps: Regexes matched in order, each after a lazy gap
+            until: Regex the match stops in front of (at the end of the text
+                if it never matches)
+            tail: Regex matched directly after the last step (or ``until`` stop)
+            flags: re flags for head, steps, until and tail
+            gap_excludes: Characters the gaps before steps and ``until`` may not contain
+        """
+        self.head = re.compile(head, flags)
+        self.steps = tuple(re.compile(step, flags) for step in steps)
+        self.until = re.compile(until, flags) if until is not None else None
+        self.tail = re.compile(tail, flags) if tail is not None else None
+        self.flags = flags
+        self.gap_excludes = gap_excludes
+        self._gap_stop = re.compile(f'[{re.escape(gap_excludes)}]') if gap_excludes else None
+
+    def __repr__(self) -> str:
+        """Describe the matcher by its parts."""
+        return (
+            f"ChainMatcher(head={self.head.pattern!r}, "
+            f"steps={tuple(step.pattern for step in self.steps)!r}, "
+            f"until={self.until.pattern if self.until else None!r}, "
+            f"tail={self.tail.pattern if self.tail else None!r}, "
+            f"flags={self.flags!r}, gap_excludes={self.gap_excludes!r})"
+        )
+
+    def _spans(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield the (start, end) of each non-overlapping match, left to right."""
+        steps = [_ForwardSearch(step, text) for step in self.steps]
+        until = _ForwardSearch(self.until, text) if self.until is not None else None
+        gap_stop = _ForwardSearch(self._gap_stop, text) if self._gap_stop is not None else None
+
+        def gap_ok(start: int, end: int) -> bool:
+            if gap_stop is None:
+                return True
+            stop = gap_stop.next(start)
+            return stop is None or stop.start() >= end
+
+        pos = 0
+        while True:
+            head = self.head.search(text, pos)
+            if head is None:
+                return
+            end: Optional[int] = head.end()
+            for step in steps:
+                match = step.next(end)
+                if match is None or not gap_ok(end, match.start()):
+                    end = None
+                    break
+                end = match.end()
+            if end is not None and until is not None:
+                match = until.next(end)
+                stop = match.start() if match is not None else len(text)
+                end = stop if gap_ok(end, stop) else None
+            if end is not None and self.tail is not None:
+                match = self.tail.match(text, end)
+                end = match.end() if match is not None else None
+
+            if end is None:
+                pos = head.start() + 1
+                continue
+            yield head.start(), end
+            # Like re, an empty match must not be found again at the same place
+            pos = end if end > head.start() else end + 1
+
+    def search(self, text: str) -> Optional[re.Match]:
+        """
+        Find the first match in text.
+
+        Args:
+            text: Text to search
+
+        Returns:
+            Match object, or None
+        """
+        for start, end in self._spans(text):
+            return _SPAN.fullmatch(text, start, end)
+        return None
+
+    def subn(self, repl: Replacement, text: str, count: int = 0) -> Tuple[str, int]:
+        """
+        Replace matches in text.
+
+        Args:
+            repl: Replacement string (with re.sub escapes) or callable
+            text: Text to rewrite
+            count: Maximum number of replacements (0 for all)
+
+        Returns:
+            Tuple of (rewritten_text, number_of_substitutions)
+        """
+        pieces = []
+        last = 0
+        replaced = 0
+        for start, end in self._spans(text):
+            match = _SPAN.fullmatch(text, start, end)
+            pieces.append(text[last:start])
+            pieces.append(repl(match) if callable(repl) else match.expand(repl))
+            last = end
+            replaced += 1
+            if replaced == count:
+                break
+        if not replaced:
+            return text, 0
+        pieces.append(text[last:])
+        return ''.join(pieces), replaced
+
+    def sub(self, repl: Replacement, text: str, count: int = 0) -> str:
+        """
+        Replace matches in text.
+
+        Args:
+            repl: Replacement string (with re.sub escapes) or callable
+            text: Text to rewrite
+            count: Maximum number of replacements (0 for all)
+
+        Returns:
+            Rewritten text
+        """
+        return self.subn(repl, text, count)[0]
+
+
+class RewriteRule:
+    """A single regex (or literal) rewrite guarded by required literals."""
+
+    def __init__(
+        self,
+        name: str,
+        pattern: str,
+        repl: Optional[Replacement] = None,
+        flags: int = 0,
+        anchors: Iterable[str] = (),
+        literal: bool = False,
+        matcher: Optional[ChainMatcher] = None
+    ):
+        """
+        Define a rewrite rule.
+
+        Args:
+            name: Unique rule name
+            pattern: Regular expression, or the exact text to replace when literal is True
+            repl: Default replacement (string or callable, as for re.sub)
+            flags: re flags for the pattern
+            anchors: Literals that must ALL occur in a text for the pattern to match
+            literal: Treat pattern as plain text and rewrite with str.replace
+            matcher: Linear-time equivalent of pattern to match with instead;
+                pattern stays the reference definition of the rule
+        """
+        self.name = name
+        self.pattern = pattern
+        self.repl = repl
+        self.flags = flags
+        self.literal = literal
+        self.matcher = matcher
+        anchors = tuple(anchors)
+        if literal and not anchors:
+            anchors = (pattern,)
+        self.anchors: FrozenSet[str] = frozenset(anchor.lower() for anchor in anchors)
+
+
+class RewriteEngine:
+    """
+    Compiled set of rewrite rules with a shared per-text candidate scan.
+
+    ``candidates()`` remembers the last text it scanned, so a chain of
+    conversions that leave a cell unchanged shares a single scan; a rule that
+    rewrites the cell produces different text, which is rescanned on next use.
+    """
+
+    def __init__(self, rules: Iterable[RewriteRule]):
+        """
+        Compile the rules.
+
+        Args:
+            rules: Rewrite rules, in any order
+        """
+        self.rules: Dict[str, RewriteRule] = {}
+        self._compiled: Dict[str, Union[re.Pattern, ChainMatcher]] = {}
+        for rule in rules:
+            if rule.name in self.rules:
+                raise ValueError(f"Duplicate rewrite rule: {rule.name}")
+            self.rules[rule.name] = rule
+            if rule.matcher is not None:
+                self._compiled[rule.name] = rule.matcher
+            elif not rule.literal:
+                self._compiled[rule.name] = re.compile(rule.pattern, rule.flags)
+
+        self.scanner = LiteralScanner(
+            anchor for rule in self.rules.values() for anchor in rule.anchors
+        )
+        self._last_text: Optional[str] = None
+        self._last_candidates: FrozenSet[str] = frozenset()
+
+    def candidates(self, text: str) -> FrozenSet[str]:
+        """
+        Get the names of the rules that could match text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Names of rules whose anchors all occur in text
+        """
+        # Equal strings of different length compare in O(1), identical
+        # objects short-circuit, so this is much cheaper than a rescan
+        if text == self._last_text:
+            return self._last_candidates
+
+        present = self.scanner.scan(text)
+        candidates = frozenset(
+            name for name, rule in self.rules.items() if rule.anchors <= present
+        )
+        self._last_text = text
+        self._last_candidates = candidates
+        return candidates
+
+    def search(self, name: str, text: str) -> Optional[re.Match]:
+        """
+        Search text with a rule's pattern, skipping the search on a prefilter miss.
+
+        Args:
+            name: Rule name
+            text: Text to search
+
+        Returns:
+            Match object, or None
+        """
+        if name not in self.candidates(text):
+            return None
+        return self._compiled[name].search(text)
+
+    def subn(
+        self,
+        name: str,
+        text: str,
+        repl: Optional[Replacement] = None
+    ) -> Tuple[str, int]:
+        """
+        Apply a rule to text.
+
+        Args:
+            name: Rule name
+            text: Text to rewrite
+            repl: Replacement overriding the rule's default
+
+        Returns:
+            Tuple of (rewritten_text, number_of_substitutions); the original
+            string object is returned unchanged when nothing matched
+        """
+        if name not in self.candidates(text):
+            return text, 0
+
+        rule = self.rules[name]
+        if repl is None:
+            repl = rule.repl
+        if rule.literal:
+            count = text.count(rule.pattern)
+            return (text.replace(rule.pattern, repl), count) if count else (text, 0)
+        return self._compiled[name].subn(repl, text)
+
+    def sub(self, name: str, text: str, repl: Optional[Replacement] = None) -> str:
+        """
+        Apply a rule to text.
+
+        Args:
+            name: Rule name
+            text: Text to rewrite
+            repl: Replacement overriding the rule's default
+
+        Returns:
+            Rewritten text
+        """
+        return self.subn(name, text, repl)[0]
@@ -0,0 +1,166 @@
+"""
+Adapter Session
+
+Holds a warm adapter for the lifetime of a conversion run.
+"""
+
+import logging
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from .cell_cache import CellCache
+from .colab_to_brev import ColabToBrevAdapter
+from .notebook_io import Notebook, serialize_notebook
+from .output_writer import write_if_changed
+from .profiler import ConversionProfiler
+
+logger = logging.getLogger(__name__)
+
+
+class AdapterSession:
+    """
+    A ColabToBrevAdapter that is built once and reused for many notebooks.
+
+    Constructing the adapter creates the Jinja environment, compiles the
+    companion-file templates (or loads them from the template bytecode
+    cache) and registers every conversion. A session pays
+    that cost once per run (once per worker process in parallel mode) instead
+    of once per notebook.
+    """
+
+    def __init__(
+        self,
+        templates_dir: Path,
+        cell_cache: Optional[CellCache] = None,
+        fast_io: bool = False,
+        build_time: Optional[datetime] = None,
+        profiler: Optional[ConversionProfiler] = None,
+        code_backend: str = 'regex',
+        template_cache_dir: Optional[Path] = None
+    ):
+        """
+        Initialize the session.
+
+        Args:
+            templates_dir: Path to Jinja2 templates directory
+            cell_cache: Persistent cache of converted cells to consult, if any
+            fast_io: Read and write notebooks as plain JSON without per-notebook
+                schema validation
+            build_time: Fixed timestamp for generated files (None uses the time
+                the session was created, so every file it writes shares one timestamp)
+            profiler: Per-conversion instrumentation to record into, if any
+            code_backend: Backend for the Python-level code conversions
+                ('regex' or 'cst', see adapters.cst_backend)
+            template_cache_dir: Directory for compiled template bytecode
+                (None compiles the templates in memory)
+        """
+        self.templates_dir = Path(templates_dir)
+        self.fast_io = fast_io
+        self.adapter = ColabToBrevAdapter(self.templates_dir, template_cache_dir)
+        self.adapter.cell_cache = cell_cache
+        self.adapter.fast_io = fast_io
+        # Pin the run time so identical companion files render identically
+        self.adapter.build_time = build_time or datetime.now(timezone.utc)
+        self.adapter.profiler = profiler
+        self.adapter.code_backend = code_backend
+        self.notebooks_adapted = 0
+        # Launchable directory -> companion files written there by this session
+        self._companions_written: Dict[Path, Dict[str, str]] = {}
+        logger.debug(f"Created adapter session for templates in {self.templates_dir}")
+
+    def adapt(
+        self,
+        notebook_path: Path,
+        config: Dict[str, Any]
+    ) -> Tuple[Notebook, Dict[str, str]]:
+        """
+        Adapt a notebook with the session's adapter.
+
+        Args:
+            notebook_path: Path to the source notebook
+            config: Configuration dictionary for the model
+
+        Returns:
+            Tuple of (adapted_notebook, companion_files_dict)
+        """
+        result = self.adapter.adapt(notebook_path, config)
+        self.notebooks_adapted += 1
+        if self.adapter.cell_cache is not None:
+            self.adapter.cell_cache.flush()
+        return result
+
+    def write_notebook(self, notebook: Notebook, path: Path) -> bool:
+        """
+        Write an adapted notebook with the session's I/O mode, if it changed.
+
+        Args:
+            notebook: Notebook returned by adapt()
+            path: Destination file
+
+        Returns:
+            True if the file was written, False if it was already up to date
+        """
+        return self.write_file(path, serialize_notebook(notebook, fast=self.fast_io))
+
+    def write_file(self, path: Path, content: str) -> bool:
+        """
+        Write an output file atomically, skipping it if the content is unchanged.
+
+        Args:
+            path: Destination file
+            content: File content
+
+        Returns:
+            True if the file was written, False if it was already up to date
+        """
+        data = content.encode('utf-8')
+        written = write_if_changed(path, data)
+        outcome = 'written' if written else 'skipped'
+        self.adapter.stats[f'files_{outcome}'] += 1
+        self.adapter.stats[f'bytes_{outcome}'] += len(data)
+        return written
+
+    def write_companion_files(self, launchable_dir: Path, companion_files: Dict[str, str]) -> Dict[str, bool]:
+        """
+        Write a launchable's companion files, once per session.
+
+        Notebooks that map to the same launchable produce the same companion
+        set; files this session already wrote with the same content are
+        skipped without touching the disk.
+
+        Args:
+            launchable_dir: Launchable output directory
+            companion_files: Mapping of file name to content, from adapt()
+
+        Returns:
+            Mapping of file name to whether it was written
+        """
+        written_here = self._companions_written.setdefault(Path(launchable_dir), {})
+        results = {}
+        for filename, content in companion_files.items():
+            if written_here.get(filename) == content:
+                self.adapter.stats['companion_files_reused'] += 1
+                results[filename] = False
+                continue
+            results[filename] = self.write_file(Path(launchable_dir) / filename, content)
+            written_here[filename] = content
+        return results
+
+    def close(self) -> None:
+        """Release resources held by the session (flushes the cell cache)."""
+        if self.adapter.cell_cache is not None:
+            self.adapter.cell_cache.close()
+            self.adapter.cell_cache = None
+
+    def drain_stats(self) -> Counter:
+        """
+        Collect and reset the counters accumulated since the last drain.
+
+        Returns:
+            Counter of per-run statistics (conversion calls made/skipped, ...)
+        """
+        stats = Counter(self.adapter.stats)
+        self.adapter.stats.clear()
+        return stats
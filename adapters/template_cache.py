@@ -0,0 +1,78 @@
+"""
+Template Cache
+
+Persistent Jinja bytecode cache for the companion-file templates. Compiling
+a template (parsing it and generating Python code) costs far more than
+loading the stored bytecode, and every conversion run and worker process
+would otherwise compile the templates again.
+
+Jinja stores each template's bytecode together with a checksum of its
+source; a template whose .jinja2 file changed is recompiled on load and its
+entry rewritten, and unchanged templates are loaded from the cache.
+"""
+
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict
+
+from jinja2 import FileSystemBytecodeCache
+from jinja2.bccache import Bucket
+
+logger = logging.getLogger(__name__)
+
+# Environment options that change the generated code; the cache entries are
+# namespaced by them so environments with different options never share code
+TEMPLATE_OPTIONS: Dict[str, Any] = {
+    'trim_blocks': True,
+    'lstrip_blocks': True,
+}
+
+
+def options_key(options: Dict[str, Any]) -> str:
+    """
+    Get a short, stable key for a set of environment options.
+
+    Args:
+        options: Keyword arguments passed to jinja2.Environment
+
+    Returns:
+        Hex digest identifying the options
+    """
+    canonical = json.dumps(options, sort_keys=True, default=repr)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:12]
+
+
+class TemplateBytecodeCache(FileSystemBytecodeCache):
+    """
+    FileSystemBytecodeCache that counts loads and compilations.
+
+    ``hits`` counts templates loaded from stored bytecode, ``compiles``
+    templates that were missing, stale or changed and had to be compiled.
+    """
+
+    def __init__(self, cache_dir: Path, options: Dict[str, Any] = TEMPLATE_OPTIONS):
+        """
+        Open (creating if needed) the cache directory.
+
+        Args:
+            cache_dir: Directory for the bytecode files
+            options: Environment options the templates are compiled with
+        """
+        cache_dir = Path(cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        super().__init__(str(cache_dir), pattern=f'__jinja2_{options_key(options)}_%s.cache')
+        self.cache_dir = cache_dir
+        self.hits = 0
+        self.compiles = 0
+
+    def load_bytecode(self, bucket: Bucket) -> None:
+        """Load a template's bytecode, counting whether it was usable."""
+        super().load_bytecode(bucket)
+        # The bucket discards bytecode whose source checksum does not match
+        if bucket.code is None:
+            self.compiles += 1
+            logger.debug(f"Compiling template {bucket.key}")
+        else:
+            self.hits += 1
@@ -0,0 +1 @@
+"""Performance benchmarks for Unsloth to Brev adapter."""
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-notebook adapter overhead with and without a warm session.
+
+Usage:
+    python benchmarks/bench_adapter_session.py [--notebooks 50]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import nbformat
+from nbformat.v4 import new_code_cell, new_markdown_cell, new_notebook
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adapters import AdapterSession, ColabToBrevAdapter, get_config_for_notebook
+
+TEMPLATES_DIR = Path(__file__).parent.parent / 'templates'
+
+
+def write_sample_notebooks(target_dir: Path, count: int) -> list:
+    """
+    Write small Colab-style notebooks to convert.
+
+    Args:
+        target_dir: Directory to write notebooks into
+        count: Number of notebooks
+
+    Returns:
+        List of notebook paths
+    """
+    cells = [
+        new_markdown_cell('To run this, press "*Runtime*" and press "*Run all*" on a **free** Tesla T4 Google Colab instance!'),
+        new_code_cell('%%capture\nimport os\nif "COLAB_" not in "".join(os.environ.keys()):\n    !pip install unsloth'),
+        new_code_cell('from unsloth import FastLanguageModel\nmodel, tokenizer = FastLanguageModel.from_pretrained(\n    model_name="unsloth/Llama-3.2-3B",\n    load_in_4bit=True,\n)'),
+        new_code_cell('gpu_stats = torch.cuda.get_device_properties(0)'),
+        new_code_cell('args = TrainingArguments(per_device_train_batch_size=2, output_dir="outputs")'),
+        new_code_cell('outputs = model.generate(**inputs, max_new_tokens=64)'),
+    ]
+    paths = []
+    for i in range(count):
+        path = target_dir / f'Llama3.2_(3B)-Sample{i}.ipynb'
+        with open(path, 'w', encoding='utf-8') as f:
+            nbformat.write(new_notebook(cells=cells), f)
+        paths.append(path)
+    return paths
+
+
+def time_fresh_adapter(notebooks: list) -> float:
+    """Time the pre-session path: a new adapter for every notebook."""
+    start = time.perf_counter()
+    for path in notebooks:
+        config = get_config_for_notebook(path.stem)
+        ColabToBrevAdapter(TEMPLATES_DIR).adapt(path, config)
+    return time.perf_counter() - start
+
+
+def time_session(notebooks: list) -> float:
+    """Time a single warm session shared by every notebook."""
+    start = time.perf_counter()
+    session = AdapterSession(TEMPLATES_DIR)
+    for path in notebooks:
+        config = get_config_for_notebook(path.stem)
+        session.adapt(path, config)
+    return time.perf_counter() - start
+
+
+def main():
+    """Run the benchmark and print per-notebook timings."""
+    parser = argparse.ArgumentParser(description='Benchmark adapter session reuse')
+    parser.add_argument('--notebooks', type=int, default=50, help='Number of notebooks to adapt')
+    parser.add_argument('--repeat', type=int, default=3, help='Repetitions (best time is reported)')
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        notebooks = write_sample_notebooks(Path(tmp), args.notebooks)
+
+        # Warm the filesystem cache and imports before timing
+        time_session(notebooks[:1])
+
+        fresh = min(time_fresh_adapter(notebooks) for _ in range(args.repeat))
+        warm = min(time_session(notebooks) for _ in range(args.repeat))
+
+    construct = min(
+        _time(lambda: ColabToBrevAdapter(TEMPLATES_DIR)) for _ in range(args.repeat * 10)
+    )
+
+    per_fresh = fresh / args.notebooks * 1000
+    per_warm = warm / args.notebooks * 1000
+    print(f"Notebooks adapted:          {args.notebooks}")
+    print(f"Adapter construction:       {construct * 1000:.2f} ms")
+    print(f"Fresh adapter per notebook: {per_fresh:.2f} ms/notebook")
+    print(f"Warm session:               {per_warm:.2f} ms/notebook")
+    print(f"Saved per notebook:         {per_fresh - per_warm:.2f} ms ({per_fresh / per_warm:.2f}x)")
+
+
+def _time(func) -> float:
+    """Time a single call."""
+    start = time.perf_counter()
+    func()
+    return time.perf_counter() - start
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Benchmark notebook load/write time with nbformat and with the fast path.
+
+Usage:
+    python benchmarks/bench_notebook_io.py [--source converted]
+"""
+
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+import nbformat
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adapters import notebook_io
+from adapters.notebook_io import notebook_to_json, read_notebook
+
+
+def time_loads(notebooks: list, fast: bool) -> float:
+    """Time loading every notebook."""
+    start = time.perf_counter()
+    for path in notebooks:
+        read_notebook(path, fast=fast)
+    return time.perf_counter() - start
+
+
+def time_writes(loaded: list, fast: bool) -> float:
+    """Time serializing every loaded notebook."""
+    start = time.perf_counter()
+    for notebook in loaded:
+        if fast:
+            notebook_to_json(notebook)
+        else:
+            nbformat.write(notebook, io.StringIO())
+    return time.perf_counter() - start
+
+
+def main():
+    """Run the benchmark and print per-notebook timings."""
+    parser = argparse.ArgumentParser(description='Benchmark notebook loading and writing')
+    parser.add_argument(
+        '--source',
+        type=Path,
+        default=Path(__file__).parent.parent / 'converted',
+        help='Directory of notebooks to load (searched recursively)'
+    )
+    parser.add_argument('--repeat', type=int, default=3, help='Repetitions (best time is reported)')
+    args = parser.parse_args()
+
+    notebooks = sorted(args.source.glob('**/*.ipynb'))
+    if not notebooks:
+        print(f"No notebooks found in {args.source}")
+        sys.exit(1)
+
+    # Warm the filesystem cache and imports before timing
+    time_loads(notebooks, fast=False)
+
+    count = len(notebooks)
+    results = {}
+    for label, fast in (('nbformat', False), ('fast path', True)):
+        loaded = [read_notebook(path, fast=fast) for path in notebooks]
+        load = min(time_loads(notebooks, fast) for _ in range(args.repeat))
+        write = min(time_writes(loaded, fast) for _ in range(args.repeat))
+        results[label] = (load / count * 1000, write / count * 1000)
+
+    backend = 'orjson' if notebook_io.orjson is not None else 'json'
+    print(f"Notebooks:                  {count} (fast path parser: {backend})")
+    for label, (load, write) in results.items():
+        print(f"{label + ' load:':<28}{load:.2f} ms/notebook")
+        print(f"{label + ' write:':<28}{write:.2f} ms/notebook")
+    (slow_load, slow_write), (fast_load, fast_write) = results.values()
+    print(f"Load speedup:               {slow_load / fast_load:.1f}x")
+    print(f"Write speedup:              {slow_write / fast_write:.1f}x")
+
+
+if __name__ == '__main__':
+    main()
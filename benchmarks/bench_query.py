@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Benchmark LaunchablesIndex queries on a synthetic registry.
+
+Generates a registry of 100,000 launchables (by default) with the tag, GPU
+tier and VRAM mix of the real one, then times building the index and a set
+of queries answered by the index and by a Python loop over the registry,
+the way the metadata scripts used to filter it.
+
+Usage:
+    python benchmarks/bench_query.py [--launchables 100000] [--repeat 5]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adapters.launchables_index import LaunchablesIndex, launchable_category, launchable_min_vram
+
+# (tier, min_vram_gb, weight), roughly the real registry's mix
+GPU_MIX = (
+    ('T4', 12, 2),
+    ('L4', 16, 130),
+    ('L40S', 48, 5),
+    ('A100-40GB', 24, 28),
+    ('A100-80GB', 40, 2),
+    ('A100-80GB', 80, 2),
+    ('H100', 80, 1),
+)
+
+# (extra tags, weight); every launchable also carries the generic tags
+TAG_MIX = (
+    ((), 130),
+    (('reasoning',), 17),
+    (('reasoning', 'large-model'), 5),
+    (('text-generation',), 10),
+    (('vision', 'multimodal'), 5),
+    (('audio', 'text-to-speech'), 2),
+    (('audio', 'speech-to-text'), 1),
+    (('reinforcement-learning', 'grpo'), 3),
+)
+
+# Label -> LaunchablesIndex.query keyword arguments
+QUERIES = {
+    'vision, fits in 24 GB': {'category': 'vision', 'max_vram_gb': 24},
+    'reasoning + large-model on A100-40GB': {'tags': ['reasoning', 'large-model'], 'tier': 'A100-40GB'},
+    'speech-to-text': {'tags': ['speech-to-text']},
+    'needs 80 GB or more': {'min_vram_gb': 80},
+    'L4, fits in 16 GB': {'tier': 'L4', 'max_vram_gb': 16},
+}
+
+
+def synthetic_launchables(count: int, seed: int = 0) -> List[Dict[str, Any]]:
+    """
+    Generate launchable entries shaped like generate_metadata.py's.
+
+    Args:
+        count: Number of launchables
+        seed: Random seed
+
+    Returns:
+        Launchable metadata dictionaries
+    """
+    rng = random.Random(seed)
+    gpus = rng.choices(GPU_MIX, weights=[weight for *_, weight in GPU_MIX], k=count)
+    tags = rng.choices(TAG_MIX, weights=[weight for _, weight in TAG_MIX], k=count)
+    return [
+        {
+            'id': f'model-{index:06d}/Model_{index}',
+            'name': f'Model_{index}',
+            'description': f'Fine-tune model {index} with Unsloth',
+            'notebook': f'Model_{index}.ipynb',
+            'path': f'model-{index:06d}',
+            'gpu': {'tier': tier, 'min_vram_gb': min_vram, 'multi_gpu': min_vram >= 40},
+            'tags': ['unsloth', 'fine-tuning', *extra_tags],
+            'upstream': {},
+            'files': ['.brevconfig.json', 'README.md', f'Model_{index}.ipynb'],
+        }
+        for index, ((tier, min_vram, _), (extra_tags, _)) in enumerate(zip(gpus, tags))
+    ]
+
+
+def linear_query(launchables: List[Dict[str, Any]], tags=(), tier=None, category=None,
+                 min_vram_gb=None, max_vram_gb=None) -> List[Dict[str, Any]]:
+    """Answer a query with a Python loop over every launchable."""
+    results = []
+    for launchable in launchables:
+        gpu = launchable.get('gpu') or {}
+        min_vram = launchable_min_vram(launchable)
+        if any(tag not in launchable.get('tags', []) for tag in tags):
+            continue
+        if tier is not None and (gpu.get('tier') or '').upper() != tier.upper():
+            continue
+        if category is not None and launchable_category(launchable).lower() != category.lower():
+            continue
+        if min_vram_gb is not None and (min_vram is None or min_vram < min_vram_gb):
+            continue
+        if max_vram_gb is not None and (min_vram is None or min_vram > max_vram_gb):
+            continue
+        results.append(launchable)
+    return results
+
+
+def best_time(func: Callable[[], Any], repeat: int) -> float:
+    """Time a callable, keeping the best of several runs, in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return min(samples)
+
+
+def main():
+    """Run the query benchmark and print a table."""
+    parser = argparse.ArgumentParser(description='Benchmark launchables index queries')
+    parser.add_argument(
+        '--launchables',
+        type=int,
+        default=100_000,
+        help='Launchables in the synthetic registry (default: 100000)'
+    )
+    parser.add_argument('--repeat', type=int, default=5, help='Repetitions (best time is reported)')
+    args = parser.parse_args()
+
+    launchables = synthetic_launchables(args.launchables)
+    build_ms = best_time(lambda: LaunchablesIndex(launchables), args.repeat)
+    index = LaunchablesIndex(launchables)
+
+    print(f"Registry: {args.launchables} launchables; index built in {build_ms:.1f} ms")
+    print(f"{'Query':<40}{'matches':>9}{'index ms':>10}{'scan ms':>10}{'speedup':>9}")
+    for label, query in QUERIES.items():
+        matches = index.query(**query)
+        if matches != linear_query(launchables, **query):
+            print(f"{label}: index and linear scan disagree")
+            sys.exit(1)
+        indexed = best_time(lambda: index.query(**query), args.repeat)
+        scanned = best_time(lambda: linear_query(launchables, **query), args.repeat)
+        print(f"{label:<40}{len(matches):>9}{indexed:>10.3f}{scanned:>10.1f}{scanned / indexed:>8.0f}x")
+
+
+if __name__ == '__main__':
+    main()
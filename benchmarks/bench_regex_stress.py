@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Stress the conversions with multi-megabyte adversarial cells.
+
+Each cell in benchmarks.synthetic.ADVERSARIAL_CELLS is full of partial
+matches for one rewrite pattern; a backtracking regex needs quadratic (or
+worse) time on it. The full conversion pipeline for the cell's type is timed
+and the script exits non-zero when any cell takes longer than the budget.
+
+Usage:
+    python benchmarks/bench_regex_stress.py [--sizes-mb 1 4] [--budget 1.0]
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adapters import ColabToBrevAdapter, get_config_for_notebook
+from benchmarks.synthetic import ADVERSARIAL_CELLS, adversarial_cell
+
+TEMPLATES_DIR = Path(__file__).parent.parent / 'templates'
+
+
+def seconds_per_mb(adapter: ColabToBrevAdapter, kind: str, size: int) -> float:
+    """
+    Time the conversion pipeline on one adversarial cell.
+
+    Args:
+        adapter: Adapter to convert with
+        kind: Key of ADVERSARIAL_CELLS
+        size: Approximate cell length in characters
+
+    Returns:
+        Conversion time in seconds per million characters
+    """
+    cell_type = ADVERSARIAL_CELLS[kind][0]
+    source = adversarial_cell(kind, size)
+    config = get_config_for_notebook('Stress')
+    start = time.perf_counter()
+    adapter._apply_conversions(source, config, cell_type)
+    return (time.perf_counter() - start) / (len(source) / 1e6)
+
+
+def main():
+    """Run every adversarial cell at every size and check the budget."""
+    parser = argparse.ArgumentParser(description='Time conversions on pathological cells')
+    parser.add_argument(
+        '--sizes-mb',
+        type=float,
+        nargs='+',
+        default=[1, 4],
+        help='Cell sizes in MB, smallest first (default: 1 4)'
+    )
+    parser.add_argument(
+        '--budget',
+        type=float,
+        default=1.0,
+        help='Maximum conversion time in seconds per MB (default: 1.0)'
+    )
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    adapter = ColabToBrevAdapter(TEMPLATES_DIR)
+
+    over_budget = []
+    for size_mb in sorted(args.sizes_mb):
+        for kind in ADVERSARIAL_CELLS:
+            rate = seconds_per_mb(adapter, kind, int(size_mb * 1e6))
+            print(f"{kind + ' @ ' + format(size_mb, 'g') + ' MB':<40}{rate:>8.3f} s/MB")
+            if rate > args.budget:
+                over_budget.append(f"{kind} @ {size_mb:g} MB")
+        # Larger cells would only take longer
+        if over_budget:
+            break
+
+    if over_budget:
+        print(f"Over the {args.budget} s/MB budget: {', '.join(over_budget)}")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
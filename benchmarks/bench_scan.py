@@ -0,0 +1,164 @@
+#!/usr/bin/env python3
+"""
+Benchmark generate_metadata's launchable scanner on a synthetic converted tree.
+
+Writes a converted/ tree (by default 10,000 launchables and 50,000 files:
+a .brevconfig.json, three companion files and a notebook each) and times a
+full scan read serially and on the thread pool, and an incremental update
+with nothing changed and with 1% of the launchables changed. With --baseline-dir, the full scan of another checkout
+(e.g. one made with ``git worktree add /tmp/before <rev>``) is timed on the
+same tree for a before/after comparison.
+
+Usage:
+    python benchmarks/bench_scan.py [--launchables 10000] [--repeat 3]
+    python benchmarks/bench_scan.py --baseline-dir /tmp/before
+"""
+
+import argparse
+import json
+import logging
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.synthetic import backdate_tree
+from scripts.generate_metadata import BREV_CONFIG_NAME, scan_launchables, update_launchables
+
+COMPANION_FILES = ('README.md', 'requirements.txt', 'setup.sh')
+
+_BASELINE_TIMER = """
+import logging, sys, time
+from pathlib import Path
+sys.path.insert(0, '.')
+from scripts.generate_metadata import scan_launchables
+logging.disable(logging.CRITICAL)
+tree = Path({tree!r})
+samples = []
+for _ in range({repeat}):
+    start = time.perf_counter()
+    scan_launchables(tree)
+    samples.append(time.perf_counter() - start)
+print(min(samples))
+"""
+
+
+def write_converted_tree(root: Path, launchables: int) -> int:
+    """
+    Write a synthetic converted/ tree.
+
+    Args:
+        root: Directory to create the launchables in
+        launchables: Number of launchable directories
+
+    Returns:
+        Number of files written
+    """
+    files = 0
+    for index in range(launchables):
+        launchable_dir = root / f'model-{index:05d}'
+        launchable_dir.mkdir(parents=True)
+        (launchable_dir / '.brevconfig.json').write_text(json.dumps({
+            'name': f'model-{index:05d}',
+            'description': f'Fine-tune model {index} with Unsloth',
+            'gpu': {'tier': 'L4', 'min_vram_gb': 16},
+            'tags': ['unsloth', 'fine-tuning', 'vision' if index % 5 == 0 else 'text'],
+            'upstream': {'notebook_url': f'https://example.com/Model_{index}.ipynb'},
+        }, indent=2))
+        for name in COMPANION_FILES:
+            (launchable_dir / name).write_text('# synthetic\n')
+        (launchable_dir / f'Model_{index}_(8B).ipynb').write_text('{}')
+        files += 2 + len(COMPANION_FILES)
+    return files
+
+
+def best_time(func: Callable[[], Any], repeat: int) -> float:
+    """Time a callable, keeping the best of several runs, in milliseconds."""
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        samples.append((time.perf_counter() - start) * 1000)
+    return min(samples)
+
+
+def time_baseline(baseline_dir: Path, tree: Path, repeat: int) -> float:
+    """
+    Time the full scan of another checkout on the same tree.
+
+    Args:
+        baseline_dir: Checkout whose scripts/generate_metadata.py is timed
+        tree: Converted tree to scan
+        repeat: Number of timed scans
+
+    Returns:
+        Fastest scan in milliseconds
+    """
+    result = subprocess.run(
+        [sys.executable, '-c', _BASELINE_TIMER.format(tree=str(tree), repeat=repeat)],
+        cwd=baseline_dir,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return float(result.stdout.strip().splitlines()[-1]) * 1000
+
+
+def main():
+    """Run the scanner benchmark and print a table."""
+    parser = argparse.ArgumentParser(description='Benchmark the launchable scanner')
+    parser.add_argument(
+        '--launchables',
+        type=int,
+        default=10_000,
+        help='Launchable directories in the synthetic tree (default: 10000)'
+    )
+    parser.add_argument('--repeat', type=int, default=3, help='Repetitions (best time is reported)')
+    parser.add_argument(
+        '--baseline-dir',
+        type=Path,
+        default=None,
+        help='Another checkout whose full scan is timed for comparison'
+    )
+    args = parser.parse_args()
+
+    # The scanner logs every launchable; keep that out of the timings
+    logging.disable(logging.CRITICAL)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tree = Path(tmp) / 'converted'
+        files = write_converted_tree(tree, args.launchables)
+        backdate_tree(tree)
+
+        # Warm the filesystem cache before timing
+        launchables, directories, _ = update_launchables(tree, [], {})
+
+        results = {}
+        if args.baseline_dir is not None:
+            results['full scan (baseline)'] = time_baseline(args.baseline_dir, tree, args.repeat)
+        results['full scan (serial)'] = best_time(lambda: scan_launchables(tree, jobs=1), args.repeat)
+        results['full scan (threads)'] = best_time(lambda: scan_launchables(tree), args.repeat)
+        results['incremental, unchanged'] = best_time(
+            lambda: update_launchables(tree, launchables, directories), args.repeat
+        )
+
+        for index in range(0, args.launchables, 100):
+            config_path = tree / f'model-{index:05d}' / BREV_CONFIG_NAME
+            config_path.write_text(config_path.read_text().replace('Fine-tune', 'Train'))
+        results['incremental, 1% changed'] = best_time(
+            lambda: update_launchables(tree, launchables, directories), args.repeat
+        )
+
+    print(f"Tree: {args.launchables} launchables, {files} files")
+    print(f"{'Case':<28}{'ms':>10}{'us/launchable':>16}")
+    for label, value in results.items():
+        print(f"{label:<28}{value:>10.1f}{value / args.launchables * 1000:>16.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Benchmark package and script startup.
+
+Times importing adapters, the first config lookup and loading each script
+under scripts/. Each measurement runs in a fresh interpreter, so nothing is
+cached between runs. Startup noise only ever adds time, so the fastest run
+is reported. With --baseline-dir the same measurements are taken,
+interleaved, in another checkout (e.g. one made with
+``git worktree add /tmp/before <rev>``) for a before/after comparison.
+
+--importtime prints where the time goes (``python -X importtime`` parsed
+into a table), and --check exits non-zero when a lightweight script takes
+longer than the startup budget to load.
+
+Usage:
+    python benchmarks/bench_startup.py [--repeat 15] [--baseline-dir /tmp/before]
+    python benchmarks/bench_startup.py --importtime
+    python benchmarks/bench_startup.py --check
+"""
+
+import argparse
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+REPO_DIR = Path(__file__).parent.parent
+
+# Scripts that only read or write metadata and must start quickly; they
+# run several times per CI sync and must not load nbformat or jinja2
+LIGHTWEIGHT_SCRIPTS = (
+    'build_config_index.py',
+    'compare_notebooks.py',
+    'create_summary.py',
+    'generate_metadata.py',
+    'generate_readme_table.py',
+    'query_launchables.py',
+)
+
+# Budget for loading a lightweight script, excluding interpreter startup
+SCRIPT_STARTUP_BUDGET_MS = 50.0
+
+# Label -> statement timed in a fresh interpreter
+STARTUP_CASES = {
+    'import adapters': 'import adapters',
+    'import + first config lookup': (
+        "import adapters; adapters.get_config_for_notebook('Llama_3.1_(8B).ipynb')"
+    ),
+    'scripts/convert_notebook.py': (
+        "import runpy; runpy.run_path('scripts/convert_notebook.py', run_name='startup')"
+    ),
+}
+for _script in LIGHTWEIGHT_SCRIPTS:
+    STARTUP_CASES[f'scripts/{_script}'] = (
+        f"import runpy; runpy.run_path('scripts/{_script}', run_name='startup')"
+    )
+
+_TIMER = (
+    "import time; _start = time.perf_counter(); {statement}; "
+    "print(time.perf_counter() - _start)"
+)
+
+
+def time_statement(statement: str, cwd: Path) -> float:
+    """
+    Time a statement in a fresh interpreter.
+
+    Args:
+        statement: Python statement
+        cwd: Checkout to run in (its adapters package is imported)
+
+    Returns:
+        Time in milliseconds, excluding interpreter startup
+    """
+    result = subprocess.run(
+        [sys.executable, '-c', _TIMER.format(statement=statement)],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return float(result.stdout.strip().splitlines()[-1]) * 1000
+
+
+def parse_importtime(output: str) -> List[Dict[str, Any]]:
+    """
+    Parse the report written by ``python -X importtime``.
+
+    Args:
+        output: stderr of the interpreter
+
+    Returns:
+        One row per imported module, in report order, with 'module',
+        'depth' (0 for top-level imports), 'self_us' and 'cumulative_us'
+    """
+    rows = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # The header line
+        name = fields[2].rstrip()
+        module = name.lstrip()
+        rows.append({
+            'module': module,
+            'depth': (len(name) - len(module) - 1) // 2,
+            'self_us': int(fields[0]),
+            'cumulative_us': int(fields[1]),
+        })
+    return rows
+
+
+def importtime_table(statement: str, cwd: Path = REPO_DIR, top: int = 12) -> str:
+    """
+    Report the slowest imports of a statement.
+
+    Args:
+        statement: Python statement, run in a fresh interpreter
+        cwd: Checkout to run in
+        top: Number of modules to list
+
+    Returns:
+        Table of the modules with the largest cumulative import time
+    """
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    rows = sorted(parse_importtime(result.stderr), key=lambda row: row['cumulative_us'], reverse=True)
+    lines = [f"{'Module':<44}{'self ms':>10}{'total ms':>10}"]
+    for row in rows[:top]:
+        name = '  ' * row['depth'] + row['module']
+        lines.append(f"{name:<44}{row['self_us'] / 1000:>10.2f}{row['cumulative_us'] / 1000:>10.2f}")
+    return '\n'.join(lines)
+
+
+def time_startup(checkouts: List[Path], repeat: int) -> List[Dict[str, float]]:
+    """
+    Time every startup case in each checkout, interleaving the runs.
+
+    Args:
+        checkouts: Checkouts to measure
+        repeat: Fresh interpreters per case and checkout
+
+    Returns:
+        For each checkout, a mapping of case label to fastest milliseconds
+    """
+    results: List[Dict[str, float]] = [{} for _ in checkouts]
+    for label, statement in STARTUP_CASES.items():
+        for _ in range(repeat):
+            for result, checkout in zip(results, checkouts):
+                elapsed = time_statement(statement, checkout)
+                result[label] = min(result.get(label, elapsed), elapsed)
+    return results
+
+
+def time_registry_loads(repeat: int) -> Dict[str, float]:
+    """
+    Time loading the registry in-process, from the index and from the source.
+
+    Args:
+        repeat: Number of loads per variant
+
+    Returns:
+        Mapping of label to fastest milliseconds
+    """
+    from adapters.model_configs import REGISTRY_INDEX_PATH, REGISTRY_PATH, load_registry
+
+    results = {}
+    for label, index_path in (('registry load (index)', REGISTRY_INDEX_PATH),
+                              ('registry load (source)', None)):
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            load_registry(REGISTRY_PATH, index_path)
+            samples.append((time.perf_counter() - start) * 1000)
+        results[label] = min(samples)
+    return results
+
+
+def main():
+    """Run the startup benchmarks and print a table."""
+    parser = argparse.ArgumentParser(description='Benchmark package import and first lookup')
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=15,
+        help='Fresh interpreters per measurement (default: 15)'
+    )
+    parser.add_argument(
+        '--baseline-dir',
+        type=Path,
+        default=None,
+        help='Another checkout to measure for comparison'
+    )
+    parser.add_argument(
+        '--importtime',
+        action='store_true',
+        help='Print the slowest imports of each case'
+    )
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help=f'Exit non-zero if a lightweight script loads slower than {SCRIPT_STARTUP_BUDGET_MS:g} ms'
+    )
+    args = parser.parse_args()
+
+    if args.importtime:
+        for label, statement in STARTUP_CASES.items():
+            print(f"\n{label}\n{importtime_table(statement)}")
+        return
+
+    baseline: Optional[Dict[str, float]] = None
+    if args.baseline_dir is not None:
+        current, baseline = time_startup([REPO_DIR, args.baseline_dir], args.repeat)
+    else:
+        current, = time_startup([REPO_DIR], args.repeat)
+
+    if baseline is None:
+        print(f"{'Case':<40}{'ms':>10}")
+        for label, value in current.items():
+            print(f"{label:<40}{value:>10.2f}")
+    else:
+        print(f"{'Case':<40}{'before ms':>10}{'after ms':>10}{'change':>9}")
+        for label, value in current.items():
+            change = (value - baseline[label]) / baseline[label] * 100
+            print(f"{label:<40}{baseline[label]:>10.2f}{value:>10.2f}{change:>+8.0f}%")
+
+    for label, value in time_registry_loads(args.repeat).items():
+        print(f"{label:<40}{value:>10.2f}")
+
+    if args.check:
+        over_budget = [
+            f"{label} ({current[label]:.1f} ms)" for label in current
+            if label.startswith('scripts/') and label[len('scripts/'):] in LIGHTWEIGHT_SCRIPTS
+            and current[label] > SCRIPT_STARTUP_BUDGET_MS
+        ]
+        if over_budget:
+            print(f"Over the {SCRIPT_STARTUP_BUDGET_MS:g} ms startup budget: {', '.join(over_budget)}")
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,347 @@
+#!/usr/bin/env python3
+"""
+Run the adapter benchmark suite over synthetic notebook corpora.
+
+Times ColabToBrevAdapter.adapt, each conversion on its own, companion-file
+and template rendering, generate_metadata.scan_launchables and its
+incremental update (nothing changed since the last scan) at several corpus
+sizes, plus template loading with and without the bytecode cache,
+and writes the results as JSON.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--scales 10 1000 10000] [--output results.json]
+"""
+
+import argparse
+import gc
+import json
+import logging
+import platform
+import re
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from jinja2 import Environment, FileSystemLoader
+
+from adapters import AdapterSession, __version__, get_config_for_notebook
+from adapters.colab_to_brev import TEMPLATE_NAMES
+from adapters.notebook_io import read_notebook
+from adapters.template_cache import TEMPLATE_OPTIONS, TemplateBytecodeCache
+from benchmarks.synthetic import DEFAULT_MIX, backdate_tree, write_corpus
+from scripts.convert_notebook import convert_notebooks
+from scripts.generate_metadata import scan_launchables, update_launchables
+
+TEMPLATES_DIR = Path(__file__).parent.parent / 'templates'
+
+DEFAULT_SCALES = (10, 1_000, 10_000)
+
+RESULTS_FORMAT_VERSION = 1
+
+
+def best_time(func: Callable[[], Any], repeat: int) -> float:
+    """
+    Time a callable, keeping the best of several runs.
+
+    Args:
+        func: Callable to time
+        repeat: Number of runs
+
+    Returns:
+        Fastest run in seconds
+    """
+    best = float('inf')
+    # Collector pauses are the largest source of run-to-run noise
+    gc.collect()
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return best
+
+
+def calibrate(repeat: int = 20) -> float:
+    """
+    Time a fixed string/regex workload to gauge the speed of this machine.
+
+    Comparing results from two runs relative to their calibration times
+    cancels out most of the difference between machines (or a busy one).
+
+    Args:
+        repeat: Runs (best time is kept)
+
+    Returns:
+        Fastest run in seconds
+    """
+    text = '\n'.join(
+        f'model_{i} = FastLanguageModel.from_pretrained("unsloth/model-{i}", load_in_4bit = True)'
+        for i in range(200)
+    )
+    pattern = re.compile(r'from_pretrained\(\s*"([^"]+)"')
+
+    def workload():
+        for _ in range(50):
+            pattern.sub(r'from_pretrained("\1", device_map="auto"', text)
+            text.lower().count('colab')
+            sorted(text.split())
+
+    return best_time(workload, repeat)
+
+
+def peak_rss_mb() -> Optional[float]:
+    """
+    Get this process's peak resident set size.
+
+    Returns:
+        Peak RSS in MiB, or None where the platform does not report it
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def load_templates(bytecode_cache: Optional[TemplateBytecodeCache] = None) -> list:
+    """Load the companion-file templates into a fresh environment."""
+    env = Environment(
+        loader=FileSystemLoader(str(TEMPLATES_DIR)),
+        bytecode_cache=bytecode_cache,
+        **TEMPLATE_OPTIONS
+    )
+    return [env.get_template(name) for name in TEMPLATE_NAMES]
+
+
+def bench_template_loading(cache_dir: Path, repeat: int) -> Dict[str, float]:
+    """
+    Time loading the templates, compiled from source and from the bytecode cache.
+
+    Args:
+        cache_dir: Scratch directory for the bytecode cache
+        repeat: Runs per variant (best time is kept)
+
+    Returns:
+        Milliseconds per load, keyed 'compile' and 'bytecode_cache'
+    """
+    load_templates(TemplateBytecodeCache(cache_dir))  # Populate the cache
+    return {
+        'compile': best_time(load_templates, repeat) * 1000,
+        'bytecode_cache': best_time(lambda: load_templates(TemplateBytecodeCache(cache_dir)), repeat) * 1000,
+    }
+
+
+def bench_scale(
+    work_dir: Path,
+    total_cells: int,
+    cells_per_notebook: int,
+    cell_length: int,
+    repeat: int
+) -> List[Dict[str, Any]]:
+    """
+    Run every benchmark on one corpus size.
+
+    Args:
+        work_dir: Scratch directory for the corpus and converted output
+        total_cells: Total cells in the corpus
+        cells_per_notebook: Maximum cells per notebook
+        cell_length: Approximate characters per cell
+        repeat: Runs per benchmark (best time is kept)
+
+    Returns:
+        Result records with name, scale, seconds, per-cell and
+        per-launchable microseconds
+    """
+    notebooks = write_corpus(work_dir / 'nb', total_cells, cells_per_notebook, cell_length)
+    configs = [get_config_for_notebook(path.stem) for path in notebooks]
+    session = AdapterSession(TEMPLATES_DIR)
+    adapter = session.adapter
+
+    # Cells grouped by type, as the conversions see them
+    cells_by_type: Dict[str, List[str]] = {}
+    for path in notebooks:
+        for cell in read_notebook(path)['cells']:
+            cells_by_type.setdefault(cell['cell_type'], []).append(cell['source'])
+    config = configs[0]
+
+    timings: Dict[str, float] = {}
+
+    def adapt_all():
+        for path, notebook_config in zip(notebooks, configs):
+            adapter.adapt(path, notebook_config)
+
+    timings['adapt'] = best_time(adapt_all, repeat)
+
+    def pipeline_all():
+        for cell_type, sources in cells_by_type.items():
+            for source in sources:
+                adapter._apply_conversions(source, config, cell_type)
+
+    timings['conversions.pipeline'] = best_time(pipeline_all, repeat)
+
+    # Each conversion on every cell in its scope, without trigger prefiltering
+    for name, func in adapter.conversions.items():
+        scoped = [
+            source
+            for cell_type in adapter.conversion_scopes[name]
+            for source in cells_by_type.get(cell_type, [])
+        ]
+
+        def run_conversion(func=func, scoped=scoped):
+            for source in scoped:
+                func(source, config)
+
+        timings[f'conversion.{name}'] = best_time(run_conversion, repeat)
+
+    # Each timed run starts with an empty render memo, as a conversion run does
+    def render_companions():
+        adapter._rendered.clear()
+        for path, notebook_config in zip(notebooks, configs):
+            adapter.generate_companion_files(path, notebook_config)
+
+    timings['companion_files'] = best_time(render_companions, repeat)
+
+    def render_templates():
+        adapter._rendered.clear()
+        for notebook_config in configs:
+            adapter._generate_requirements(notebook_config)
+            adapter._generate_setup_script(notebook_config)
+            adapter._generate_docker_compose(notebook_config)
+            adapter._generate_readme(notebook_config)
+
+    timings['templates.render'] = best_time(render_templates, repeat)
+
+    output_dir = work_dir / 'converted'
+    convert_notebooks(notebooks, output_dir, TEMPLATES_DIR)
+    timings['scan_launchables'] = best_time(lambda: scan_launchables(output_dir), repeat)
+
+    backdate_tree(output_dir)
+    launchables, directories, _ = update_launchables(output_dir, [], {})
+    timings['scan_launchables.incremental'] = best_time(
+        lambda: update_launchables(output_dir, launchables, directories), repeat
+    )
+
+    return [
+        {
+            'name': name,
+            'scale': total_cells,
+            'notebooks': len(notebooks),
+            'seconds': seconds,
+            'per_cell_us': seconds / total_cells * 1e6,
+            'per_launchable_us': seconds / len(notebooks) * 1e6,
+        }
+        for name, seconds in timings.items()
+    ]
+
+
+def run_suite(
+    scales: Iterable[int] = DEFAULT_SCALES,
+    cells_per_notebook: int = 100,
+    cell_length: int = 200,
+    repeat: int = 3,
+    verbose: bool = True
+) -> Dict[str, Any]:
+    """
+    Run the benchmarks at every scale.
+
+    Args:
+        scales: Total cell counts to benchmark
+        cells_per_notebook: Maximum cells per notebook
+        cell_length: Approximate characters per cell
+        repeat: Runs per benchmark (best time is kept)
+        verbose: Print each result as it is measured
+
+    Returns:
+        Report with run metadata, result records, template load times and
+        the peak RSS
+    """
+    # Calibrate before and after so a transient slowdown does not skew it
+    calibration = calibrate()
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for scale in scales:
+            scale_results = bench_scale(
+                Path(tmp) / str(scale), scale, cells_per_notebook, cell_length, repeat
+            )
+            results.extend(scale_results)
+            if verbose:
+                for result in scale_results:
+                    print(
+                        f"{result['name'] + ' @ ' + str(scale):<48}"
+                        f"{result['seconds'] * 1000:>10.2f} ms{result['per_cell_us']:>10.2f} µs/cell"
+                        f"{result['per_launchable_us']:>12.1f} µs/launchable"
+                    )
+        template_load_ms = bench_template_loading(Path(tmp) / 'template_cache', repeat)
+        if verbose:
+            for variant, ms in template_load_ms.items():
+                print(f"{'templates.load (' + variant + ')':<48}{ms:>10.2f} ms")
+
+    return {
+        'version': RESULTS_FORMAT_VERSION,
+        'meta': {
+            'adapter_version': __version__,
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'created_at': datetime.now(timezone.utc).isoformat(),
+            'cells_per_notebook': cells_per_notebook,
+            'cell_length': cell_length,
+            'mix': DEFAULT_MIX,
+            'repeat': repeat,
+        },
+        'calibration_seconds': min(calibration, calibrate()),
+        'template_load_ms': template_load_ms,
+        'peak_rss_mb': peak_rss_mb(),
+        'results': results,
+    }
+
+
+def main():
+    """Run the benchmark suite and write the results file."""
+    parser = argparse.ArgumentParser(description='Benchmark the adapter on synthetic notebooks')
+    parser.add_argument(
+        '--scales',
+        type=int,
+        nargs='+',
+        default=list(DEFAULT_SCALES),
+        help='Total cell counts to benchmark (default: 10 1000 10000)'
+    )
+    parser.add_argument('--cells-per-notebook', type=int, default=100, help='Maximum cells per notebook')
+    parser.add_argument('--cell-length', type=int, default=200, help='Approximate characters per cell')
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per benchmark (best time is kept)')
+    parser.add_argument(
+        '--output',
+        type=Path,
+        default=Path('benchmark_results.json'),
+        help='Where to write the JSON results (default: benchmark_results.json)'
+    )
+    args = parser.parse_args()
+
+    # The adapter logs every notebook and launchable at INFO
+    logging.disable(logging.INFO)
+
+    report = run_suite(args.scales, args.cells_per_notebook, args.cell_length, args.repeat)
+    args.output.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.output, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+        f.write('\n')
+    print(f"Results written to {args.output}")
+
+
+if __name__ == '__main__':
+    main()
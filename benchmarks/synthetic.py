@@ -0,0 +1,238 @@
+"""
+Synthetic Colab-style notebook corpus for benchmarks.
+
+Notebooks are generated deterministically from a seed, with a configurable
+cell count, cell length and mix of the cell kinds the conversions target.
+"""
+
+import math
+import os
+import random
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import nbformat
+from nbformat.v4 import new_code_cell, new_markdown_cell, new_notebook
+
+# Default fraction of cells of each targeted kind; the rest are plain
+# code and markdown cells that no conversion changes
+DEFAULT_MIX = {
+    'magic': 0.10,
+    'pip': 0.05,
+    'colab_link': 0.05,
+    'from_pretrained': 0.10,
+}
+
+# Share of plain (untargeted) cells that are code rather than markdown
+PLAIN_CODE_SHARE = 0.6
+
+_MAGIC_CELLS = [
+    '!nvidia-smi',
+    '%%capture\nimport os\nif "COLAB_" not in "".join(os.environ.keys()):\n    !pip install unsloth\nelse:\n    !pip install --no-deps bitsandbytes accelerate xformers peft trl\n    !pip install --no-deps unsloth',
+    '!ls /content/outputs\n%env TOKENIZERS_PARALLELISM=false',
+    'gpu_stats = torch.cuda.get_device_properties(0)\nprint(f"GPU = {gpu_stats.name}.")',
+]
+
+_PIP_CELLS = [
+    '!pip install unsloth',
+    '%pip install --upgrade transformers==4.56.2 trl==0.22.2',
+    '!pip install --no-deps xformers "trl<0.9.0" peft accelerate bitsandbytes',
+]
+
+_COLAB_LINK_CELLS = [
+    '<a href="https://colab.research.google.com/github/unslothai/notebooks/blob/main/nb/Sample.ipynb">'
+    '<img src="https://colab.research.google.com/assets/colab-badge.svg"></a>',
+    'To run this, press "*Runtime*" and press "*Run all*" on a **free** Tesla T4 Google Colab instance!',
+    'Some other links:\n1. Train your own reasoning model - [Llama GRPO notebook](https://colab.research.google.com/github/unslothai/notebooks/blob/main/nb/Llama3.1_(8B)-GRPO.ipynb)\n2. Saving finetunes to Ollama.',
+    'from google.colab import drive\ndrive.mount("/content/drive")',
+]
+
+_FROM_PRETRAINED_CELLS = [
+    'model, tokenizer = FastLanguageModel.from_pretrained(\n    model_name = "unsloth/Llama-3.2-3B-Instruct",\n    max_seq_length = 2048,\n    load_in_4bit = True,\n)',
+    'args = SFTConfig(\n    per_device_train_batch_size = 2,\n    gradient_accumulation_steps = 4,\n    output_dir = "outputs",\n)',
+    'outputs = model.generate(**inputs, max_new_tokens = 64, use_cache = True)\ntokenizer.batch_decode(outputs)',
+]
+
+_PLAIN_CODE_LINES = [
+    'dataset = dataset.map(formatting_prompts_func, batched = True)',
+    'trainer_stats = trainer.train()',
+    'used_memory = round(torch.cuda.max_memory_reserved() / 1024 / 1024 / 1024, 3)',
+    'messages = [{"role": "user", "content": "Continue the fibonacci sequence: 1, 1, 2, 3, 5, 8,"}]',
+    'print(f"{trainer_stats.metrics[\'train_runtime\']} seconds used for training.")',
+]
+
+_PLAIN_MARKDOWN_LINES = [
+    '### Data Prep',
+    'We now use the `Alpaca` dataset from [yahma](https://huggingface.co/datasets/yahma/alpaca-cleaned).',
+    'Let\'s run the model! You can change the instruction and input - leave the output blank!',
+    '<a name="Save"></a>\n### Saving, loading finetuned models',
+    'Now let\'s use Huggingface TRL\'s `SFTTrainer`! More docs here.',
+]
+
+
+# Cells that make backtracking regexes go quadratic or worse: many partial
+# matches of a rewrite pattern that never (or only at the very end) complete.
+# Each entry is (cell_type, prefix, repeated unit, suffix).
+ADVERSARIAL_CELLS = {
+    'runtime_instructions': (
+        'markdown',
+        'To run this, press "*Runtime*" and press "*Run all*" on Colab ',
+        'Colab ',
+        '',
+    ),
+    'runtime_press_run_all': ('markdown', '', 'press "Runtime" ', '\nRun all on Colab'),
+    'colab_links_section': ('markdown', '', 'Some other links: ', 'Free'),
+    'colab_drive_link': ('markdown', '', '[', '] (https://colab.research.google.com/drive/x)'),
+    'colab_badge_linked': (
+        'markdown',
+        '',
+        '[![Open ',
+        '\n](https://colab.research.google.com/assets/colab-badge.svg)](x)',
+    ),
+    'drive_import': ('code', '', 'from google.colab import drive; ', ''),
+    'drive_mount': ('code', '', 'drive.mount("/content/drive"; ', ''),
+}
+
+
+def adversarial_cell(kind: str, size: int) -> str:
+    """
+    Build a pathological cell of roughly the given size.
+
+    Args:
+        kind: Key of ADVERSARIAL_CELLS
+        size: Approximate length in characters
+
+    Returns:
+        Cell source
+    """
+    _, prefix, unit, suffix = ADVERSARIAL_CELLS[kind]
+    repeats = max(1, (size - len(prefix) - len(suffix)) // len(unit))
+    return prefix + unit * repeats + suffix
+
+
+def _pad(source: str, lines: List[str], cell_length: int, rng: random.Random) -> str:
+    """Append filler lines until source reaches roughly cell_length characters."""
+    parts = [source]
+    length = len(source)
+    while length < cell_length:
+        line = rng.choice(lines)
+        parts.append(line)
+        length += len(line) + 1
+    return '\n'.join(parts)
+
+
+def generate_notebook(
+    cells: int,
+    cell_length: int = 200,
+    mix: Optional[Dict[str, float]] = None,
+    seed: int = 0
+) -> nbformat.NotebookNode:
+    """
+    Generate a synthetic Colab-style notebook.
+
+    Args:
+        cells: Number of cells
+        cell_length: Approximate characters per cell (cells are padded with
+            plain code or markdown lines)
+        mix: Fraction of cells of each targeted kind ('magic', 'pip',
+            'colab_link', 'from_pretrained'); defaults to DEFAULT_MIX
+        seed: Random seed
+
+    Returns:
+        Notebook
+    """
+    mix = dict(DEFAULT_MIX if mix is None else mix)
+    unknown = set(mix) - set(DEFAULT_MIX)
+    if unknown:
+        raise ValueError(f"Unknown cell kind(s) in mix: {sorted(unknown)}")
+    if sum(mix.values()) > 1:
+        raise ValueError("Cell kind fractions must sum to at most 1")
+
+    rng = random.Random(seed)
+    kinds = list(mix)
+    weights = [mix[kind] for kind in kinds]
+    plain = 1 - sum(weights)
+    kinds += ['plain_code', 'plain_markdown']
+    weights += [plain * PLAIN_CODE_SHARE, plain * (1 - PLAIN_CODE_SHARE)]
+
+    notebook_cells = []
+    for kind in rng.choices(kinds, weights=weights, k=cells):
+        if kind == 'magic':
+            cell = new_code_cell(_pad(rng.choice(_MAGIC_CELLS), _PLAIN_CODE_LINES, cell_length, rng))
+        elif kind == 'pip':
+            cell = new_code_cell(_pad(rng.choice(_PIP_CELLS), _PLAIN_CODE_LINES, cell_length, rng))
+        elif kind == 'colab_link':
+            source = rng.choice(_COLAB_LINK_CELLS)
+            if source.startswith('from google.colab'):
+                cell = new_code_cell(_pad(source, _PLAIN_CODE_LINES, cell_length, rng))
+            else:
+                cell = new_markdown_cell(_pad(source, _PLAIN_MARKDOWN_LINES, cell_length, rng))
+        elif kind == 'from_pretrained':
+            cell = new_code_cell(_pad(rng.choice(_FROM_PRETRAINED_CELLS), _PLAIN_CODE_LINES, cell_length, rng))
+        elif kind == 'plain_code':
+            cell = new_code_cell(_pad(rng.choice(_PLAIN_CODE_LINES), _PLAIN_CODE_LINES, cell_length, rng))
+        else:
+            cell = new_markdown_cell(_pad(rng.choice(_PLAIN_MARKDOWN_LINES), _PLAIN_MARKDOWN_LINES, cell_length, rng))
+        # Deterministic ids keep generated corpora byte-identical per seed
+        cell.id = f'cell-{len(notebook_cells)}'
+        notebook_cells.append(cell)
+
+    return new_notebook(cells=notebook_cells)
+
+
+def write_corpus(
+    target_dir: Path,
+    total_cells: int,
+    cells_per_notebook: int = 100,
+    cell_length: int = 200,
+    mix: Optional[Dict[str, float]] = None,
+    seed: int = 0
+) -> List[Path]:
+    """
+    Write a synthetic corpus with a given total number of cells.
+
+    Args:
+        target_dir: Directory to write notebooks into
+        total_cells: Total cells across the corpus
+        cells_per_notebook: Maximum cells per notebook
+        cell_length: Approximate characters per cell
+        mix: Fraction of cells of each targeted kind (see generate_notebook)
+        seed: Random seed
+
+    Returns:
+        List of notebook paths
+    """
+    target_dir = Path(target_dir)
+    target_dir.mkdir(parents=True, exist_ok=True)
+    count = max(1, math.ceil(total_cells / cells_per_notebook))
+    paths = []
+    remaining = total_cells
+    for index in range(count):
+        cells = min(cells_per_notebook, remaining)
+        remaining -= cells
+        notebook = generate_notebook(cells, cell_length, mix, seed=seed * 1_000_003 + index)
+        path = target_dir / f'Synthetic-{index:05d}.ipynb'
+        with open(path, 'w', encoding='utf-8') as f:
+            nbformat.write(notebook, f)
+        paths.append(path)
+    return paths
+
+
+def backdate_tree(root: Path, seconds: float = 3600) -> None:
+    """
+    Set the modification time of a tree and everything in it to the past.
+
+    Makes a freshly written tree look like the output of an earlier run, as
+    generate_metadata --incremental sees it in practice; it does not trust
+    modification times from the last few seconds.
+
+    Args:
+        root: Directory to backdate
+        seconds: How far in the past to move the times
+    """
+    past = time.time_ns() - int(seconds * 1e9)
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            os.utime(os.path.join(dirpath, name), ns=(past, past))
+        os.utime(dirpath, ns=(past, past))
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Build the pre-indexed model registry.
+
+Reads adapters/data/model_configs.json and writes the compact index loaded
+by adapters.model_configs (keys, records, resolved upstream notebook stems
+and the fuzzy-match tables). Re-run it after editing the registry; a stale
+index is ignored at load time, so lookups stay correct but pay for indexing.
+
+Usage:
+    python build_config_index.py
+    python build_config_index.py --check
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adapters.model_configs import REGISTRY_INDEX_PATH, REGISTRY_PATH, build_registry_index
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+
+def render_index(source_path: Path) -> str:
+    """
+    Build the index for a registry file and serialize it.
+
+    Args:
+        source_path: Registry JSON
+
+    Returns:
+        Compact JSON text of the index
+    """
+    index = build_registry_index(source_path)
+    return json.dumps(index, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+def main():
+    """Main entry point."""
+    parser = argparse.ArgumentParser(description='Build the pre-indexed model registry')
+    parser.add_argument(
+        '--source',
+        type=Path,
+        default=REGISTRY_PATH,
+        help='Registry JSON (default: adapters/data/model_configs.json)'
+    )
+    parser.add_argument(
+        '--output',
+        type=Path,
+        default=REGISTRY_INDEX_PATH,
+        help='Index file to write (default: adapters/data/model_configs.index.json)'
+    )
+    parser.add_argument(
+        '--check',
+        action='store_true',
+        help='Exit non-zero if the index is out of date instead of writing it'
+    )
+    args = parser.parse_args()
+
+    try:
+        rendered = render_index(args.source)
+    except (OSError, ValueError) as e:
+        logger.error(f"Could not index {args.source}: {e}")
+        sys.exit(1)
+
+    current = args.output.read_text(encoding='utf-8') if args.output.exists() else None
+    if args.check:
+        if current != rendered:
+            logger.error(f"{args.output} is out of date; run scripts/build_config_index.py")
+            sys.exit(1)
+        logger.info(f"{args.output} is up to date")
+        return
+
+    if current == rendered:
+        logger.info(f"{args.output} is already up to date")
+        return
+    args.output.write_text(rendered, encoding='utf-8')
+    logger.info(f"Wrote {args.output} ({len(rendered):,} bytes)")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,384 @@
+#!/usr/bin/env python3
+"""
+Benchmark regression gate.
+
+Runs the adapter benchmark suite (or reads a results file), compares the
+tracked metrics against a committed baseline and exits non-zero when any of
+them regressed beyond the tolerance.
+
+Usage:
+    python check_benchmarks.py
+    python check_benchmarks.py --tolerance 0.5
+    python check_benchmarks.py --results benchmark_results.json
+    python check_benchmarks.py --update-baseline
+"""
+
+import argparse
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.run_benchmarks import run_suite
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger(__name__)
+
+DEFAULT_BASELINE = Path(__file__).parent.parent / 'benchmarks' / 'baseline.json'
+
+# Corpus sizes the gate runs; the 10-cell scale is too noisy to gate on
+GATE_SCALES = (1_000, 10_000)
+
+BASELINE_FORMAT_VERSION = 1
+
+# Noise floor cap relative to the baseline value; below the default
+# tolerance, so sub-µs metrics are gated by the tolerance alone
+DEFAULT_NOISE_FLOOR_FRACTION = 0.2
+
+# Benchmarks reported as µs/cell (adapt is tracked as notebooks/sec instead)
+_PER_CELL_PREFIXES = ('conversion.', 'conversions.', 'companion_files', 'scan_launchables')
+
+
+def tracked_metrics(
+    report: Dict[str, Any],
+    speed_factor: float = 1.0
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Derive the gated metrics from a benchmark report.
+
+    Args:
+        report: Report produced by benchmarks.run_benchmarks.run_suite()
+        speed_factor: How much faster the baseline machine is than this one
+            (baseline calibration time / current calibration time); timings
+            are scaled by it so they are comparable with the baseline
+
+    Returns:
+        Mapping of metric name to {'value', 'unit', 'higher_is_better'}
+    """
+    metrics = {}
+    for result in report['results']:
+        scale = result['scale']
+        if result['name'] == 'adapt':
+            metrics[f'adapt.notebooks_per_sec@{scale}'] = {
+                'value': result['notebooks'] / (result['seconds'] * speed_factor) if result['seconds'] else 0.0,
+                'unit': 'nb/s',
+                'higher_is_better': True,
+            }
+            metrics[f'adapt.us_per_cell@{scale}'] = {
+                'value': result['per_cell_us'] * speed_factor,
+                'unit': 'µs/cell',
+                'higher_is_better': False,
+            }
+        elif result['name'].startswith(_PER_CELL_PREFIXES):
+            metrics[f"{result['name']}.us_per_cell@{scale}"] = {
+                'value': result['per_cell_us'] * speed_factor,
+                'unit': 'µs/cell',
+                'higher_is_better': False,
+            }
+    if report.get('peak_rss_mb') is not None:
+        metrics['peak_rss_mb'] = {
+            'value': report['peak_rss_mb'],
+            'unit': 'MiB',
+            'higher_is_better': False,
+        }
+    return metrics
+
+
+def best_of_reports(reports: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """
+    Combine several runs of the suite, keeping each benchmark's fastest time.
+
+    Rounds are spread over time, so a burst of load on the machine has to
+    last the whole check to skew a metric.
+
+    Args:
+        reports: Reports from run_suite()
+
+    Returns:
+        Report with the best time per benchmark, the lowest calibration time
+        and the highest peak RSS
+    """
+    best: Dict[Tuple[str, int], Dict[str, Any]] = {}
+    for report in reports:
+        for result in report['results']:
+            key = (result['name'], result['scale'])
+            if key not in best or result['seconds'] < best[key]['seconds']:
+                best[key] = result
+    calibrations = [r['calibration_seconds'] for r in reports if r.get('calibration_seconds')]
+    peaks = [r['peak_rss_mb'] for r in reports if r.get('peak_rss_mb') is not None]
+    return dict(
+        reports[0],
+        results=list(best.values()),
+        calibration_seconds=min(calibrations) if calibrations else None,
+        peak_rss_mb=max(peaks) if peaks else None
+    )
+
+
+def compare_metrics(
+    baseline: Dict[str, Dict[str, Any]],
+    current: Dict[str, Dict[str, Any]],
+    tolerance: float,
+    noise_floor_us: float,
+    noise_floor_fraction: float = DEFAULT_NOISE_FLOOR_FRACTION
+) -> List[Dict[str, Any]]:
+    """
+    Compare current metrics against the baseline.
+
+    A metric regresses when it is worse than the baseline by more than
+    ``tolerance`` (a fraction). Per-cell timings must also change by more
+    than a noise floor so timer jitter does not fail the gate: the floor is
+    ``noise_floor_us``, capped at ``noise_floor_fraction`` of the baseline
+    value so metrics well under 1 µs/cell are still gated.
+
+    Args:
+        baseline: Baseline metrics from tracked_metrics()
+        current: Current metrics from tracked_metrics()
+        tolerance: Allowed relative slowdown (0.35 = 35%)
+        noise_floor_us: Largest absolute µs/cell change ignored as noise
+        noise_floor_fraction: Cap on the noise floor, as a fraction of the
+            baseline value
+
+    Returns:
+        One row per metric present in either set, with baseline, current,
+        relative change and status ('ok', 'regressed', 'improved', 'new', 'missing')
+    """
+    rows = []
+    for name in sorted(set(baseline) | set(current)):
+        base = baseline.get(name)
+        cur = current.get(name)
+        row = {
+            'name': name,
+            'unit': (cur or base)['unit'],
+            'baseline': base['value'] if base else None,
+            'current': cur['value'] if cur else None,
+            'change': None,
+        }
+        if base is None:
+            row['status'] = 'new'
+        elif cur is None:
+            row['status'] = 'missing'
+        else:
+            higher_is_better = base['higher_is_better']
+            change = (cur['value'] - base['value']) / base['value'] if base['value'] else 0.0
+            row['change'] = change
+            worse = -change if higher_is_better else change
+            noise_floor = min(noise_floor_us, noise_floor_fraction * base['value'])
+            significant = row['unit'] != 'µs/cell' or abs(cur['value'] - base['value']) > noise_floor
+            if worse > tolerance and significant:
+                row['status'] = 'regressed'
+            elif worse < -tolerance and significant:
+                row['status'] = 'improved'
+            else:
+                row['status'] = 'ok'
+        rows.append(row)
+    return rows
+
+
+def format_table(rows: List[Dict[str, Any]]) -> List[str]:
+    """
+    Format comparison rows as a delta table.
+
+    Args:
+        rows: Rows from compare_metrics()
+
+    Returns:
+        Table lines
+    """
+    def value(v: Optional[float]) -> str:
+        return '-' if v is None else f'{v:.2f}'
+
+    width = max([len('Metric')] + [len(row['name']) for row in rows])
+    lines = [f"{'Metric':<{width}}  {'Baseline':>10}  {'Current':>10}  {'Unit':<8}{'Change':>9}  Status"]
+    for row in rows:
+        change = '-' if row['change'] is None else f"{row['change']:+.1%}"
+        lines.append(
+            f"{row['name']:<{width}}  {value(row['baseline']):>10}  {value(row['current']):>10}  "
+            f"{row['unit']:<8}{change:>9}  {row['status']}"
+        )
+    return lines
+
+
+def load_baseline(path: Path) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Load a committed baseline.
+
+    Args:
+        path: Baseline JSON file
+
+    Returns:
+        Tuple of (benchmark settings, baseline data with 'metrics' and
+        'calibration_seconds')
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get('version') != BASELINE_FORMAT_VERSION:
+        raise ValueError(f"Unsupported baseline version in {path}: {data.get('version')}")
+    return data['settings'], data
+
+
+def save_baseline(path: Path, report: Dict[str, Any], settings: Dict[str, Any]) -> None:
+    """
+    Write a new baseline from a benchmark report.
+
+    Args:
+        path: Baseline JSON file
+        report: Report produced by run_suite()
+        settings: Benchmark settings the report was produced with
+    """
+    data = {
+        'version': BASELINE_FORMAT_VERSION,
+        'meta': report['meta'],
+        'settings': settings,
+        'calibration_seconds': report.get('calibration_seconds'),
+        'metrics': tracked_metrics(report),
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+        f.write('\n')
+
+
+def main():
+    """Main benchmark gate script."""
+    parser = argparse.ArgumentParser(
+        description='Fail when adapter benchmarks regress against the committed baseline'
+    )
+    parser.add_argument(
+        '--baseline',
+        type=Path,
+        default=DEFAULT_BASELINE,
+        help='Baseline JSON (default: benchmarks/baseline.json)'
+    )
+    parser.add_argument(
+        '--results',
+        type=Path,
+        help='Compare an existing run_benchmarks.py results file instead of running the suite'
+    )
+    parser.add_argument(
+        '--tolerance',
+        type=float,
+        default=0.35,
+        help='Allowed relative regression per metric (default: 0.35 = 35%%)'
+    )
+    parser.add_argument(
+        '--noise-floor-us',
+        type=float,
+        default=1.0,
+        help='Ignore per-cell timing changes smaller than this many µs (default: 1.0)'
+    )
+    parser.add_argument(
+        '--noise-floor-fraction',
+        type=float,
+        default=DEFAULT_NOISE_FLOOR_FRACTION,
+        help='Cap the noise floor at this fraction of the baseline value (default: 0.2)'
+    )
+    parser.add_argument('--repeat', type=int, default=3, help='Runs per benchmark per round (best time is kept)')
+    parser.add_argument(
+        '--rounds',
+        type=int,
+        default=3,
+        help='Times to run the whole suite (best time per benchmark is kept)'
+    )
+    parser.add_argument(
+        '--no-normalize',
+        action='store_true',
+        help='Compare raw timings instead of scaling them by the machine calibration run'
+    )
+    parser.add_argument(
+        '--update-baseline',
+        action='store_true',
+        help='Run the suite and overwrite the baseline with the results'
+    )
+    parser.add_argument(
+        '--report',
+        type=Path,
+        help='Also write the comparison rows as JSON'
+    )
+
+    args = parser.parse_args()
+
+    if args.tolerance < 0:
+        logger.error("--tolerance must not be negative")
+        sys.exit(2)
+
+    # Benchmark the same corpus the baseline was recorded on
+    settings = {
+        'scales': list(GATE_SCALES),
+        'cells_per_notebook': 100,
+        'cell_length': 200,
+    }
+    baseline = None
+    if not args.update_baseline:
+        if not args.baseline.exists():
+            logger.error(f"Baseline not found: {args.baseline} (create it with --update-baseline)")
+            sys.exit(2)
+        settings, baseline = load_baseline(args.baseline)
+
+    if args.results:
+        with open(args.results, 'r', encoding='utf-8') as f:
+            report = json.load(f)
+    else:
+        logger.info(f"Running benchmarks at {', '.join(map(str, settings['scales']))} cells")
+        # The adapter logs every notebook and launchable at INFO
+        logging.getLogger('adapters').setLevel(logging.WARNING)
+        logging.getLogger('scripts').setLevel(logging.WARNING)
+        logging.getLogger('__main__').setLevel(logging.INFO)
+        report = best_of_reports([
+            run_suite(
+                settings['scales'],
+                settings['cells_per_notebook'],
+                settings['cell_length'],
+                args.repeat,
+                verbose=False
+            )
+            for _ in range(max(1, args.rounds))
+        ])
+
+    if args.update_baseline:
+        save_baseline(args.baseline, report, settings)
+        logger.info(f"Baseline written to: {args.baseline}")
+        sys.exit(0)
+
+    # Scale timings by how fast this machine ran the calibration workload
+    speed_factor = 1.0
+    if not args.no_normalize and baseline.get('calibration_seconds') and report.get('calibration_seconds'):
+        speed_factor = baseline['calibration_seconds'] / report['calibration_seconds']
+        logger.info(f"Normalizing timings by machine speed factor {speed_factor:.2f}")
+
+    rows = compare_metrics(
+        baseline['metrics'],
+        tracked_metrics(report, speed_factor),
+        args.tolerance,
+        args.noise_floor_us,
+        args.noise_floor_fraction
+    )
+    for line in format_table(rows):
+        print(line)
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, indent=2)
+
+    regressed = [row['name'] for row in rows if row['status'] == 'regressed']
+    missing = [row['name'] for row in rows if row['status'] == 'missing']
+    if missing:
+        logger.warning(f"{len(missing)} baseline metric(s) not measured: {', '.join(missing)}")
+    if regressed:
+        logger.error(
+            f"{len(regressed)} metric(s) regressed by more than {args.tolerance:.0%}: "
+            f"{', '.join(regressed)}"
+        )
+        sys.exit(1)
+    logger.info(f"No regressions beyond {args.tolerance:.0%} ({len(rows)} metric(s) checked)")
+
+
+if __name__ == '__main__':
+    main()
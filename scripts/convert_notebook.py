@@ -5,20 +5,31 @@ Convert Unsloth Colab notebooks to Brev-compatible format.
 Usage:
     python convert_notebook.py --source <path> --output <path>
     python convert_notebook.py --changed-file changes.txt --source <path> --output <path>
+    python convert_notebook.py --source <path> --output <path> --jobs auto
 """
 
 import argparse
+import importlib.util
 import json
 import logging
+import os
 import sys
+from collections import Counter
+from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-
-import nbformat
+from typing import Dict, List, Optional, Tuple
 
 # Add parent directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from adapters import ColabToBrevAdapter, get_config_for_notebook
+from adapters import AdapterSession, get_config_for_notebook
+from adapters.build_time import DEFAULT_LAST_SYNC_PATH, resolve_build_time
+from adapters.cell_cache import DEFAULT_MAX_ENTRIES, CellCache, default_cache_dir
+from adapters.manifest import ConversionManifest
+from adapters.notebook_io import validate_notebooks
+from adapters.profiler import ConversionProfiler
 
 # Configure logging
 logging.basicConfig(
@@ -27,11 +38,15 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Adapter session owned by a pool worker process (see _init_worker)
+_worker_session: Optional[AdapterSession] = None
+
 
 def convert_single_notebook(
     notebook_path: Path,
     output_dir: Path,
-    templates_dir: Path
+    templates_dir: Path,
+    session: Optional[AdapterSession] = None
 ) -> bool:
     """
     Convert a single notebook.
@@ -40,6 +55,7 @@ def convert_single_notebook(
         notebook_path: Path to source notebook
         output_dir: Base output directory
         templates_dir: Path to Jinja2 templates
+        session: Warm adapter session to reuse (a new one is created if omitted)
 
     Returns:
         True if successful, False otherwise
@@ -51,11 +67,12 @@ def convert_single_notebook(
         config = get_config_for_notebook(notebook_path.stem)
         logger.info(f"Using config: {config['launchable_name']}")
         
-        # Create adapter
-        adapter = ColabToBrevAdapter(templates_dir)
+        # Reuse the run's adapter session when one is provided
+        if session is None:
+            session = AdapterSession(templates_dir)
         
         # Adapt notebook
-        adapted_notebook, companion_files = adapter.adapt(notebook_path, config)
+        adapted_notebook, companion_files = session.adapt(notebook_path, config)
         
         # Create output directory for this launchable
         launchable_dir = output_dir / config['launchable_name']
@@ -63,16 +80,18 @@ def convert_single_notebook(
         
         # Save adapted notebook with original filename
         notebook_output = launchable_dir / notebook_path.name
-        with open(notebook_output, 'w', encoding='utf-8') as f:
-            nbformat.write(adapted_notebook, f)
-        logger.info(f"Saved notebook to: {notebook_output}")
+        if session.write_notebook(adapted_notebook, notebook_output):
+            logger.info(f"Saved notebook to: {notebook_output}")
+        else:
+            logger.info(f"Notebook unchanged: {notebook_output}")
         
-        # Save companion files
-        for filename, content in companion_files.items():
+        # Save companion files (once per launchable when notebooks share one)
+        for filename, written in session.write_companion_files(launchable_dir, companion_files).items():
             file_path = launchable_dir / filename
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            logger.info(f"Saved companion file: {file_path}")
+            if written:
+                logger.info(f"Saved companion file: {file_path}")
+            else:
+                logger.debug(f"Companion file unchanged: {file_path}")
         
         logger.info(f"✓ Successfully converted: {notebook_path.name}")
         return True
@@ -82,6 +101,191 @@ def convert_single_notebook(
         return False
 
 
+def parse_jobs(value: str) -> int:
+    """
+    Parse the --jobs argument.
+
+    Args:
+        value: A positive integer, or 'auto' to size the pool from available cores
+
+    Returns:
+        Number of worker processes to use
+    """
+    if value == 'auto':
+        return available_cpu_count()
+
+    try:
+        jobs = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"--jobs must be a positive integer or 'auto', got {value!r}")
+
+    if jobs < 1:
+        raise argparse.ArgumentTypeError(f"--jobs must be at least 1, got {jobs}")
+    return jobs
+
+
+def available_cpu_count() -> int:
+    """
+    Count the CPU cores this process is allowed to run on.
+
+    Returns:
+        Number of usable cores (at least 1)
+    """
+    # sched_getaffinity respects cgroup/taskset limits on CI runners
+    if hasattr(os, 'sched_getaffinity'):
+        return max(1, len(os.sched_getaffinity(0)))
+    return max(1, os.cpu_count() or 1)
+
+
+def _open_cell_cache(cache_dir: Optional[Path]) -> Optional[CellCache]:
+    """Open the cell cache, or return None when caching is disabled."""
+    if cache_dir is None:
+        return None
+    return CellCache(cache_dir)
+
+
+def _template_cache_dir(cache_dir: Optional[Path]) -> Optional[Path]:
+    """Get the template bytecode cache directory, or None when caching is disabled."""
+    if cache_dir is None:
+        return None
+    return Path(cache_dir) / 'templates'
+
+
+def _init_worker(
+    templates_dir: Path,
+    cache_dir: Optional[Path],
+    fast_io: bool,
+    build_time: Optional[datetime],
+    profile: bool,
+    code_backend: str
+) -> None:
+    """Build the adapter session once per pool worker process."""
+    global _worker_session
+    _worker_session = AdapterSession(
+        templates_dir,
+        cell_cache=_open_cell_cache(cache_dir),
+        fast_io=fast_io,
+        build_time=build_time,
+        profiler=ConversionProfiler() if profile else None,
+        code_backend=code_backend,
+        template_cache_dir=_template_cache_dir(cache_dir)
+    )
+
+
+def _convert_in_worker(
+    notebook_paths: List[Path],
+    output_dir: Path,
+    templates_dir: Path
+) -> Tuple[List[bool], Counter, Counter]:
+    """Convert a launchable's notebooks with the worker's warm adapter session."""
+    results = [
+        convert_single_notebook(notebook_path, output_dir, templates_dir, session=_worker_session)
+        for notebook_path in notebook_paths
+    ]
+    profiler = _worker_session.adapter.profiler
+    return results, _worker_session.drain_stats(), profiler.drain() if profiler else Counter()
+
+
+def group_by_launchable(notebooks: List[Path]) -> List[List[int]]:
+    """
+    Group notebooks that are converted into the same launchable directory.
+
+    Args:
+        notebooks: Notebooks to convert
+
+    Returns:
+        Lists of indices into ``notebooks``, in order of first appearance
+    """
+    groups: Dict[str, List[int]] = {}
+    for index, notebook_path in enumerate(notebooks):
+        launchable = get_config_for_notebook(notebook_path.stem)['launchable_name']
+        groups.setdefault(launchable, []).append(index)
+    return list(groups.values())
+
+
+def convert_notebooks(
+    notebooks: List[Path],
+    output_dir: Path,
+    templates_dir: Path,
+    jobs: int = 1,
+    cache_dir: Optional[Path] = None,
+    fast_io: bool = False,
+    build_time: Optional[datetime] = None,
+    profiler: Optional[ConversionProfiler] = None,
+    code_backend: str = 'regex'
+) -> Tuple[List[bool], Counter]:
+    """
+    Convert a batch of notebooks, optionally on a process pool.
+
+    Results are returned in the same order as ``notebooks`` regardless of
+    which worker finished first, so summaries are deterministic.
+
+    Args:
+        notebooks: Notebooks to convert
+        output_dir: Base output directory
+        templates_dir: Path to Jinja2 templates
+        jobs: Number of worker processes (1 converts serially in-process)
+        cache_dir: Directory of the persistent cell and template caches (None disables them)
+        fast_io: Use the unvalidated plain-JSON notebook reader and writer
+        build_time: Fixed timestamp for generated files (None uses the time the run started)
+        profiler: Collects per-conversion timings from every notebook, if given
+        code_backend: Backend for the Python-level code conversions ('regex' or 'cst')
+
+    Returns:
+        Tuple of (per-notebook success flags aligned with ``notebooks``,
+        aggregated adapter statistics for the run)
+    """
+    # One timestamp for the whole run, shared by every worker, so companion
+    # files render the same for every notebook of a launchable
+    build_time = build_time or datetime.now(timezone.utc)
+
+    # A launchable's notebooks go to one worker, so its warm session renders
+    # and writes the shared companion files once
+    groups = group_by_launchable(notebooks) if jobs > 1 else []
+    jobs = min(jobs, len(groups))
+    if jobs <= 1:
+        session = AdapterSession(
+            templates_dir,
+            cell_cache=_open_cell_cache(cache_dir),
+            fast_io=fast_io,
+            build_time=build_time,
+            profiler=profiler,
+            code_backend=code_backend,
+            template_cache_dir=_template_cache_dir(cache_dir)
+        )
+        try:
+            results = [
+                convert_single_notebook(notebook_path, output_dir, templates_dir, session=session)
+                for notebook_path in notebooks
+            ]
+        finally:
+            session.close()
+        return results, session.drain_stats()
+
+    logger.info(f"Converting with {jobs} worker processes")
+    convert = partial(
+        _convert_in_worker,
+        output_dir=output_dir,
+        templates_dir=templates_dir
+    )
+    with ProcessPoolExecutor(
+        max_workers=jobs,
+        initializer=_init_worker,
+        initargs=(templates_dir, cache_dir, fast_io, build_time, profiler is not None, code_backend)
+    ) as executor:
+        outcomes = executor.map(convert, [[notebooks[index] for index in group] for group in groups])
+
+        results: List[bool] = [False] * len(notebooks)
+        stats = Counter()
+        for group, (group_results, group_stats, group_profile) in zip(groups, outcomes):
+            for index, ok in zip(group, group_results):
+                results[index] = ok
+            stats.update(group_stats)
+            if profiler is not None:
+                profiler.merge(group_profile)
+    return results, stats
+
+
 def main():
     """Main conversion script."""
     parser = argparse.ArgumentParser(
@@ -114,6 +318,76 @@ def main():
         nargs='+',
         help='Specific notebooks to convert (filenames)'
     )
+    parser.add_argument(
+        '--jobs',
+        type=parse_jobs,
+        default=1,
+        help="Number of parallel worker processes, or 'auto' to use all available cores (default: 1)"
+    )
+    parser.add_argument(
+        '--cache-dir',
+        type=Path,
+        default=None,
+        help='Directory for the persistent converted-cell and template caches (default: ~/.cache/unsloth-brev)'
+    )
+    parser.add_argument(
+        '--cache-max-entries',
+        type=int,
+        default=DEFAULT_MAX_ENTRIES,
+        help=f'Cells kept in the cache before least-recently-used eviction (default: {DEFAULT_MAX_ENTRIES})'
+    )
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Convert every cell and compile the templates from scratch without reading or writing the caches'
+    )
+    parser.add_argument(
+        '--manifest',
+        type=Path,
+        default=Path(__file__).parent.parent / 'metadata' / 'conversion_manifest.json',
+        help='Conversion manifest used to skip unchanged notebooks (default: metadata/conversion_manifest.json)'
+    )
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='Convert every selected notebook even if the manifest says it is up to date'
+    )
+    parser.add_argument(
+        '--fast-io',
+        action='store_true',
+        help='Load and write notebooks as plain JSON, skipping per-notebook schema validation'
+    )
+    parser.add_argument(
+        '--validate',
+        action='store_true',
+        help='Validate every converted notebook against the nbformat schema at the end of the run'
+    )
+    parser.add_argument(
+        '--profile',
+        type=Path,
+        metavar='REPORT',
+        help='Time every conversion and write a JSON report to REPORT '
+             '(a per-conversion table is logged in the summary)'
+    )
+    parser.add_argument(
+        '--code-backend',
+        choices=['regex', 'cst'],
+        default='regex',
+        help="Backend for the Python-level code rewrites: 'regex' (default) or 'cst', which "
+             "parses each code cell once with libcst"
+    )
+    parser.add_argument(
+        '--reproducible',
+        action='store_true',
+        help='Embed a fixed build time (SOURCE_DATE_EPOCH, else the upstream commit time '
+             'from --last-sync) instead of the current time'
+    )
+    parser.add_argument(
+        '--last-sync',
+        type=Path,
+        default=DEFAULT_LAST_SYNC_PATH,
+        help='Sync record providing the upstream commit time (default: metadata/last_sync.txt)'
+    )
     
     args = parser.parse_args()
     
@@ -127,6 +401,17 @@ def main():
     if not templates_dir.exists():
         logger.error(f"Templates directory not found: {templates_dir}")
         sys.exit(1)
+
+    # Fixed timestamp for generated files (SOURCE_DATE_EPOCH is always honoured)
+    try:
+        build_time = resolve_build_time(args.reproducible, args.last_sync)
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(1)
+
+    if args.code_backend == 'cst' and importlib.util.find_spec('libcst') is None:
+        logger.error("--code-backend cst requires libcst (pip install 'unsloth-brev-adapter[cst]')")
+        sys.exit(1)
     
     # Create output directory
     args.output.mkdir(parents=True, exist_ok=True)
@@ -155,7 +440,7 @@ def main():
     else:
         # Convert all notebooks in source directory
         logger.info(f"Converting all notebooks in: {args.source}")
-        notebooks_to_convert = list(args.source.glob('**/*.ipynb'))
+        notebooks_to_convert = sorted(args.source.glob('**/*.ipynb'))
     
     if not notebooks_to_convert:
         logger.warning("No notebooks to convert")
@@ -176,29 +461,138 @@ def main():
         logger.warning("No notebooks to convert after filtering Kaggle variants")
         sys.exit(0)
     
+    # Skip notebooks whose source, config, templates and adapter are unchanged
+    manifest = ConversionManifest.load(args.manifest, templates_dir, extra_files=[Path(__file__)])
+    full_sync = not args.changed_file and not args.notebooks
+    selected = notebooks_to_convert
+    notebooks_to_convert = []
+    fingerprints = {}
+    for notebook_path in selected:
+        key = notebook_path.relative_to(args.source).as_posix()
+        config = get_config_for_notebook(notebook_path.stem)
+        fingerprint = manifest.fingerprint(notebook_path, config, args.output, args.code_backend)
+        if not args.force and manifest.is_up_to_date(key, fingerprint):
+            continue
+        fingerprints[notebook_path] = (key, fingerprint)
+        notebooks_to_convert.append(notebook_path)
+    up_to_date = len(selected) - len(notebooks_to_convert)
+    if full_sync:
+        stale = manifest.retain(nb.relative_to(args.source).as_posix() for nb in selected)
+        if stale:
+            logger.info(f"Dropped {stale} manifest entr{'y' if stale == 1 else 'ies'} for removed notebooks")
+    if up_to_date:
+        logger.info(f"{up_to_date} notebook(s) up to date, skipping")
+
     logger.info(f"Converting {len(notebooks_to_convert)} notebook(s)")
     
     # Convert notebooks
-    successful = 0
-    failed = 0
-    skipped = 0
-    
-    for notebook_path in notebooks_to_convert:
-        if convert_single_notebook(notebook_path, args.output, templates_dir):
-            successful += 1
+    profiler = ConversionProfiler() if args.profile else None
+    cache_dir = None if args.no_cache else (args.cache_dir or default_cache_dir())
+    if notebooks_to_convert:
+        results, stats = convert_notebooks(
+            notebooks_to_convert,
+            args.output,
+            templates_dir,
+            jobs=args.jobs,
+            cache_dir=cache_dir,
+            fast_io=args.fast_io,
+            build_time=build_time,
+            profiler=profiler,
+            code_backend=args.code_backend
+        )
+    else:
+        results, stats = [], Counter()
+
+    # Record what each converted notebook was built from
+    for notebook_path, ok in zip(notebooks_to_convert, results):
+        key, fingerprint = fingerprints[notebook_path]
+        if ok:
+            manifest.record(key, fingerprint)
         else:
-            failed += 1
+            manifest.forget(key)
+    manifest.save()
+
+    # Schema validation skipped while converting is done here in one pass
+    invalid = []
+    if args.validate:
+        written = [
+            Path(fingerprints[nb][1]['output'])
+            for nb, ok in zip(notebooks_to_convert, results) if ok
+        ]
+        invalid = validate_notebooks(written)
+        for path, error in invalid:
+            logger.error(f"✗ Invalid notebook {path}: {error}")
+
+    # Keep the cache within its size cap
+    if cache_dir is not None:
+        cache = CellCache(cache_dir, max_entries=args.cache_max_entries)
+        try:
+            cache.prune()
+        finally:
+            cache.close()
+    successful = sum(1 for ok in results if ok)
+    failed = len(results) - successful
+    failed_notebooks = [
+        nb.name for nb, ok in zip(notebooks_to_convert, results) if not ok
+    ]
     
     # Print summary
     logger.info("=" * 60)
     logger.info("CONVERSION SUMMARY")
     logger.info("=" * 60)
-    logger.info(f"Total notebooks: {len(notebooks_to_convert)}")
+    logger.info(f"Total notebooks: {len(selected)}")
+    logger.info(f"Up to date: {up_to_date}")
+    logger.info(f"Converted: {len(notebooks_to_convert)}")
     logger.info(f"Successful: {successful}")
     logger.info(f"Failed: {failed}")
+    for name in failed_notebooks:
+        logger.info(f"  ✗ {name}")
+    skipped_calls = stats['conversion_calls_skipped'] + stats['conversion_calls_short_circuited']
+    total_calls = stats['conversion_calls'] + skipped_calls
+    if total_calls:
+        logger.info(
+            f"Conversion calls: {stats['conversion_calls']} run, "
+            f"{stats['conversion_calls_skipped']} skipped by triggers, "
+            f"{stats['conversion_calls_short_circuited']} after terminal rewrites "
+            f"({skipped_calls / total_calls:.0%} skipped)"
+        )
+    if cache_dir is not None:
+        cache_lookups = stats['cell_cache_hits'] + stats['cell_cache_misses']
+        logger.info(
+            f"Cell cache: {stats['cell_cache_hits']} hit(s), "
+            f"{stats['cell_cache_misses']} miss(es)"
+            + (f" ({stats['cell_cache_hits'] / cache_lookups:.0%} hit rate)" if cache_lookups else "")
+        )
+    if stats['templates_loaded'] or stats['templates_compiled']:
+        logger.info(
+            f"Templates: {stats['templates_loaded']} loaded from the bytecode cache, "
+            f"{stats['templates_compiled']} compiled"
+        )
+    if stats['template_renders'] or stats['template_render_hits']:
+        logger.info(
+            f"Companion files: {stats['template_renders']} template render(s), "
+            f"{stats['template_render_hits']} reused from the render cache, "
+            f"{stats['companion_files_reused']} already written this run"
+        )
+    if stats['files_written'] or stats['files_skipped']:
+        logger.info(
+            f"Output files: {stats['files_written']} written ({stats['bytes_written']:,} bytes), "
+            f"{stats['files_skipped']} unchanged ({stats['bytes_skipped']:,} bytes skipped)"
+        )
+    if profiler is not None:
+        report = profiler.report()
+        args.profile.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.profile, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        logger.info(f"Conversion profile ({report['total_seconds'] * 1000:.1f} ms in conversions):")
+        for line in profiler.table():
+            logger.info(f"  {line}")
+        logger.info(f"Profile report saved to: {args.profile}")
+    if args.validate:
+        logger.info(f"Schema validation: {len(invalid)} invalid notebook(s)")
     logger.info("=" * 60)
     
-    sys.exit(0 if failed == 0 else 1)
+    sys.exit(0 if failed == 0 and not invalid else 1)
 
 
 if __name__ == '__main__':
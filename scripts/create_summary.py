@@ -8,9 +8,13 @@ Usage:
 
 import json
 import sys
-from collections import defaultdict
 from pathlib import Path
 
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adapters.launchables_index import LaunchablesIndex
+
 
 def create_summary(launchables_file: Path) -> str:
     """
@@ -26,20 +30,10 @@ def create_summary(launchables_file: Path) -> str:
     with open(launchables_file, 'r') as f:
         registry = json.load(f)
     
-    launchables = registry.get('launchables', [])
     total = registry.get('total_launchables', 0)
     
-    # Group by category
-    by_category = defaultdict(list)
-    for launchable in launchables:
-        tags = launchable.get('tags', [])
-        # Use first non-generic tag as category
-        category = 'Other'
-        for tag in tags:
-            if tag not in ['unsloth', 'fine-tuning']:
-                category = tag.title()
-                break
-        by_category[category].append(launchable)
+    # Group by category (first non-generic tag)
+    by_category = LaunchablesIndex.from_registry(registry).categories()
     
     # Build markdown
     lines = [
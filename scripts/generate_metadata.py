@@ -2,16 +2,33 @@
 """
 Generate metadata registry for all converted launchables.
 
+With --incremental, only launchable directories that changed since the
+last run are read again and the existing registry is patched in place.
+What each directory looked like (its modification times and a digest of
+its listing) is recorded in a scan state file next to the registry;
+without it (or if either file was edited by hand) everything is scanned.
+--verify also runs a full scan and fails on any difference.
+
 Usage:
     python generate_metadata.py --notebooks-dir <path> --output <path>
+    python generate_metadata.py --notebooks-dir <path> --output <path> --incremental [--verify]
 """
 
 import argparse
+import hashlib
 import json
 import logging
+import os
 import sys
-from datetime import datetime, timezone
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adapters.build_time import DEFAULT_LAST_SYNC_PATH, format_build_time, resolve_build_time
 
 # Configure logging
 logging.basicConfig(
@@ -20,6 +37,24 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Bump when the scan state format or the entries it describes change
+SCAN_STATE_VERSION = 2
+
+BREV_CONFIG_NAME = '.brevconfig.json'
+
+# Launchable directories read per thread pool task
+SCAN_BATCH_SIZE = 64
+
+# Coarsest file timestamp granularity trusted by --incremental (FAT's 2 s);
+# a directory modified this close to a scan is read again by the next one
+MTIME_RESOLUTION_NS = 2_000_000_000
+
+# A directory's sorted (name, is_file) entries and its .brevconfig.json bytes
+DirectoryListing = Tuple[List[Tuple[str, bool]], Optional[bytes]]
+
+# Directory mtime, .brevconfig.json mtime and size (None if there is none)
+DirectoryStamp = List[Optional[int]]
+
 
 def extract_notebook_name(notebook_filename: str) -> str:
     """
@@ -40,74 +75,423 @@ def extract_notebook_name(notebook_filename: str) -> str:
     return name
 
 
-def scan_launchables(notebooks_dir: Path) -> list:
+def read_launchable_dir(launchable_dir: Path) -> Optional[DirectoryListing]:
+    """
+    Read everything a launchable's entries are built from.
+
+    The directory is listed with a single os.scandir call, whose entries
+    carry the file type, so no file is stat'ed on its own; .brevconfig.json
+    is read only if it was listed.
+
+    Args:
+        launchable_dir: Directory of one launchable
+
+    Returns:
+        Tuple of (sorted (name, is_file) pairs, bytes of .brevconfig.json or
+        None if there is none), or None if the directory cannot be read
+    """
+    try:
+        with os.scandir(launchable_dir) as entries:
+            listing = sorted((entry.name, entry.is_file()) for entry in entries)
+        config_bytes = None
+        if any(name == BREV_CONFIG_NAME for name, _ in listing):
+            config_bytes = (launchable_dir / BREV_CONFIG_NAME).read_bytes()
+    except OSError as e:
+        logger.error(f"Error reading {launchable_dir}: {e}")
+        return None
+    return listing, config_bytes
+
+
+def read_launchable_dirs(launchable_dirs: List[Path], jobs: Optional[int] = None) -> List[Optional[DirectoryListing]]:
+    """
+    Read many launchable directories, on a thread pool when there are enough.
+
+    Listing directories and reading files release the GIL, so threads
+    overlap the filesystem calls. Directories are handed out in batches to
+    keep the per-task overhead small.
+
+    Args:
+        launchable_dirs: Directories to read
+        jobs: Number of threads (default: the thread pool default; 1 reads
+            serially)
+
+    Returns:
+        read_launchable_dir's result for each directory, in order
+    """
+    if jobs == 1 or len(launchable_dirs) <= SCAN_BATCH_SIZE:
+        return [read_launchable_dir(launchable_dir) for launchable_dir in launchable_dirs]
+
+    batches = [
+        launchable_dirs[start:start + SCAN_BATCH_SIZE]
+        for start in range(0, len(launchable_dirs), SCAN_BATCH_SIZE)
+    ]
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        results = executor.map(lambda batch: [read_launchable_dir(path) for path in batch], batches)
+        return [listing for batch in results for listing in batch]
+
+
+def list_launchable_dirs(notebooks_dir: Path) -> List[str]:
+    """
+    List the launchable directories of a converted tree.
+
+    Args:
+        notebooks_dir: Directory containing converted notebooks
+
+    Returns:
+        Sorted directory names
+    """
+    with os.scandir(notebooks_dir) as entries:
+        return sorted(entry.name for entry in entries if entry.is_dir())
+
+
+def stat_launchable_dirs(notebooks_dir: Path) -> Dict[str, Optional[DirectoryStamp]]:
+    """
+    Stamp the launchable directories of a converted tree without reading them.
+
+    Adding, removing or renaming a file changes its directory's mtime, and
+    editing .brevconfig.json changes the file's own mtime and usually its
+    size, so an unchanged stamp means the directory would produce the same
+    entries. Two stat calls per directory replace listing it and reading
+    its config.
+
+    Args:
+        notebooks_dir: Directory containing converted notebooks
+
+    Returns:
+        Directory name -> [directory mtime_ns, .brevconfig.json mtime_ns,
+        .brevconfig.json size], or None if the directory cannot be stat'ed
+    """
+    stamps: Dict[str, Optional[DirectoryStamp]] = {}
+    with os.scandir(notebooks_dir) as entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            try:
+                stamp: DirectoryStamp = [entry.stat().st_mtime_ns, None, None]
+                try:
+                    config = os.stat(os.path.join(entry.path, BREV_CONFIG_NAME))
+                    stamp[1:] = [config.st_mtime_ns, config.st_size]
+                except FileNotFoundError:
+                    pass
+            except OSError:
+                stamp = None
+            stamps[entry.name] = stamp
+    return stamps
+
+
+def stamp_is_settled(stamp: Optional[DirectoryStamp], started_ns: int) -> bool:
+    """
+    Check that a stamp can tell later changes apart.
+
+    A file modified within one timestamp tick after the stamp was taken can
+    keep the same mtime, so stamps this close to the scan are not trusted.
+
+    Args:
+        stamp: Stamp from stat_launchable_dirs
+        started_ns: When the scan started (time.time_ns())
+
+    Returns:
+        True if every mtime in the stamp is older than the scan by more
+        than MTIME_RESOLUTION_NS
+    """
+    if stamp is None:
+        return False
+    return all(mtime < started_ns - MTIME_RESOLUTION_NS for mtime in stamp[:2] if mtime is not None)
+
+
+def build_launchable_entries(launchable_dir: Path, notebooks_dir: Path,
+                             listing: Optional[DirectoryListing]) -> List[Dict[str, Any]]:
+    """
+    Build the launchable entries for one converted directory.
+    Creates individual entries for EACH notebook file (not grouped by directory).
+
+    Args:
+        launchable_dir: Directory of one launchable
+        notebooks_dir: Directory containing converted notebooks
+        listing: The directory as read by read_launchable_dir
+
+    Returns:
+        List of launchable metadata dictionaries (one per notebook); empty
+        if the directory is not a valid launchable
+    """
+    if listing is None:
+        return []
+    names, config_bytes = listing
+
+    # Look for .brevconfig.json
+    if config_bytes is None:
+        logger.warning(f"No .brevconfig.json found in {launchable_dir}")
+        return []
+
+    launchables = []
+    try:
+        # Read Brev config
+        brev_config = json.loads(config_bytes)
+
+        # Find ALL notebook files in this directory (as glob('*.ipynb'), hidden ones included)
+        notebook_files = [name for name, _ in names if name.endswith('.ipynb')]
+        if not notebook_files:
+            logger.warning(f"No notebooks found in {launchable_dir}")
+            return []
+
+        # List companion files (shared across all notebooks in directory)
+        companion_files = [
+            name for name, is_file in names
+            if is_file and not name.endswith('.ipynb')
+        ]
+        path = str(launchable_dir.relative_to(notebooks_dir))
+
+        # Create a separate launchable entry for EACH notebook
+        for notebook_file in notebook_files:
+            # Extract specific model name from notebook filename
+            notebook_name = extract_notebook_name(notebook_file)
+
+            # Build launchable metadata for this specific notebook
+            launchable = {
+                'id': f"{launchable_dir.name}/{os.path.splitext(notebook_file)[0]}",
+                'name': notebook_name,
+                'description': brev_config.get('description', ''),
+                'notebook': notebook_file,
+                'path': path,
+                'gpu': brev_config.get('gpu', {}),
+                'tags': brev_config.get('tags', []),
+                'upstream': brev_config.get('upstream', {}),
+                'files': companion_files + [notebook_file]
+            }
+
+            launchables.append(launchable)
+            logger.info(f"Found launchable: {notebook_name}")
+
+    except Exception as e:
+        logger.error(f"Error processing {launchable_dir}: {e}")
+        return []
+
+    return launchables
+
+
+def scan_launchables(notebooks_dir: Path, jobs: Optional[int] = None) -> list:
     """
     Scan converted directory for launchables.
     Creates individual entries for EACH notebook file (not grouped by directory).
 
     Args:
         notebooks_dir: Directory containing converted notebooks
+        jobs: Threads reading launchable directories (default: the thread
+            pool default; 1 reads serially)
 
     Returns:
         List of launchable metadata dictionaries (one per notebook)
     """
+    launchable_dirs = [notebooks_dir / name for name in list_launchable_dirs(notebooks_dir)]
     launchables = []
     
-    for launchable_dir in notebooks_dir.iterdir():
-        if not launchable_dir.is_dir():
-            continue
-        
-        # Look for .brevconfig.json
-        config_file = launchable_dir / '.brevconfig.json'
-        if not config_file.exists():
-            logger.warning(f"No .brevconfig.json found in {launchable_dir}")
-            continue
-        
-        try:
-            # Read Brev config
-            with open(config_file, 'r') as f:
-                brev_config = json.load(f)
-            
-            # Find ALL notebook files in this directory
-            notebook_files = sorted(launchable_dir.glob('*.ipynb'))
-            if not notebook_files:
-                logger.warning(f"No notebooks found in {launchable_dir}")
-                continue
-            
-            # List companion files (shared across all notebooks in directory)
-            companion_files = []
-            for file_path in launchable_dir.iterdir():
-                if file_path.is_file() and not file_path.name.endswith('.ipynb'):
-                    companion_files.append(file_path.name)
-            
-            # Create a separate launchable entry for EACH notebook
-            for notebook_file in notebook_files:
-                # Extract specific model name from notebook filename
-                notebook_name = extract_notebook_name(notebook_file.name)
-                
-                # Build launchable metadata for this specific notebook
-                launchable = {
-                    'id': f"{launchable_dir.name}/{notebook_file.stem}",
-                    'name': notebook_name,
-                    'description': brev_config.get('description', ''),
-                    'notebook': notebook_file.name,
-                    'path': str(launchable_dir.relative_to(notebooks_dir)),
-                    'gpu': brev_config.get('gpu', {}),
-                    'tags': brev_config.get('tags', []),
-                    'upstream': brev_config.get('upstream', {}),
-                    'files': companion_files + [notebook_file.name]
-                }
-                
-                launchables.append(launchable)
-                logger.info(f"Found launchable: {notebook_name}")
-            
-        except Exception as e:
-            logger.error(f"Error processing {launchable_dir}: {e}")
-            continue
+    for launchable_dir, listing in zip(launchable_dirs, read_launchable_dirs(launchable_dirs, jobs)):
+        launchables.extend(build_launchable_entries(launchable_dir, notebooks_dir, listing))
     
     return launchables
 
 
+def sort_launchables(launchables: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """
+    Order launchables as they appear in the registry.
+
+    Args:
+        launchables: Launchable metadata dictionaries
+
+    Returns:
+        Launchables sorted by name, ties broken by id
+    """
+    return sorted(launchables, key=lambda x: (x['name'], x['id']))
+
+
+def listing_digest(listing: Optional[DirectoryListing]) -> str:
+    """
+    Fingerprint everything build_launchable_entries reads from a directory.
+
+    The entries of a launchable depend only on the names of its files and
+    on .brevconfig.json, never on notebook contents, so equal digests mean
+    the directory would produce the same entries.
+
+    Args:
+        listing: The directory as read by read_launchable_dir
+
+    Returns:
+        Hex digest of the sorted entry names (with their kind) and the
+        bytes of .brevconfig.json
+    """
+    if listing is None:
+        return 'unreadable'
+    names, config_bytes = listing
+    digest = hashlib.sha256()
+    digest.update('\0'.join(sorted(f"{'f' if is_file else 'd'}:{name}" for name, is_file in names)).encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(b'missing' if config_bytes is None else config_bytes)
+    return digest.hexdigest()
+
+
+def directory_digest(launchable_dir: Path) -> str:
+    """
+    Fingerprint a launchable directory (see listing_digest).
+
+    Args:
+        launchable_dir: Directory of one launchable
+
+    Returns:
+        Hex digest of what its entries are built from
+    """
+    return listing_digest(read_launchable_dir(launchable_dir))
+
+
+def default_state_path(output: Path) -> Path:
+    """
+    Get the scan state file kept next to a registry.
+
+    Args:
+        output: Path of launchables.json
+
+    Returns:
+        Path of the scan state file
+    """
+    return output.with_name(f"{output.stem}.scan_state.json")
+
+
+def load_scan_state(state_path: Path, registry_path: Path,
+                    notebooks_dir: Path) -> Optional[Tuple[Dict[str, Dict[str, Any]], List[Dict[str, Any]]]]:
+    """
+    Load the previous scan state and the registry it describes.
+
+    Args:
+        state_path: Scan state file written by the previous run
+        registry_path: Registry written by the previous run
+        notebooks_dir: Directory about to be scanned
+
+    Returns:
+        Tuple of (directory name -> {'digest', 'entries'}, previous
+        launchables), or None if a full rescan is needed
+    """
+    try:
+        state = json.loads(state_path.read_text(encoding='utf-8'))
+        registry_bytes = registry_path.read_bytes()
+    except (OSError, ValueError) as e:
+        logger.info(f"No usable scan state ({e}); scanning everything")
+        return None
+
+    if state.get('version') != SCAN_STATE_VERSION:
+        logger.info("Scan state version changed; scanning everything")
+        return None
+    if state.get('notebooks_dir') != notebooks_dir.as_posix():
+        logger.info(f"Scan state is for {state.get('notebooks_dir')}; scanning everything")
+        return None
+    if state.get('registry_sha256') != hashlib.sha256(registry_bytes).hexdigest():
+        logger.info(f"{registry_path} changed since the last scan; scanning everything")
+        return None
+
+    try:
+        launchables = json.loads(registry_bytes)['launchables']
+    except (ValueError, KeyError) as e:
+        logger.info(f"Unreadable registry ({e}); scanning everything")
+        return None
+    return state['directories'], launchables
+
+
+def update_launchables(notebooks_dir: Path,
+                       previous_launchables: List[Dict[str, Any]],
+                       previous_dirs: Dict[str, Dict[str, Any]],
+                       jobs: Optional[int] = None) -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]], Dict[str, int]]:
+    """
+    Patch a registry, re-scanning only the directories that changed.
+
+    Every directory is stat'ed (stat_launchable_dirs); only those whose
+    stamp differs from the recorded one are read, so the cost follows the
+    number of changed directories. A directory that was read but whose
+    listing digest is unchanged keeps its entries as well; new and changed
+    directories are scanned and removed ones dropped. With no previous
+    state every directory is read and scanned.
+
+    Args:
+        notebooks_dir: Directory containing converted notebooks
+        previous_launchables: Launchables of the previous registry
+        previous_dirs: Directory name -> {'digest', 'entries', 'stamp'}
+            from the previous scan state
+        jobs: Threads reading launchable directories (default: the thread
+            pool default; 1 reads serially)
+
+    Returns:
+        Tuple of (launchables, new directory state, statistics with
+        'read', 'scanned', 'reused' and 'removed' counts)
+    """
+    by_path: Dict[str, List[Dict[str, Any]]] = {}
+    for launchable in previous_launchables:
+        by_path.setdefault(launchable['path'], []).append(launchable)
+
+    started_ns = time.time_ns()
+    stamps = stat_launchable_dirs(notebooks_dir)
+    names = sorted(stamps)
+
+    # Reuse only entries that still match what was recorded for them
+    def matches_previous(name: str, key: str, value: Any) -> bool:
+        previous = previous_dirs.get(name)
+        return bool(previous) and previous.get(key) == value and previous['entries'] == len(by_path.get(name, []))
+
+    # Read only the directories whose stamp changed (or was not trusted)
+    to_read = [
+        name for name in names
+        if stamps[name] is None or not matches_previous(name, 'stamp', stamps[name])
+    ]
+    listings = dict(zip(to_read, read_launchable_dirs([notebooks_dir / name for name in to_read], jobs)))
+
+    launchables = []
+    directories = {}
+    stats = {'read': len(to_read), 'scanned': 0, 'reused': 0, 'removed': 0}
+    for name in names:
+        readable = True
+        if name not in listings:
+            # Same stamp: keep the recorded digest and entries unread
+            digest = previous_dirs[name]['digest']
+            entries = by_path.get(name, [])
+            stats['reused'] += 1
+        else:
+            listing = listings[name]
+            readable = listing is not None
+            digest = listing_digest(listing)
+            if matches_previous(name, 'digest', digest):
+                entries = by_path.get(name, [])
+                stats['reused'] += 1
+            else:
+                entries = build_launchable_entries(notebooks_dir / name, notebooks_dir, listing)
+                stats['scanned'] += 1
+        launchables.extend(entries)
+        # Stamps taken while the directory may still change are not recorded
+        settled = readable and stamp_is_settled(stamps[name], started_ns)
+        directories[name] = {
+            'digest': digest,
+            'entries': len(entries),
+            'stamp': stamps[name] if settled else None,
+        }
+
+    stats['removed'] = len(set(previous_dirs) - set(directories))
+    return launchables, directories, stats
+
+
+def find_registry_differences(expected: List[Dict[str, Any]], actual: List[Dict[str, Any]]) -> List[str]:
+    """
+    Compare two lists of launchables entry by entry.
+
+    Args:
+        expected: Launchables from a full scan
+        actual: Launchables from an incremental update
+
+    Returns:
+        Ids of launchables that are missing, extra or different
+    """
+    expected_by_id = {launchable['id']: launchable for launchable in expected}
+    actual_by_id = {launchable['id']: launchable for launchable in actual}
+    return sorted(
+        launchable_id for launchable_id in expected_by_id.keys() | actual_by_id.keys()
+        if expected_by_id.get(launchable_id) != actual_by_id.get(launchable_id)
+    )
+
+
 def main():
     """Main metadata generation script."""
     parser = argparse.ArgumentParser(
@@ -125,6 +509,41 @@ def main():
         required=True,
         help='Output path for launchables.json'
     )
+    parser.add_argument(
+        '--reproducible',
+        action='store_true',
+        help='Use a fixed generated_at time (SOURCE_DATE_EPOCH, else the upstream commit '
+             'time from --last-sync) instead of the current time'
+    )
+    parser.add_argument(
+        '--last-sync',
+        type=Path,
+        default=DEFAULT_LAST_SYNC_PATH,
+        help='Sync record providing the upstream commit time (default: metadata/last_sync.txt)'
+    )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Re-scan only launchable directories that changed since the last run '
+             'and patch the existing registry'
+    )
+    parser.add_argument(
+        '--state',
+        type=Path,
+        default=None,
+        help='Scan state file (default: <output stem>.scan_state.json next to --output)'
+    )
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=None,
+        help='Threads reading launchable directories (default: the thread pool default)'
+    )
+    parser.add_argument(
+        '--verify',
+        action='store_true',
+        help='Also run a full scan and exit non-zero if the registry differs from it'
+    )
     
     args = parser.parse_args()
     
@@ -132,27 +551,72 @@ def main():
     if not args.notebooks_dir.exists():
         logger.error(f"Notebooks directory not found: {args.notebooks_dir}")
         sys.exit(1)
+
+    try:
+        build_time = resolve_build_time(args.reproducible, args.last_sync)
+    except ValueError as e:
+        logger.error(str(e))
+        sys.exit(1)
     
+    state_path = args.state or default_state_path(args.output)
+    previous = None
+    if args.incremental:
+        previous = load_scan_state(state_path, args.output, args.notebooks_dir)
+    previous_dirs, previous_launchables = previous or ({}, [])
+
     # Scan for launchables
     logger.info(f"Scanning: {args.notebooks_dir}")
-    launchables = scan_launchables(args.notebooks_dir)
+    launchables, directories, stats = update_launchables(
+        args.notebooks_dir, previous_launchables, previous_dirs, args.jobs
+    )
+    launchables = sort_launchables(launchables)
+    logger.info(
+        f"Read {stats['read']} director(ies), scanned {stats['scanned']}, "
+        f"reused {stats['reused']}, removed {stats['removed']}"
+    )
+
+    differences = []
+    if args.verify:
+        differences = find_registry_differences(
+            sort_launchables(scan_launchables(args.notebooks_dir, args.jobs)), launchables
+        )
+        for launchable_id in differences:
+            logger.error(f"Registry entry differs from a full scan: {launchable_id}")
+        if differences:
+            # Write what a full scan finds, but still fail the run
+            launchables, directories, _ = update_launchables(args.notebooks_dir, [], {}, args.jobs)
+            launchables = sort_launchables(launchables)
     
     # Build registry
     registry = {
         'version': '1.0.0',
-        'generated_at': datetime.now(timezone.utc).isoformat(),
+        'generated_at': format_build_time(build_time),
         'total_launchables': len(launchables),
-        'launchables': sorted(launchables, key=lambda x: x['name'])
+        'launchables': launchables
     }
     
     # Write to output
     args.output.parent.mkdir(parents=True, exist_ok=True)
-    with open(args.output, 'w') as f:
-        json.dump(registry, f, indent=2)
+    registry_bytes = json.dumps(registry, indent=2).encode('utf-8')
+    args.output.write_bytes(registry_bytes)
+
+    # Record what was scanned for the next incremental run
+    state = {
+        'version': SCAN_STATE_VERSION,
+        'notebooks_dir': args.notebooks_dir.as_posix(),
+        'registry_sha256': hashlib.sha256(registry_bytes).hexdigest(),
+        'directories': directories,
+    }
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    state_path.write_text(json.dumps(state, indent=2, sort_keys=True), encoding='utf-8')
     
     logger.info(f"Generated registry with {len(launchables)} launchable(s)")
     logger.info(f"Saved to: {args.output}")
 
+    if differences:
+        logger.error(f"{len(differences)} registry entr(ies) differed from a full scan")
+        sys.exit(1)
+
 
 if __name__ == '__main__':
     main()
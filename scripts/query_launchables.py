@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Query the launchables registry.
+
+Loads metadata/launchables.json once into a LaunchablesIndex and prints the
+launchables matching every given filter as JSON.
+
+Usage:
+    python query_launchables.py --category vision --max-vram 24
+    python query_launchables.py --tag reasoning --tier L4 --fields id,gpu
+    python query_launchables.py --summary
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adapters.launchables_index import DEFAULT_REGISTRY_PATH, LaunchablesIndex
+
+
+def select_fields(launchables: List[Dict[str, Any]], fields: Optional[Sequence[str]]) -> List[Dict[str, Any]]:
+    """
+    Keep only some fields of each launchable.
+
+    Args:
+        launchables: Launchable metadata dictionaries
+        fields: Field names to keep, or None for all
+
+    Returns:
+        Launchables restricted to the fields they have
+    """
+    if not fields:
+        return launchables
+    return [
+        {field: launchable[field] for field in fields if field in launchable}
+        for launchable in launchables
+    ]
+
+
+def run_query(index: LaunchablesIndex, args: argparse.Namespace) -> Dict[str, Any]:
+    """
+    Answer the query described by the command-line arguments.
+
+    Args:
+        index: Index over the registry
+        args: Parsed arguments
+
+    Returns:
+        JSON-serializable result: the matches, or counts with --summary
+    """
+    if args.summary:
+        return {
+            'total_launchables': len(index),
+            'categories': {name: len(group) for name, group in index.categories().items()},
+            'tags': index.tags(),
+            'tiers': index.tiers(),
+        }
+
+    matches = index.query(
+        tags=args.tag,
+        tier=args.tier,
+        category=args.category,
+        min_vram_gb=args.min_vram,
+        max_vram_gb=args.max_vram,
+    )
+    fields = args.fields.split(',') if args.fields else None
+    return {
+        'total': len(matches),
+        'launchables': select_fields(matches[:args.limit] if args.limit else matches, fields),
+    }
+
+
+def main():
+    """Main query script."""
+    parser = argparse.ArgumentParser(
+        description='Query the launchables registry; filters are combined with AND'
+    )
+    parser.add_argument(
+        '--metadata-path',
+        type=Path,
+        default=DEFAULT_REGISTRY_PATH,
+        help='Path to launchables.json (default: metadata/launchables.json)'
+    )
+    parser.add_argument(
+        '--tag',
+        action='append',
+        default=[],
+        help='Tag the launchable must carry (repeatable)'
+    )
+    parser.add_argument('--tier', help='Recommended GPU tier, e.g. L4 or A100-40GB')
+    parser.add_argument('--category', help='Category, e.g. Vision or Reasoning')
+    parser.add_argument(
+        '--min-vram',
+        type=float,
+        default=None,
+        help='Only launchables needing at least this many GB of GPU memory'
+    )
+    parser.add_argument(
+        '--max-vram',
+        type=float,
+        default=None,
+        help='Only launchables that fit in this many GB of GPU memory'
+    )
+    parser.add_argument('--fields', help='Comma-separated fields to print (default: all)')
+    parser.add_argument('--limit', type=int, default=None, help='Print at most this many launchables')
+    parser.add_argument(
+        '--summary',
+        action='store_true',
+        help='Print launchable counts per category, tag and GPU tier instead'
+    )
+    args = parser.parse_args()
+
+    if not args.metadata_path.exists():
+        print(f"File not found: {args.metadata_path}", file=sys.stderr)
+        sys.exit(1)
+
+    index = LaunchablesIndex.from_file(args.metadata_path)
+    print(json.dumps(run_query(index, args), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -34,7 +34,7 @@ setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/brevdev/unsloth-notebook-adaptor",
-    packages=find_packages(exclude=["tests", "tests.*"]),
+    packages=find_packages(exclude=["tests", "tests.*", "benchmarks", "benchmarks.*"]),
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
@@ -50,17 +50,25 @@ setup(
     ],
     python_requires=">=3.9",
     install_requires=requirements,
+    extras_require={
+        # Faster JSON parsing for the --fast-io notebook loader
+        "fast": ["orjson>=3.8"],
+        # libcst code backend (--code-backend cst)
+        "cst": ["libcst>=1.0"],
+    },
     entry_points={
         "console_scripts": [
             "unsloth-convert=scripts.convert_notebook:main",
             "unsloth-compare=scripts.compare_notebooks:main",
             "unsloth-metadata=scripts.generate_metadata:main",
             "unsloth-summary=scripts.create_summary:main",
+            "unsloth-query=scripts.query_launchables:main",
         ],
     },
     include_package_data=True,
     package_data={
         "": ["templates/*.jinja2"],
+        "adapters": ["data/*.json"],
     },
     zip_safe=False,
 )
@@ -0,0 +1,52 @@
+"""
+Tests for the synthetic benchmark corpus and suite.
+"""
+
+import pytest
+from pathlib import Path
+
+# Add parent directory to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from benchmarks.run_benchmarks import bench_scale
+from benchmarks.synthetic import generate_notebook, write_corpus
+
+
+def test_generate_notebook_is_deterministic():
+    """Test that a seed fully determines the notebook."""
+    first = generate_notebook(50, seed=3)
+    assert first == generate_notebook(50, seed=3)
+    assert first != generate_notebook(50, seed=4)
+    assert len(first.cells) == 50
+
+
+def test_generate_notebook_mix_and_length():
+    """Test that the cell mix and cell length are honoured."""
+    only_pip = generate_notebook(20, cell_length=500, mix={'pip': 1.0})
+    assert all(cell.cell_type == 'code' for cell in only_pip.cells)
+    assert all('pip install' in cell.source for cell in only_pip.cells)
+    assert all(len(cell.source) >= 500 for cell in only_pip.cells)
+
+    plain = generate_notebook(20, mix={})
+    assert not any('colab' in cell.source.lower() for cell in plain.cells)
+
+    with pytest.raises(ValueError):
+        generate_notebook(10, mix={'unknown': 0.5})
+    with pytest.raises(ValueError):
+        generate_notebook(10, mix={'pip': 0.7, 'magic': 0.7})
+
+
+def test_write_corpus_splits_cells(tmp_path):
+    """Test that the corpus holds the requested total number of cells."""
+    paths = write_corpus(tmp_path, total_cells=250, cells_per_notebook=100)
+    assert [p.name for p in paths] == ['Synthetic-00000.ipynb', 'Synthetic-00001.ipynb', 'Synthetic-00002.ipynb']
+
+
+def test_bench_scale_reports_every_benchmark(tmp_path):
+    """Test that a small benchmark run produces a record per measurement."""
+    results = bench_scale(tmp_path, total_cells=10, cells_per_notebook=5, cell_length=100, repeat=1)
+    names = {result['name'] for result in results}
+    assert {'adapt', 'conversions.pipeline', 'companion_files', 'scan_launchables'} <= names
+    assert 'conversion.magic_commands' in names
+    assert all(result['scale'] == 10 and result['seconds'] >= 0 for result in results)
@@ -0,0 +1,88 @@
+"""
+Tests for reproducible build timestamps.
+"""
+
+import pytest
+from datetime import datetime, timezone
+from pathlib import Path
+
+from adapters import AdapterSession
+from adapters.build_time import last_sync_time, resolve_build_time, source_date_epoch
+
+
+@pytest.fixture
+def templates_dir():
+    """Get templates directory."""
+    return Path(__file__).parent.parent / 'templates'
+
+
+@pytest.fixture
+def test_config():
+    """Test configuration."""
+    return {
+        'model_name': 'Test Model',
+        'launchable_name': 'test-model',
+        'recommended_batch_size': 4,
+        'categories': ['fine-tuning'],
+        'upstream_notebook_url': 'https://example.com/Test.ipynb',
+    }
+
+
+@pytest.fixture
+def last_sync(tmp_path):
+    """Write a last_sync.txt with an upstream commit time."""
+    path = tmp_path / 'last_sync.txt'
+    path.write_text('48732c1f45af38d6d05968a09bd034c0db8a763e\n2025-10-30T06:07:37Z\n')
+    return path
+
+
+def test_source_date_epoch(monkeypatch):
+    """Test SOURCE_DATE_EPOCH parsing."""
+    monkeypatch.delenv('SOURCE_DATE_EPOCH', raising=False)
+    assert source_date_epoch() is None
+
+    monkeypatch.setenv('SOURCE_DATE_EPOCH', '1700000000')
+    assert source_date_epoch() == datetime(2023, 11, 14, 22, 13, 20, tzinfo=timezone.utc)
+
+    monkeypatch.setenv('SOURCE_DATE_EPOCH', 'yesterday')
+    with pytest.raises(ValueError):
+        source_date_epoch()
+
+
+def test_last_sync_time(last_sync, tmp_path):
+    """Test reading the upstream commit time from last_sync.txt."""
+    assert last_sync_time(last_sync) == datetime(2025, 10, 30, 6, 7, 37, tzinfo=timezone.utc)
+    assert last_sync_time(tmp_path / 'missing.txt') is None
+
+    hash_only = tmp_path / 'hash_only.txt'
+    hash_only.write_text('48732c1f45af38d6d05968a09bd034c0db8a763e\n')
+    assert last_sync_time(hash_only) is None
+
+
+def test_resolve_build_time(monkeypatch, last_sync, tmp_path):
+    """Test that SOURCE_DATE_EPOCH wins and reproducible mode falls back to last_sync.txt."""
+    monkeypatch.delenv('SOURCE_DATE_EPOCH', raising=False)
+    assert resolve_build_time(False, last_sync) is None
+    assert resolve_build_time(True, last_sync) == last_sync_time(last_sync)
+    with pytest.raises(ValueError):
+        resolve_build_time(True, tmp_path / 'missing.txt')
+
+    monkeypatch.setenv('SOURCE_DATE_EPOCH', '0')
+    epoch = datetime(1970, 1, 1, tzinfo=timezone.utc)
+    assert resolve_build_time(False, last_sync) == epoch
+    assert resolve_build_time(True, last_sync) == epoch
+
+
+def test_reproducible_companion_files(templates_dir, test_config, last_sync):
+    """Test that a fixed build time makes companion files byte-identical across runs."""
+    build_time = last_sync_time(last_sync)
+    first = AdapterSession(templates_dir, build_time=build_time).adapter.generate_companion_files(
+        Path('Test.ipynb'), test_config
+    )
+    second = AdapterSession(templates_dir, build_time=build_time).adapter.generate_companion_files(
+        Path('Test.ipynb'), test_config
+    )
+
+    assert first == second
+    assert '2025-10-30T06:07:37+00:00' in first['requirements.txt']
+    assert '"last_synced": "2025-10-30T06:07:37+00:00"' in first['.brevconfig.json']
@@ -0,0 +1,125 @@
+"""
+Tests for the persistent converted-cell cache.
+"""
+
+import pytest
+from pathlib import Path
+
+import nbformat
+from nbformat.v4 import new_code_cell, new_markdown_cell, new_notebook
+
+from adapters import ColabToBrevAdapter, base_adapter
+from adapters.cell_cache import CellCache, cell_cache_key
+
+
+@pytest.fixture
+def templates_dir():
+    """Get templates directory."""
+    return Path(__file__).parent.parent / 'templates'
+
+
+@pytest.fixture
+def test_config():
+    """Test configuration."""
+    return {
+        'model_name': 'Test Model',
+        'launchable_name': 'test-model',
+        'recommended_batch_size': 4,
+        'categories': ['fine-tuning'],
+    }
+
+
+def test_cache_round_trip(tmp_path):
+    """Test that entries persist across cache instances."""
+    cache = CellCache(tmp_path)
+    cache.put('a', 'converted a')
+    assert cache.get('a') == 'converted a'  # pending entries are visible
+    cache.close()
+
+    reopened = CellCache(tmp_path)
+    assert reopened.get('a') == 'converted a'
+    assert reopened.get('missing') is None
+    assert len(reopened) == 1
+    reopened.close()
+
+
+def test_cache_prune_evicts_least_recently_used(tmp_path):
+    """Test LRU eviction beyond the size cap."""
+    cache = CellCache(tmp_path, max_entries=2)
+    for key in ['old', 'middle', 'new']:
+        cache.put(key, key)
+        cache.flush()
+
+    # Touch the oldest entry so it becomes the most recently used
+    assert cache.get('old') == 'old'
+    cache.flush()
+
+    assert cache.prune() == 1
+    assert set(cache.keys()) == {'new', 'old'}
+    cache.close()
+
+
+def test_cache_key_inputs():
+    """Test that every input to the key changes the address."""
+    base = cell_cache_key('x = 1', 'code', {'recommended_batch_size': 4}, 'v1')
+
+    assert base == cell_cache_key('x = 1', 'code', {'recommended_batch_size': 4}, 'v1')
+    assert base != cell_cache_key('x = 2', 'code', {'recommended_batch_size': 4}, 'v1')
+    assert base != cell_cache_key('x = 1', 'markdown', {'recommended_batch_size': 4}, 'v1')
+    assert base != cell_cache_key('x = 1', 'code', {'recommended_batch_size': 8}, 'v1')
+    assert base != cell_cache_key('x = 1', 'code', {'recommended_batch_size': 4}, 'v2')
+
+
+def test_rule_version_tracks_conversions(templates_dir):
+    """Test that registering a conversion changes the rule version."""
+    adapter = ColabToBrevAdapter(templates_dir)
+    version = adapter.rule_version()
+
+    assert version == ColabToBrevAdapter(templates_dir).rule_version()
+
+    adapter.register_conversion('extra', lambda code, config: code)
+    assert adapter.rule_version() != version
+
+
+@pytest.mark.parametrize('module_name', ['rewrite_engine', 'cst_backend'])
+def test_rule_version_tracks_engine_modules(templates_dir, monkeypatch, module_name):
+    """Test that editing the matching and rewriting code changes the rule version."""
+    version = ColabToBrevAdapter(templates_dir).rule_version()
+    module_source = base_adapter._module_source
+
+    monkeypatch.setattr(
+        base_adapter, '_module_source',
+        lambda name: module_source(name) + (b'\n# fixed\n' if name == module_name else b'')
+    )
+    assert ColabToBrevAdapter(templates_dir).rule_version() != version
+
+
+def test_adapter_uses_cell_cache(templates_dir, test_config, tmp_path):
+    """Test that a second adaptation is served from the cache with identical output."""
+    notebook_path = tmp_path / 'test.ipynb'
+    with open(notebook_path, 'w') as f:
+        nbformat.write(new_notebook(cells=[
+            new_markdown_cell('See /content/data'),
+            new_code_cell('!pip install numpy'),
+            new_code_cell('per_device_train_batch_size=2'),
+        ]), f)
+
+    uncached, _ = ColabToBrevAdapter(templates_dir).adapt(notebook_path, test_config)
+
+    adapter = ColabToBrevAdapter(templates_dir)
+    adapter.cell_cache = CellCache(tmp_path / 'cache')
+    first, _ = adapter.adapt(notebook_path, test_config)
+    adapter.cell_cache.flush()
+    second, _ = adapter.adapt(notebook_path, test_config)
+
+    assert adapter.stats['cell_cache_misses'] == 3
+    assert adapter.stats['cell_cache_hits'] == 3
+    sources = [cell.source for cell in uncached.cells]
+    assert [cell.source for cell in first.cells] == sources
+    assert [cell.source for cell in second.cells] == sources
+
+    # A config field the conversions read is part of the key
+    test_config['recommended_batch_size'] = 8
+    third, _ = adapter.adapt(notebook_path, test_config)
+    assert 'per_device_train_batch_size=8' in third.cells[-1].source
+    adapter.cell_cache.close()
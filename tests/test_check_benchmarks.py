@@ -0,0 +1,124 @@
+"""
+Tests for the benchmark regression gate.
+"""
+
+from pathlib import Path
+
+# Add parent directory to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts.check_benchmarks import (
+    best_of_reports,
+    compare_metrics,
+    format_table,
+    load_baseline,
+    save_baseline,
+    tracked_metrics
+)
+
+
+def make_report(adapt_seconds=1.0, magic_us=2.0, rss=50.0, calibration=0.01):
+    """Build a minimal run_suite() report."""
+    return {
+        'meta': {},
+        'calibration_seconds': calibration,
+        'peak_rss_mb': rss,
+        'results': [
+            {'name': 'adapt', 'scale': 1000, 'notebooks': 10, 'seconds': adapt_seconds,
+             'per_cell_us': adapt_seconds * 1000},
+            {'name': 'conversion.magic_commands', 'scale': 1000, 'notebooks': 10,
+             'seconds': magic_us / 1000, 'per_cell_us': magic_us},
+        ],
+    }
+
+
+def statuses(rows):
+    return {row['name']: row['status'] for row in rows}
+
+
+def test_tracked_metrics():
+    """Test metric derivation and machine-speed normalization."""
+    metrics = tracked_metrics(make_report())
+    assert metrics['adapt.notebooks_per_sec@1000']['value'] == 10.0
+    assert metrics['adapt.notebooks_per_sec@1000']['higher_is_better']
+    assert metrics['conversion.magic_commands.us_per_cell@1000']['value'] == 2.0
+    assert metrics['peak_rss_mb']['value'] == 50.0
+
+    # A machine twice as slow reports twice the time for the same code
+    normalized = tracked_metrics(make_report(adapt_seconds=2.0, magic_us=4.0), speed_factor=0.5)
+    assert normalized['adapt.notebooks_per_sec@1000']['value'] == 10.0
+    assert normalized['conversion.magic_commands.us_per_cell@1000']['value'] == 2.0
+
+
+def test_compare_metrics_flags_regressions():
+    """Test that regressions beyond the tolerance fail, in either direction of 'better'."""
+    baseline = tracked_metrics(make_report())
+
+    same = compare_metrics(baseline, tracked_metrics(make_report(adapt_seconds=1.1)), 0.25, 1.0)
+    assert set(statuses(same).values()) == {'ok'}
+
+    slower = compare_metrics(
+        baseline, tracked_metrics(make_report(adapt_seconds=2.0, magic_us=10.0, rss=80.0)), 0.25, 1.0
+    )
+    assert statuses(slower) == {
+        'adapt.notebooks_per_sec@1000': 'regressed',
+        'adapt.us_per_cell@1000': 'regressed',
+        'conversion.magic_commands.us_per_cell@1000': 'regressed',
+        'peak_rss_mb': 'regressed',
+    }
+
+    faster = compare_metrics(baseline, tracked_metrics(make_report(adapt_seconds=0.5)), 0.25, 1.0)
+    assert statuses(faster)['adapt.notebooks_per_sec@1000'] == 'improved'
+
+
+def test_compare_metrics_noise_floor_and_missing():
+    """Test that jitter below the noise floor is ignored and metric set changes are reported."""
+    baseline = tracked_metrics(make_report(magic_us=2.0))
+    current = tracked_metrics(make_report(magic_us=2.3))
+    del current['peak_rss_mb']
+
+    rows = compare_metrics(baseline, current, 0.1, 1.0)
+    assert statuses(rows)['conversion.magic_commands.us_per_cell@1000'] == 'ok'
+    assert statuses(rows)['peak_rss_mb'] == 'missing'
+    assert len(format_table(rows)) == len(rows) + 1
+
+    # The floor is capped at a fraction of the baseline, 0.4 µs here
+    rows = compare_metrics(baseline, tracked_metrics(make_report(magic_us=2.5)), 0.1, 1.0)
+    assert statuses(rows)['conversion.magic_commands.us_per_cell@1000'] == 'regressed'
+
+
+def test_compare_metrics_gates_sub_microsecond_metrics():
+    """Test that a 2x slowdown of a metric under 1 µs/cell fails the gate."""
+    baseline = tracked_metrics(make_report(magic_us=0.35))
+
+    rows = compare_metrics(baseline, tracked_metrics(make_report(magic_us=0.7)), 0.35, 1.0)
+    assert statuses(rows)['conversion.magic_commands.us_per_cell@1000'] == 'regressed'
+
+    rows = compare_metrics(baseline, tracked_metrics(make_report(magic_us=0.4)), 0.35, 1.0)
+    assert statuses(rows)['conversion.magic_commands.us_per_cell@1000'] == 'ok'
+
+
+def test_best_of_reports():
+    """Test that rounds keep the fastest time per benchmark."""
+    combined = best_of_reports([
+        make_report(adapt_seconds=2.0, magic_us=1.0, calibration=0.02),
+        make_report(adapt_seconds=1.0, magic_us=3.0, rss=60.0),
+    ])
+    metrics = tracked_metrics(combined)
+    assert metrics['adapt.notebooks_per_sec@1000']['value'] == 10.0
+    assert metrics['conversion.magic_commands.us_per_cell@1000']['value'] == 1.0
+    assert combined['calibration_seconds'] == 0.01
+    assert combined['peak_rss_mb'] == 60.0
+
+
+def test_baseline_round_trip(tmp_path):
+    """Test saving and loading a baseline."""
+    path = tmp_path / 'baseline.json'
+    settings = {'scales': [1000], 'cells_per_notebook': 100, 'cell_length': 200}
+    save_baseline(path, make_report(), settings)
+
+    loaded_settings, baseline = load_baseline(path)
+    assert loaded_settings == settings
+    assert baseline['metrics'] == tracked_metrics(make_report())
+    assert baseline['calibration_seconds'] == 0.01
@@ -6,6 +6,7 @@ import pytest
 from pathlib import Path
 
 from adapters import ColabToBrevAdapter
+from adapters.base_adapter import GeneratedSource
 
 
 @pytest.fixture
@@ -283,3 +284,87 @@ def test_generate_brev_config(adapter, test_config):
     assert 8888 in brev_config['ports']
     assert 'unsloth' in brev_config['tags']
 
+
+
+def test_conversions_skipped_without_triggers(adapter, test_config):
+    """Test that conversions whose triggers are absent are not called."""
+    code = 'x = 1 + 2'
+
+    result = adapter._apply_conversions(code, test_config)
+
+    assert result == code
+    assert adapter.stats['conversion_calls'] == 0
+    code_steps, _ = adapter._get_pipeline('code')
+    assert adapter.stats['conversion_calls_skipped'] == len(code_steps)
+
+
+def test_conversion_triggers_rescanned_after_change(templates_dir, test_config):
+    """Test that a conversion sees triggers introduced by an earlier one."""
+    adapter = ColabToBrevAdapter(templates_dir)
+    adapter.register_conversion('introduce', lambda code, config: code + '\nMARKER', triggers=None)
+    adapter.register_conversion('consume', lambda code, config: code.replace('MARKER', 'done'), triggers=('marker',))
+
+    result = adapter._apply_conversions('x = 1', test_config)
+
+    assert result.endswith('\ndone')
+
+
+def test_markdown_pipeline_skips_code_rewrites(adapter, test_config):
+    """Test that code-only conversions do not fire inside markdown examples."""
+    markdown = '''Install with `!pip install unsloth` and load:
+
+model = FastLanguageModel.from_pretrained("unsloth/llama-3-8b")
+outputs = model.generate(**inputs)'''
+
+    result = adapter._apply_conversions(markdown, test_config, 'markdown')
+
+    assert result == markdown
+
+
+def test_cell_type_scopes(adapter, test_config):
+    """Test that each cell type runs its own pipeline."""
+    instructions = 'To run this, press "*Runtime*" and press "*Run all*" on a free Tesla T4 Google Colab instance!'
+
+    assert 'Runtime' not in adapter._apply_conversions(instructions, test_config, 'markdown')
+    assert adapter._apply_conversions('!nvidia-smi', test_config, 'raw') == '!nvidia-smi'
+    assert 'subprocess' in adapter._apply_conversions('!nvidia-smi', test_config, 'code')
+
+    markdown_steps, _ = adapter._get_pipeline('markdown')
+    assert [name for name, _, _ in markdown_steps] == ['colab_runtime_instructions', 'colab_links', 'storage']
+
+    with pytest.raises(ValueError):
+        adapter.register_conversion('bogus', lambda code, config: code, cell_types=('notebook',))
+
+
+def test_terminal_conversion_short_circuits(adapter, test_config):
+    """Test that the generated Colab install block skips later conversions."""
+    code = '''%%capture
+import os
+if "COLAB_" not in "".join(os.environ.keys()):
+    !pip install unsloth
+gpu_stats = None'''
+
+    result = adapter._apply_conversions(code, test_config, 'code')
+
+    assert type(result) is str
+    assert result == adapter.clean_colab_conditionals(code, test_config)
+    assert 'Enhanced GPU check' not in result
+    assert adapter.stats['conversion_calls_short_circuited'] > 0
+
+
+def test_generated_source_requires_terminal(adapter, test_config):
+    """Test that only terminal conversions may end the pipeline."""
+    adapter.register_conversion('rogue', lambda code, config: GeneratedSource(code))
+
+    with pytest.raises(TypeError):
+        adapter._apply_conversions('x = 1', test_config, 'code')
+
+
+def test_terminal_conversion_order_validated(adapter):
+    """Test that a terminal conversion cannot follow an overlapping one."""
+    adapter.register_conversion(
+        'late_terminal', lambda code, config: code, triggers=('!',), cell_types=('code',), terminal=True
+    )
+
+    with pytest.raises(ValueError, match='late_terminal'):
+        adapter._get_pipeline('code')
@@ -0,0 +1,144 @@
+"""
+Tests for the convert_notebook CLI script.
+"""
+
+import argparse
+import pytest
+from pathlib import Path
+
+import nbformat
+from nbformat.v4 import new_code_cell, new_markdown_cell, new_notebook
+
+# Add parent directory to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from datetime import datetime, timezone
+
+from scripts.convert_notebook import (
+    available_cpu_count,
+    convert_notebooks,
+    group_by_launchable,
+    parse_jobs
+)
+
+
+@pytest.fixture
+def templates_dir():
+    """Get templates directory."""
+    return Path(__file__).parent.parent / 'templates'
+
+
+@pytest.fixture
+def source_notebooks(tmp_path):
+    """Create a few small Colab-style notebooks."""
+    source_dir = tmp_path / 'nb'
+    source_dir.mkdir()
+    paths = []
+    for name in ['Llama3.1_(8B)-Alpaca', 'Gemma3_(4B)', 'Qwen3_(14B)']:
+        notebook = new_notebook(cells=[
+            new_markdown_cell('# Fine-tuning'),
+            new_code_cell('!pip install unsloth'),
+            new_code_cell('output_dir = "/content/outputs"'),
+        ])
+        path = source_dir / f'{name}.ipynb'
+        with open(path, 'w') as f:
+            nbformat.write(notebook, f)
+        paths.append(path)
+    return paths
+
+
+def test_parse_jobs():
+    """Test --jobs parsing."""
+    assert parse_jobs('4') == 4
+    assert parse_jobs('auto') == available_cpu_count()
+    assert available_cpu_count() >= 1
+
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_jobs('0')
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_jobs('many')
+
+
+def test_convert_notebooks_parallel_matches_serial(source_notebooks, templates_dir, tmp_path):
+    """Test that the process pool produces the same notebooks as a serial run."""
+    serial_dir = tmp_path / 'serial'
+    parallel_dir = tmp_path / 'parallel'
+
+    serial, serial_stats = convert_notebooks(source_notebooks, serial_dir, templates_dir, jobs=1)
+    parallel, parallel_stats = convert_notebooks(source_notebooks, parallel_dir, templates_dir, jobs=2)
+
+    assert serial == parallel == [True, True, True]
+    assert serial_stats == parallel_stats
+    assert serial_stats['conversion_calls_skipped'] > 0
+
+    serial_notebooks = sorted(p.relative_to(serial_dir) for p in serial_dir.glob('*/*.ipynb'))
+    parallel_notebooks = sorted(p.relative_to(parallel_dir) for p in parallel_dir.glob('*/*.ipynb'))
+    assert serial_notebooks == parallel_notebooks
+    for relative_path in serial_notebooks:
+        serial_nb = nbformat.read(serial_dir / relative_path, as_version=4)
+        parallel_nb = nbformat.read(parallel_dir / relative_path, as_version=4)
+        assert [c.source for c in serial_nb.cells] == [c.source for c in parallel_nb.cells]
+
+
+def test_convert_notebooks_preserves_order(source_notebooks, templates_dir, tmp_path):
+    """Test that failures are reported against the right notebook."""
+    missing = source_notebooks[0].parent / 'Missing.ipynb'
+    notebooks = [source_notebooks[0], missing, source_notebooks[1]]
+
+    results, _ = convert_notebooks(notebooks, tmp_path / 'out', templates_dir, jobs=2)
+
+    assert results == [True, False, True]
+
+
+def test_reconvert_leaves_unchanged_notebooks_alone(source_notebooks, templates_dir, tmp_path):
+    """Test that converting again does not rewrite identical notebooks."""
+    output_dir = tmp_path / 'out'
+    _, first = convert_notebooks(source_notebooks, output_dir, templates_dir)
+    assert first['files_skipped'] == 0
+
+    notebook_outputs = sorted(output_dir.glob('*/*.ipynb'))
+    mtimes = [p.stat().st_mtime_ns for p in notebook_outputs]
+    _, second = convert_notebooks(source_notebooks, output_dir, templates_dir)
+
+    assert second['files_skipped'] >= len(notebook_outputs)
+    assert second['bytes_skipped'] > 0
+    assert [p.stat().st_mtime_ns for p in notebook_outputs] == mtimes
+
+
+def test_shared_launchable_companions_render_and_write_once(source_notebooks, templates_dir, tmp_path):
+    """Test that notebooks of one launchable share a single companion set per run."""
+    sibling = source_notebooks[2].parent / 'Qwen3_(14B)-Reasoning-Conversational.ipynb'
+    sibling.write_bytes(source_notebooks[2].read_bytes())
+    notebooks = source_notebooks + [sibling]
+    assert group_by_launchable(notebooks) == [[0], [1], [2, 3]]
+
+    build_time = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    serial, serial_stats = convert_notebooks(notebooks, tmp_path / 'serial', templates_dir, build_time=build_time)
+    parallel, parallel_stats = convert_notebooks(
+        notebooks, tmp_path / 'parallel', templates_dir, jobs=2, build_time=build_time
+    )
+
+    assert serial == parallel == [True] * 4
+    # Four templates rendered for each of the three launchables
+    assert serial_stats['template_renders'] == 12
+    assert serial_stats['template_render_hits'] == 4
+    assert serial_stats['companion_files_reused'] == 5
+    for name in ['template_renders', 'template_render_hits', 'companion_files_reused', 'files_written']:
+        assert parallel_stats[name] == serial_stats[name]
+
+
+@pytest.mark.parametrize('jobs', [1, 2])
+def test_shared_launchable_companions_written_once_without_build_time(source_notebooks, templates_dir,
+                                                                     tmp_path, monkeypatch, jobs):
+    """Test that the run timestamp is pinned, so shared companions are written once by default."""
+    monkeypatch.delenv('SOURCE_DATE_EPOCH', raising=False)
+    sibling = source_notebooks[2].parent / 'Qwen3_(14B)-Reasoning-Conversational.ipynb'
+    sibling.write_bytes(source_notebooks[2].read_bytes())
+    notebooks = [source_notebooks[2], sibling, source_notebooks[0]]
+
+    results, stats = convert_notebooks(notebooks, tmp_path / 'out', templates_dir, jobs=jobs, build_time=None)
+
+    assert results == [True] * 3
+    assert stats['template_render_hits'] == 4
+    assert stats['companion_files_reused'] == 5
@@ -0,0 +1,154 @@
+"""
+Tests for the libcst code conversion backend.
+"""
+
+import pytest
+from pathlib import Path
+
+pytest.importorskip('libcst')
+
+from adapters import ColabToBrevAdapter
+from adapters.cst_backend import CstBackend, mask_magics, model_config_transformers, unmask_magics
+
+
+@pytest.fixture
+def templates_dir():
+    """Get templates directory."""
+    return Path(__file__).parent.parent / 'templates'
+
+
+@pytest.fixture
+def adapter(templates_dir):
+    """Create adapter instance using the CST backend."""
+    adapter = ColabToBrevAdapter(templates_dir)
+    adapter.code_backend = 'cst'
+    return adapter
+
+
+@pytest.fixture
+def test_config():
+    """Test configuration."""
+    return {
+        'model_name': 'Test Model',
+        'launchable_name': 'test-model',
+        'recommended_batch_size': 4,
+    }
+
+
+def test_mask_magics_round_trip():
+    """Test that magics are masked with their indentation and restored exactly."""
+    code = '%%capture\nimport os\nif True:\n    !pip install a \\\n        b\nfiles = !ls\nx = 5 % 2'
+    masked, magics = mask_magics(code)
+
+    assert magics == ['%%capture', '!pip install a \\\n        b', 'files = !ls']
+    assert '!' not in masked
+    assert '    pass  # brev-magic-1' in masked
+    assert 'x = 5 % 2' in masked
+    assert unmask_magics(masked, magics) == code
+
+
+def test_device_map_with_nested_parentheses():
+    """Test that device_map is added to the from_pretrained call, not an inner call."""
+    code = (
+        'model, tokenizer = FastLanguageModel.from_pretrained(\n'
+        '    model_name = get_name("llama"),\n'
+        '    load_in_4bit = True, # 4bit\n'
+        ')'
+    )
+    converted = CstBackend().transform(code, model_config_transformers())
+
+    assert converted == (
+        'model, tokenizer = FastLanguageModel.from_pretrained(\n'
+        '    model_name = get_name("llama"),\n'
+        '    load_in_4bit = True, # 4bit\n'
+        '    device_map="auto")'
+    )
+
+
+def test_device_map_not_duplicated():
+    """Test calls that already pass or may pass device_map."""
+    backend = CstBackend()
+    for code in [
+        'm = FastLanguageModel.from_pretrained("x", device_map="cuda:0")',
+        'm = FastLanguageModel.from_pretrained("x", **kwargs)',
+        'm = AutoModel.from_pretrained("x")',
+        '# FastLanguageModel.from_pretrained(x)',
+    ]:
+        assert backend.transform(code, model_config_transformers()) is code
+
+
+def test_output_dir_and_batch_size():
+    """Test keyword and assignment rewrites, leaving look-alikes alone."""
+    code = (
+        'args = SFTConfig(per_device_train_batch_size = 2, output_dir = "outputs")\n'
+        "args.output_dir = 'x'\n"
+        'my_output_dir = "y"  # output_dir = "z"\n'
+        'per_device_train_batch_size = 2 * 4\n'
+    )
+    converted = CstBackend().transform(code, model_config_transformers(8))
+
+    assert converted == (
+        'args = SFTConfig(per_device_train_batch_size=8, output_dir="/workspace/outputs")\n'
+        'args.output_dir="/workspace/outputs"\n'
+        'my_output_dir = "y"  # output_dir = "z"\n'
+        'per_device_train_batch_size = 2 * 4\n'
+    )
+
+
+def test_backends_agree_on_typical_cells(templates_dir, adapter, test_config):
+    """Test that the CST backend reproduces the regex backend's output."""
+    regex_adapter = ColabToBrevAdapter(templates_dir)
+    for code in [
+        'model, tokenizer = FastLanguageModel.from_pretrained(\n'
+        '    model_name = "unsloth/Llama-3.2-3B-Instruct",\n'
+        '    max_seq_length = 2048,\n'
+        '    load_in_4bit = True,\n'
+        ')',
+        'trainer = SFTTrainer(\n    args = SFTConfig(\n        per_device_train_batch_size = 2,\n'
+        '        output_dir = "outputs",\n    ),\n)',
+        '!pip install unsloth\nmodel = FastLanguageModel.from_pretrained("x")',
+        'outputs = model.generate(**inputs, max_new_tokens = 64)',
+    ]:
+        assert adapter._apply_conversions(code, test_config) == regex_adapter._apply_conversions(code, test_config)
+
+
+def test_unparseable_cells_fall_back(adapter, test_config):
+    """Test that cells that are not Python use the regex rewrites."""
+    code = '%%bash\nfor f in *; do echo $f; done\npython train.py output_dir = "outputs"'
+
+    converted = adapter.adapt_model_config(code, test_config)
+
+    assert 'output_dir="/workspace/outputs"' in converted
+    assert adapter.stats['cst_fallbacks'] == 1
+
+
+def test_generation_cache_ignores_comments(adapter, test_config):
+    """Test that only real generation calls get the cache setup."""
+    assert adapter.setup_generation_cache('# call model.generate(x) later', test_config).startswith('#')
+    assert 'TORCHINDUCTOR_CACHE_DIR' in adapter.setup_generation_cache('y = trainer.generate(x)', test_config)
+
+
+def test_conversions_share_one_parse(monkeypatch):
+    """Test that the next conversion reuses the tree of the converted text."""
+    import libcst
+    parses = []
+    parse_module = libcst.parse_module
+    monkeypatch.setattr(libcst, 'parse_module', lambda code: parses.append(code) or parse_module(code))
+
+    backend = CstBackend()
+    converted = backend.transform('m = FastLanguageModel.from_pretrained("x")', model_config_transformers())
+
+    assert backend.contains_call(converted, ['FastLanguageModel.from_pretrained']) is True
+    assert len(parses) == 1
+
+
+def test_code_backend_selection(templates_dir):
+    """Test backend validation and that the backend keys the cell cache."""
+    adapter = ColabToBrevAdapter(templates_dir)
+    regex_version = adapter.rule_version()
+
+    adapter.code_backend = 'cst'
+    assert adapter.rule_version() != regex_version
+
+    with pytest.raises(ValueError):
+        adapter.code_backend = 'ast'
@@ -0,0 +1,207 @@
+"""
+Tests for the launchables registry and its incremental updates.
+"""
+
+import json
+import os
+import sys
+import time
+import pytest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scripts import generate_metadata
+from scripts.generate_metadata import (
+    BREV_CONFIG_NAME,
+    MTIME_RESOLUTION_NS,
+    default_state_path,
+    directory_digest,
+    main,
+    scan_launchables,
+    sort_launchables,
+    update_launchables,
+)
+
+
+def make_launchable(notebooks_dir, name, notebooks, description='A launchable'):
+    """Write a minimal converted launchable directory."""
+    launchable_dir = notebooks_dir / name
+    launchable_dir.mkdir(parents=True, exist_ok=True)
+    (launchable_dir / '.brevconfig.json').write_text(json.dumps({
+        'description': description,
+        'gpu': {'recommended': 'L4'},
+        'tags': ['fine-tuning'],
+    }))
+    (launchable_dir / 'requirements.txt').write_text('unsloth\n')
+    for notebook in notebooks:
+        (launchable_dir / notebook).write_text('{}')
+    return launchable_dir
+
+
+def backdate(notebooks_dir):
+    """Make every launchable look converted well before the next scan."""
+    past = time.time_ns() - 10 * MTIME_RESOLUTION_NS
+    for launchable_dir in notebooks_dir.iterdir():
+        for path in (launchable_dir / BREV_CONFIG_NAME, launchable_dir):
+            if path.exists():
+                os.utime(path, ns=(past, past))
+
+
+@pytest.fixture
+def notebooks_dir(tmp_path):
+    """Converted directory with three launchables."""
+    notebooks_dir = tmp_path / 'converted'
+    make_launchable(notebooks_dir, 'llama-3-1-8b', ['Llama3.1_(8B)-Alpaca.ipynb'])
+    make_launchable(notebooks_dir, 'qwen3-14b', ['Qwen3_(14B).ipynb', 'Qwen3_(14B)-Reasoning.ipynb'])
+    make_launchable(notebooks_dir, 'gemma-3-4b', ['Gemma3_(4B).ipynb'])
+    return notebooks_dir
+
+
+def run_main(monkeypatch, notebooks_dir, output, *extra):
+    """Run generate_metadata.py with a fixed build time and return its registry."""
+    monkeypatch.setenv('SOURCE_DATE_EPOCH', '1700000000')
+    monkeypatch.setattr(sys, 'argv', [
+        'generate_metadata.py', '--notebooks-dir', str(notebooks_dir),
+        '--output', str(output), '--reproducible', *extra
+    ])
+    main()
+    return json.loads(output.read_text())
+
+
+def test_update_matches_full_scan(notebooks_dir):
+    """Test that a first update scans everything and matches scan_launchables."""
+    launchables, directories, stats = update_launchables(notebooks_dir, [], {})
+
+    assert sort_launchables(launchables) == sort_launchables(scan_launchables(notebooks_dir))
+    assert stats == {'read': 3, 'scanned': 3, 'reused': 0, 'removed': 0}
+    assert directories['qwen3-14b']['entries'] == 2
+
+
+def test_threaded_scan_matches_serial(monkeypatch, notebooks_dir):
+    """Test that reading directories on the thread pool keeps results and order."""
+    make_launchable(notebooks_dir, 'phi-4', ['Phi_4-Conversational.ipynb', '.hidden.ipynb'])
+    (notebooks_dir / 'phi-4' / 'outputs').mkdir()
+    serial = scan_launchables(notebooks_dir, jobs=1)
+
+    monkeypatch.setattr(generate_metadata, 'SCAN_BATCH_SIZE', 1)
+    assert scan_launchables(notebooks_dir, jobs=3) == serial
+
+    # Hidden notebooks are launchables too, as Path.glob('*.ipynb') lists them
+    phi = [launchable for launchable in serial if launchable['path'] == 'phi-4']
+    assert [launchable['notebook'] for launchable in phi] == ['.hidden.ipynb', 'Phi_4-Conversational.ipynb']
+    assert phi[0]['id'] == 'phi-4/.hidden'
+    assert phi[1]['files'] == ['.brevconfig.json', 'requirements.txt', 'Phi_4-Conversational.ipynb']
+
+
+def test_only_changed_directories_are_rescanned(notebooks_dir):
+    """Test that unchanged directories reuse their entries and changes are picked up."""
+    launchables, directories, _ = update_launchables(notebooks_dir, [], {})
+
+    make_launchable(notebooks_dir, 'gemma-3-4b', ['Gemma3_(4B).ipynb'], description='Edited')
+    make_launchable(notebooks_dir, 'phi-4', ['Phi_4-Conversational.ipynb'])
+    (notebooks_dir / 'qwen3-14b' / 'Qwen3_(14B)-Reasoning.ipynb').unlink()
+    for path in (notebooks_dir / 'llama-3-1-8b').iterdir():
+        path.unlink()
+    (notebooks_dir / 'llama-3-1-8b').rmdir()
+
+    updated, updated_dirs, stats = update_launchables(notebooks_dir, launchables, directories)
+
+    assert stats == {'read': 3, 'scanned': 3, 'reused': 0, 'removed': 1}
+    assert sort_launchables(updated) == sort_launchables(scan_launchables(notebooks_dir))
+
+    # Notebook contents do not affect the entries, so editing one changes nothing
+    (notebooks_dir / 'phi-4' / 'Phi_4-Conversational.ipynb').write_text('{"cells": []}')
+    again, _, stats = update_launchables(notebooks_dir, updated, updated_dirs)
+    assert stats == {'read': 3, 'scanned': 0, 'reused': 3, 'removed': 0}
+    assert again == updated
+
+
+def test_unchanged_stamps_skip_reading(monkeypatch, notebooks_dir):
+    """Test that only directories whose stamp changed are read."""
+    backdate(notebooks_dir)
+    launchables, directories, _ = update_launchables(notebooks_dir, [], {})
+    assert all(directory['stamp'] for directory in directories.values())
+
+    read = []
+    original = generate_metadata.read_launchable_dir
+
+    def recording_read(launchable_dir):
+        read.append(launchable_dir.name)
+        return original(launchable_dir)
+
+    monkeypatch.setattr(generate_metadata, 'read_launchable_dir', recording_read)
+
+    again, _, stats = update_launchables(notebooks_dir, launchables, directories)
+    assert (read, stats) == ([], {'read': 0, 'scanned': 0, 'reused': 3, 'removed': 0})
+    assert again == launchables
+
+    # Editing .brevconfig.json in place, or adding a notebook, is noticed
+    config_path = notebooks_dir / 'gemma-3-4b' / BREV_CONFIG_NAME
+    config_path.write_text(config_path.read_text().replace('A launchable', 'B launchable'))
+    (notebooks_dir / 'qwen3-14b' / 'Qwen3_(14B)-GRPO.ipynb').write_text('{}')
+    updated, updated_dirs, stats = update_launchables(notebooks_dir, launchables, directories)
+
+    assert sorted(read) == ['gemma-3-4b', 'qwen3-14b']
+    assert stats == {'read': 2, 'scanned': 2, 'reused': 1, 'removed': 0}
+    assert sort_launchables(updated) == sort_launchables(scan_launchables(notebooks_dir))
+    # Stamps this close to the scan are not trusted by the next one
+    assert updated_dirs['gemma-3-4b']['stamp'] is None
+    assert updated_dirs['llama-3-1-8b']['stamp'] == directories['llama-3-1-8b']['stamp']
+
+
+def test_reused_entries_must_match_state(notebooks_dir):
+    """Test that a directory whose recorded entries went missing is rescanned."""
+    launchables, directories, _ = update_launchables(notebooks_dir, [], {})
+    partial = [launchable for launchable in launchables if launchable['id'] != 'qwen3-14b/Qwen3_(14B)-Reasoning']
+
+    updated, _, stats = update_launchables(notebooks_dir, partial, directories)
+
+    assert stats['scanned'] == 1
+    assert sort_launchables(updated) == sort_launchables(launchables)
+
+
+def test_incremental_main_patches_registry(monkeypatch, notebooks_dir, tmp_path):
+    """Test that an incremental run writes the same registry as a full one."""
+    output = tmp_path / 'metadata' / 'launchables.json'
+    full = run_main(monkeypatch, notebooks_dir, output)
+    assert default_state_path(output).exists()
+
+    make_launchable(notebooks_dir, 'phi-4', ['Phi_4-Conversational.ipynb'])
+    incremental = run_main(monkeypatch, notebooks_dir, output, '--incremental', '--verify')
+    fresh = run_main(monkeypatch, notebooks_dir, tmp_path / 'fresh.json')
+
+    assert incremental == fresh
+    assert incremental['total_launchables'] == full['total_launchables'] + 1
+    assert incremental['launchables'] == sort_launchables(incremental['launchables'])
+
+
+def test_edited_registry_falls_back_to_full_scan(monkeypatch, notebooks_dir, tmp_path):
+    """Test that a registry edited after the last scan is rebuilt from scratch."""
+    output = tmp_path / 'launchables.json'
+    registry = run_main(monkeypatch, notebooks_dir, output)
+
+    registry['launchables'][0]['name'] = 'Tampered'
+    output.write_text(json.dumps(registry, indent=2))
+
+    assert run_main(monkeypatch, notebooks_dir, output, '--incremental') == run_main(
+        monkeypatch, notebooks_dir, tmp_path / 'fresh.json'
+    )
+
+
+def test_verify_fails_on_stale_state(monkeypatch, notebooks_dir, tmp_path):
+    """Test that --verify fails, and writes a full scan, when the state is wrong."""
+    output = tmp_path / 'launchables.json'
+    run_main(monkeypatch, notebooks_dir, output)
+
+    # A state that already claims the digest of the edited directory
+    make_launchable(notebooks_dir, 'gemma-3-4b', ['Gemma3_(4B).ipynb'], description='Edited')
+    state_path = default_state_path(output)
+    state = json.loads(state_path.read_text())
+    state['directories']['gemma-3-4b']['digest'] = directory_digest(notebooks_dir / 'gemma-3-4b')
+    state_path.write_text(json.dumps(state))
+
+    with pytest.raises(SystemExit):
+        run_main(monkeypatch, notebooks_dir, output, '--incremental', '--verify')
+    assert json.loads(output.read_text())['launchables'] == sort_launchables(scan_launchables(notebooks_dir))
@@ -0,0 +1,93 @@
+"""
+Tests for the queryable launchables index and the query_launchables CLI.
+"""
+
+import json
+import random
+import sys
+import pytest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adapters.launchables_index import LaunchablesIndex, launchable_category
+from benchmarks.bench_query import GPU_MIX, TAG_MIX, linear_query, synthetic_launchables
+from scripts import query_launchables
+
+
+@pytest.fixture
+def launchables():
+    """Synthetic registry entries, plus ones with odd GPU fields."""
+    entries = synthetic_launchables(2000, seed=7)
+    entries.append({'id': 'no-gpu/A', 'name': 'A', 'path': 'no-gpu', 'tags': ['unsloth', 'vision']})
+    entries.append({'id': 'bad-vram/B', 'name': 'B', 'path': 'bad-vram', 'tags': ['vision'],
+                    'gpu': {'tier': 'l4', 'min_vram_gb': 'lots'}})
+    return entries
+
+
+def test_queries_match_linear_scan(launchables):
+    """Test that random queries return what a loop over the registry does."""
+    index = LaunchablesIndex(launchables)
+    rng = random.Random(3)
+    tags = sorted({tag for extra, _ in TAG_MIX for tag in extra} | {'unsloth', 'missing'})
+    vram = sorted({min_vram for _, min_vram, _ in GPU_MIX})
+
+    for _ in range(500):
+        query = {}
+        if rng.random() < 0.6:
+            query['tags'] = rng.sample(tags, rng.randint(1, 2))
+        if rng.random() < 0.3:
+            query['tier'] = rng.choice([tier for tier, *_ in GPU_MIX] + ['l4', 'B200'])
+        if rng.random() < 0.3:
+            query['category'] = rng.choice(['Vision', 'reasoning', 'Other', 'Audio', 'nope'])
+        if rng.random() < 0.4:
+            query['max_vram_gb'] = rng.choice(vram) + rng.choice([0, 0.5, -1])
+        if rng.random() < 0.3:
+            query['min_vram_gb'] = rng.choice(vram)
+        assert index.query(**query) == linear_query(launchables, **query), query
+
+
+def test_categories_group_by_first_specific_tag(launchables):
+    """Test category grouping and its case-insensitive lookup."""
+    index = LaunchablesIndex(launchables)
+    categories = index.categories()
+
+    assert list(categories) == sorted(categories)
+    assert sum(len(group) for group in categories.values()) == len(launchables)
+    assert launchable_category({'tags': ['unsloth', 'fine-tuning']}) == 'Other'
+    assert launchable_category({'tags': ['fine-tuning', 'text-generation', 'vision']}) == 'Text-Generation'
+    assert index.query(category='VISION') == categories['Vision']
+
+
+def test_unknown_vram_never_matches_bounds(launchables):
+    """Test that launchables without a numeric VRAM requirement fall outside any bound."""
+    index = LaunchablesIndex(launchables)
+
+    ids = {launchable['id'] for launchable in index.query(tags=['vision'], max_vram_gb=1000)}
+    assert not ids & {'no-gpu/A', 'bad-vram/B'}
+    assert {'no-gpu/A', 'bad-vram/B'} <= {launchable['id'] for launchable in index.query(tags=['vision'])}
+    assert index.query(tier='L4', tags=['vision'])[-1]['id'] == 'bad-vram/B'
+
+
+def test_cli_emits_json(tmp_path, monkeypatch, capsys, launchables):
+    """Test the query_launchables command line."""
+    registry_path = tmp_path / 'launchables.json'
+    registry_path.write_text(json.dumps({'version': '1.0.0', 'launchables': launchables}))
+
+    monkeypatch.setattr(sys, 'argv', [
+        'query_launchables.py', '--metadata-path', str(registry_path),
+        '--category', 'vision', '--max-vram', '24', '--fields', 'id,gpu', '--limit', '3'
+    ])
+    query_launchables.main()
+    result = json.loads(capsys.readouterr().out)
+
+    expected = linear_query(launchables, category='vision', max_vram_gb=24)
+    assert result['total'] == len(expected)
+    assert result['launchables'] == [{'id': entry['id'], 'gpu': entry['gpu']} for entry in expected[:3]]
+
+    monkeypatch.setattr(sys, 'argv', ['query_launchables.py', '--metadata-path', str(registry_path), '--summary'])
+    query_launchables.main()
+    summary = json.loads(capsys.readouterr().out)
+    assert summary['total_launchables'] == len(launchables)
+    assert summary['tags']['unsloth'] == len(launchables) - 1
@@ -0,0 +1,114 @@
+"""
+Tests for the incremental conversion manifest.
+"""
+
+import json
+import subprocess
+import sys
+import pytest
+from pathlib import Path
+
+import nbformat
+from nbformat.v4 import new_code_cell, new_notebook
+
+from adapters import get_config_for_notebook
+from adapters.manifest import ConversionManifest
+
+SCRIPT = Path(__file__).parent.parent / 'scripts' / 'convert_notebook.py'
+
+
+@pytest.fixture
+def templates_dir():
+    """Get templates directory."""
+    return Path(__file__).parent.parent / 'templates'
+
+
+@pytest.fixture
+def source_dir(tmp_path):
+    """Create a source directory with two notebooks."""
+    source = tmp_path / 'nb'
+    source.mkdir()
+    for name in ['Gemma3_(4B)', 'Qwen3_(14B)']:
+        with open(source / f'{name}.ipynb', 'w') as f:
+            nbformat.write(new_notebook(cells=[new_code_cell('!pip install unsloth')]), f)
+    return source
+
+
+def test_fingerprint_tracks_inputs(source_dir, templates_dir, tmp_path):
+    """Test that a fingerprint changes with the source, the config and the code backend."""
+    manifest = ConversionManifest(tmp_path / 'manifest.json', templates_dir)
+    notebook = source_dir / 'Gemma3_(4B).ipynb'
+    config = get_config_for_notebook(notebook.stem)
+    output_dir = tmp_path / 'out'
+
+    fingerprint = manifest.fingerprint(notebook, config, output_dir)
+    assert fingerprint == manifest.fingerprint(notebook, config, output_dir)
+    assert fingerprint != manifest.fingerprint(notebook, {**config, 'recommended_batch_size': 1}, output_dir)
+    assert fingerprint != manifest.fingerprint(notebook, config, tmp_path / 'elsewhere')
+    assert fingerprint != manifest.fingerprint(notebook, config, output_dir, code_backend='cst')
+
+    with open(notebook, 'a') as f:
+        f.write('\n')
+    assert fingerprint != manifest.fingerprint(notebook, config, output_dir)
+
+
+def test_up_to_date_requires_output(source_dir, templates_dir, tmp_path):
+    """Test that a recorded notebook is only skipped while its output exists."""
+    manifest = ConversionManifest(tmp_path / 'manifest.json', templates_dir)
+    notebook = source_dir / 'Gemma3_(4B).ipynb'
+    fingerprint = manifest.fingerprint(notebook, get_config_for_notebook(notebook.stem), tmp_path / 'out')
+
+    assert not manifest.is_up_to_date(notebook.name, fingerprint)
+    manifest.record(notebook.name, fingerprint)
+    assert not manifest.is_up_to_date(notebook.name, fingerprint)
+
+    output = Path(fingerprint['output'])
+    output.parent.mkdir(parents=True)
+    output.write_text('{}')
+    assert manifest.is_up_to_date(notebook.name, fingerprint)
+
+
+def test_manifest_save_and_load(source_dir, templates_dir, tmp_path):
+    """Test that entries survive a save/load round trip and stale ones can be dropped."""
+    path = tmp_path / 'metadata' / 'manifest.json'
+    manifest = ConversionManifest(path, templates_dir)
+    manifest.record('a.ipynb', {'source_hash': 'a'})
+    manifest.record('b.ipynb', {'source_hash': 'b'})
+    manifest.save()
+
+    loaded = ConversionManifest.load(path, templates_dir)
+    assert loaded.entries == manifest.entries
+    assert loaded.retain(['b.ipynb']) == 1
+    assert list(loaded.entries) == ['b.ipynb']
+
+    path.write_text('not json')
+    assert ConversionManifest.load(path, templates_dir).entries == {}
+
+
+def test_cli_skips_unchanged_notebooks(source_dir, tmp_path):
+    """Test that a second run only converts the notebook that changed."""
+    output_dir = tmp_path / 'out'
+    manifest_path = tmp_path / 'manifest.json'
+    command = [
+        sys.executable, str(SCRIPT),
+        '--source', str(source_dir),
+        '--output', str(output_dir),
+        '--manifest', str(manifest_path),
+        '--no-cache',
+    ]
+
+    first = subprocess.run(command, capture_output=True, text=True)
+    assert first.returncode == 0, first.stderr
+    assert 'Up to date: 0' in first.stderr
+    assert len(json.loads(manifest_path.read_text())['notebooks']) == 2
+
+    with open(source_dir / 'Qwen3_(14B).ipynb', 'w') as f:
+        nbformat.write(new_notebook(cells=[new_code_cell('!pip install unsloth vllm')]), f)
+
+    second = subprocess.run(command, capture_output=True, text=True)
+    assert second.returncode == 0, second.stderr
+    assert 'Up to date: 1' in second.stderr
+    assert 'Converted: 1' in second.stderr
+
+    forced = subprocess.run(command + ['--force'], capture_output=True, text=True)
+    assert 'Converted: 2' in forced.stderr
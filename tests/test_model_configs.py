@@ -0,0 +1,174 @@
+"""
+Tests for the model registry and notebook-to-config resolution.
+"""
+
+import json
+import pickle
+import random
+import pytest
+from pathlib import Path
+
+# Add parent directory to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adapters.model_configs import (
+    MODEL_CONFIGS,
+    REGISTRY_INDEX_PATH,
+    REGISTRY_PATH,
+    ConfigResolver,
+    ModelConfig,
+    ModelRegistry,
+    build_registry_index,
+    get_config_for_notebook,
+    load_registry,
+    normalize_notebook_name,
+)
+from scripts.build_config_index import render_index
+
+
+def scan_for_key(clean_name, configs, min_match_length=5):
+    """Reference linear scan over every config key."""
+    if clean_name in configs:
+        return clean_name
+    best_match = None
+    best_score = 0
+    for config_key in configs:
+        if config_key in clean_name:
+            score = len(config_key)
+        elif clean_name in config_key:
+            score = len(clean_name)
+        else:
+            continue
+        if score > best_score:
+            best_score = score
+            best_match = config_key
+    return best_match if best_score >= min_match_length else None
+
+
+def test_resolver_matches_linear_scan():
+    """Test that indexed lookup ranks matches like a scan over all keys."""
+    resolver = ConfigResolver(MODEL_CONFIGS)
+    keys = list(MODEL_CONFIGS)
+    rng = random.Random(0)
+
+    names = list(keys)
+    for _ in range(3000):
+        parts = []
+        for _ in range(rng.randint(1, 3)):
+            key = rng.choice(keys)
+            start = rng.randint(0, len(key))
+            parts.append(key[start:rng.randint(start, len(key))])
+        names.append(rng.choice(['', 'x-']) + rng.choice(['-', '_']).join(parts))
+
+    for name in names:
+        clean_name = normalize_notebook_name(name)
+        assert resolver.match(clean_name) == scan_for_key(clean_name, MODEL_CONFIGS), name
+
+
+def test_resolver_tie_breaks_by_registration_order():
+    """Test that equally long matches go to the key registered first."""
+    configs = {'alpha-model': {'n': 1}, 'omega-model': {'n': 2}, 'alpha-model-large': {'n': 3}}
+    resolver = ConfigResolver(configs)
+
+    # Both keys are 11 characters; position in the name does not matter
+    assert resolver.match('omega-model-alpha-model') == 'alpha-model'
+    assert resolver.match('alpha-model-large-x') == 'alpha-model-large'
+    assert resolver.match('model') == 'alpha-model'
+    assert resolver.match('mode') is None
+
+
+def test_resolved_configs_are_memoized_and_read_only():
+    """Test that repeated lookups share one immutable view."""
+    config = get_config_for_notebook('Llama_3.1_(8B).ipynb')
+
+    assert get_config_for_notebook('Llama_3.1_(8B)') is config
+    assert isinstance(config['categories'], tuple)
+    with pytest.raises(TypeError):
+        config['recommended_batch_size'] = 64
+
+    # Unknown notebooks get a generated (and equally read-only) config
+    unknown = get_config_for_notebook('Totally-New-Notebook')
+    assert unknown['model_name'] == 'Totally New Notebook'
+    with pytest.raises(TypeError):
+        unknown['model_name'] = 'x'
+
+    mutable = dict(config)
+    mutable['recommended_batch_size'] = 64
+    assert config['recommended_batch_size'] != 64
+
+
+def test_model_config_defaults_and_mapping_shim():
+    """Test that records fill defaults and read like configuration dictionaries."""
+    record = ModelConfig.from_mapping({'model_name': 'Test Model', 'categories': ['vision'], 'extra': 1})
+
+    assert record.recommended_gpu == 'L4'
+    assert record['min_vram_gb'] == 16
+    assert record.get('extra') is None
+    assert 'categories' in record
+    assert dict(record)['categories'] == ('vision',)
+    assert ModelConfig.from_mapping(record) is record
+    assert record == ModelConfig(model_name='Test Model', categories=('vision',))
+
+
+def test_model_config_records_are_compact_and_frozen():
+    """Test slots, immutability, interning and pickling."""
+    record = MODEL_CONFIGS['llama-3.1-8b']
+
+    assert not hasattr(record, '__dict__')
+    with pytest.raises(AttributeError):
+        record.recommended_gpu = 'H100'
+    with pytest.raises(AttributeError):
+        record.notes = 'x'
+
+    # Equal category lists share one tuple
+    other = ModelConfig(categories=list(record.categories))
+    assert other.categories is record.categories
+
+    # Records cross process boundaries to conversion workers
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_committed_index_is_up_to_date():
+    """Test that the shipped index was rebuilt after the last registry edit."""
+    assert REGISTRY_INDEX_PATH.read_text(encoding='utf-8') == render_index(REGISTRY_PATH)
+
+
+def test_index_round_trip_resolves_identically():
+    """Test that a resolver restored from the index matches a freshly built one."""
+    source = json.loads(REGISTRY_PATH.read_text(encoding='utf-8'))
+    built = ConfigResolver(source)
+    restored = ConfigResolver.from_index(build_registry_index(REGISTRY_PATH))
+
+    assert dict(restored.configs) == dict(built.configs)
+    names = list(source) + [
+        config['upstream_notebook_url'].rsplit('/', 1)[-1] for config in source.values()
+    ] + ['Llama3_1_(8B)-Alpaca.ipynb', 'Qwen2_5_(7B)', 'unknown-model-xyz', 'gemma']
+    for name in names:
+        assert restored.resolve(name) == built.resolve(name), name
+
+
+def test_stale_index_falls_back_to_source(tmp_path):
+    """Test that edits to the registry take effect before the index is rebuilt."""
+    source = json.loads(REGISTRY_PATH.read_text(encoding='utf-8'))
+    source['llama-3.1-8b']['recommended_gpu'] = 'H100'
+    source_path = tmp_path / 'model_configs.json'
+    source_path.write_text(json.dumps(source), encoding='utf-8')
+
+    resolver = load_registry(source_path, REGISTRY_INDEX_PATH)
+
+    assert resolver.configs['llama-3.1-8b'].recommended_gpu == 'H100'
+
+
+def test_registry_loads_lazily(tmp_path):
+    """Test that the registry file is only read on first access."""
+    source_path = tmp_path / 'model_configs.json'
+    registry = ModelRegistry(source_path, index_path=None)
+
+    # Nothing is read yet, so a missing file is not an error
+    assert 'not loaded' in repr(registry)
+
+    source_path.write_text(json.dumps({'tiny-model': {'model_name': 'Tiny'}}), encoding='utf-8')
+    assert list(registry) == ['tiny-model']
+    assert registry['tiny-model'].recommended_gpu == 'L4'
+    assert registry.resolver.resolve('Tiny_Model.ipynb').model_name == 'Tiny'
@@ -0,0 +1,113 @@
+"""
+Tests for notebook reading and writing, including the fast path.
+"""
+
+import io
+import json
+import pytest
+from pathlib import Path
+
+import nbformat
+from nbformat.v4 import new_code_cell, new_markdown_cell, new_notebook, new_output
+
+from adapters import AdapterSession
+from adapters.notebook_io import (
+    notebook_to_json,
+    read_notebook,
+    validate_notebooks,
+    write_notebook
+)
+
+
+@pytest.fixture
+def templates_dir():
+    """Get templates directory."""
+    return Path(__file__).parent.parent / 'templates'
+
+
+@pytest.fixture
+def test_config():
+    """Test configuration."""
+    return {
+        'model_name': 'Test Model',
+        'launchable_name': 'test-model',
+        'recommended_batch_size': 4,
+        'categories': ['fine-tuning'],
+    }
+
+
+@pytest.fixture
+def notebook_path(tmp_path):
+    """Write a notebook with multi-line sources, outputs and transient metadata."""
+    notebook = new_notebook(cells=[
+        new_markdown_cell('# Title\n\nSome **text**'),
+        new_code_cell(
+            '!pip install unsloth\nimport torch\n',
+            outputs=[
+                new_output('stream', name='stdout', text='line 1\nline 2\n'),
+                new_output('display_data', data={'text/plain': 'a\nb', 'application/json': {'k': [1]}}),
+            ],
+            execution_count=3,
+        ),
+    ])
+    notebook.metadata['widgets'] = {'state': {}}
+    notebook.cells[1].metadata['trusted'] = True
+    path = tmp_path / 'sample.ipynb'
+    with open(path, 'w', encoding='utf-8') as f:
+        nbformat.write(notebook, f)
+    return path
+
+
+def test_fast_read_normalises_sources(notebook_path):
+    """Test that the fast loader joins split fields and strips transient metadata."""
+    on_disk = json.loads(notebook_path.read_text())
+    assert isinstance(on_disk['cells'][1]['source'], list)
+
+    notebook = read_notebook(notebook_path, fast=True)
+    assert type(notebook) is dict
+    assert notebook['cells'][0]['source'] == '# Title\n\nSome **text**'
+    assert notebook['cells'][1]['source'] == '!pip install unsloth\nimport torch\n'
+    assert notebook['cells'][1]['outputs'][0]['text'] == 'line 1\nline 2\n'
+    assert notebook['cells'][1]['outputs'][1]['data']['text/plain'] == 'a\nb'
+    assert 'trusted' not in notebook['cells'][1]['metadata']
+    assert notebook == read_notebook(notebook_path)
+
+
+def test_fast_write_matches_nbformat(notebook_path):
+    """Test that the fast writer produces nbformat's exact output."""
+    notebook = read_notebook(notebook_path)
+    expected = io.StringIO()
+    nbformat.write(notebook, expected)
+
+    assert notebook_to_json(notebook) == expected.getvalue()
+    assert notebook_to_json(read_notebook(notebook_path, fast=True)) == expected.getvalue()
+    # Serializing does not split the in-memory sources
+    assert isinstance(notebook.cells[1].source, str)
+
+
+def test_fast_adapt_matches_default(notebook_path, templates_dir, test_config, tmp_path):
+    """Test that adapting with fast I/O writes the same notebook as the default path."""
+    outputs = {}
+    for fast in (False, True):
+        session = AdapterSession(templates_dir, fast_io=fast)
+        notebook, _ = session.adapt(notebook_path, test_config)
+        notebook['cells'][0]['id'] = 'header'
+        output = tmp_path / f'out-{fast}.ipynb'
+        session.write_notebook(notebook, output)
+        outputs[fast] = output.read_text()
+
+    assert outputs[True] == outputs[False]
+    assert 'widgets' not in json.loads(outputs[True])['metadata']
+
+
+def test_validate_notebooks(notebook_path, tmp_path):
+    """Test batched schema validation of written notebooks."""
+    invalid = tmp_path / 'invalid.ipynb'
+    notebook = read_notebook(notebook_path, fast=True)
+    notebook['cells'][0]['cell_type'] = 'unknown'
+    write_notebook(notebook, invalid, fast=True)
+    broken = tmp_path / 'broken.ipynb'
+    broken.write_text('{')
+
+    errors = validate_notebooks([notebook_path, invalid, broken])
+    assert [path for path, _ in errors] == [invalid, broken]
@@ -10,7 +10,7 @@ from pathlib import Path
 import nbformat
 from nbformat.v4 import new_code_cell, new_notebook
 
-from adapters import ColabToBrevAdapter, get_config_for_notebook
+from adapters import AdapterSession, ColabToBrevAdapter, get_config_for_notebook
 
 
 @pytest.fixture
@@ -77,6 +77,8 @@ def test_notebook_adaptation(adapter, sample_notebook, test_config, tmp_path):
     assert len(adapted_notebook.cells) == len(sample_notebook.cells) + 1
     assert adapted_notebook.cells[0].cell_type == 'markdown'
     assert 'Powered by Brev' in adapted_notebook.cells[0].source
+    # Generated header is not rewritten by the conversions
+    assert 'from `/content/` to `/workspace/`' in adapted_notebook.cells[0].source
     
     # Check that conversions were applied to code cells
     all_code = '\n'.join(
@@ -166,3 +168,22 @@ def test_multiple_conversions_idempotent(adapter, test_config):
     assert '!pip' not in result1
     assert '!pip' not in result2
 
+
+
+def test_adapter_session_reuses_adapter(templates_dir, sample_notebook, test_config, tmp_path):
+    """Test that a session adapts many notebooks with one adapter."""
+    session = AdapterSession(templates_dir)
+    adapter = session.adapter
+    templates = dict(adapter.templates)
+
+    for name in ['first.ipynb', 'second.ipynb']:
+        notebook_path = tmp_path / name
+        with open(notebook_path, 'w') as f:
+            nbformat.write(sample_notebook, f)
+        adapted_notebook, companion_files = session.adapt(notebook_path, test_config)
+        assert 'Powered by Brev' in adapted_notebook.cells[0].source
+        assert len(companion_files) == 5
+
+    assert session.notebooks_adapted == 2
+    assert session.adapter is adapter
+    assert all(adapter.templates[name] is template for name, template in templates.items())
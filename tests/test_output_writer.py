@@ -0,0 +1,64 @@
+"""
+Tests for the atomic, write-if-changed output writer.
+"""
+
+import os
+import pytest
+from pathlib import Path
+
+from adapters import AdapterSession
+from adapters.output_writer import write_if_changed
+
+
+@pytest.fixture
+def templates_dir():
+    """Get templates directory."""
+    return Path(__file__).parent.parent / 'templates'
+
+
+def test_write_if_changed_skips_identical_content(tmp_path):
+    """Test that identical content leaves the file and its mtime alone."""
+    path = tmp_path / 'setup.sh'
+    assert write_if_changed(path, '#!/bin/bash\n')
+    os.utime(path, (1_000_000, 1_000_000))
+
+    assert not write_if_changed(path, '#!/bin/bash\n')
+    assert path.stat().st_mtime == 1_000_000
+
+    assert write_if_changed(path, '#!/bin/bash\necho hi\n')
+    assert path.read_text() == '#!/bin/bash\necho hi\n'
+    assert path.stat().st_mtime != 1_000_000
+
+
+def test_write_if_changed_is_atomic(tmp_path):
+    """Test that rewrites keep permissions and leave no temporary files."""
+    path = tmp_path / 'setup.sh'
+    path.write_text('old')
+    path.chmod(0o755)
+
+    assert write_if_changed(path, b'new')
+    assert path.read_bytes() == b'new'
+    assert path.stat().st_mode & 0o777 == 0o755
+    assert [p.name for p in tmp_path.iterdir()] == ['setup.sh']
+
+
+def test_write_if_changed_new_file_mode(tmp_path):
+    """Test that new files get the permissions open() would give them."""
+    umask = os.umask(0)
+    os.umask(umask)
+    path = tmp_path / 'requirements.txt'
+    write_if_changed(path, 'unsloth\n')
+    assert path.stat().st_mode & 0o777 == 0o666 & ~umask
+
+
+def test_session_counts_written_and_skipped_bytes(templates_dir, tmp_path):
+    """Test that the session reports bytes written versus skipped."""
+    session = AdapterSession(templates_dir)
+    path = tmp_path / 'README.md'
+
+    assert session.write_file(path, 'héllo')
+    assert not session.write_file(path, 'héllo')
+    stats = session.drain_stats()
+    assert stats['files_written'] == 1
+    assert stats['files_skipped'] == 1
+    assert stats['bytes_written'] == stats['bytes_skipped'] == len('héllo'.encode('utf-8'))
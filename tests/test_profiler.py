@@ -0,0 +1,100 @@
+"""
+Tests for per-conversion instrumentation.
+"""
+
+import json
+import pytest
+from pathlib import Path
+
+import nbformat
+from nbformat.v4 import new_code_cell, new_markdown_cell, new_notebook
+
+# Add parent directory to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adapters import ColabToBrevAdapter
+from adapters.profiler import ConversionProfiler
+from scripts.convert_notebook import convert_notebooks
+
+
+@pytest.fixture
+def templates_dir():
+    """Get templates directory."""
+    return Path(__file__).parent.parent / 'templates'
+
+
+@pytest.fixture
+def test_config():
+    """Test configuration."""
+    return {
+        'model_name': 'Test Model',
+        'launchable_name': 'test-model',
+        'recommended_batch_size': 4,
+        'categories': ['fine-tuning'],
+    }
+
+
+@pytest.fixture
+def notebook_paths(tmp_path):
+    """Write two small Colab-style notebooks."""
+    paths = []
+    for name in ['Gemma3_(4B)', 'Qwen3_(14B)']:
+        notebook = new_notebook(cells=[
+            new_markdown_cell('Save to /content/drive'),
+            new_code_cell('!pip install unsloth'),
+            new_code_cell('print("hello")'),
+        ])
+        path = tmp_path / f'{name}.ipynb'
+        with open(path, 'w') as f:
+            nbformat.write(notebook, f)
+        paths.append(path)
+    return paths
+
+
+def test_profiler_records_calls_changes_and_skips(templates_dir, test_config, notebook_paths):
+    """Test that the profile attributes calls, changes and skips correctly."""
+    adapter = ColabToBrevAdapter(templates_dir)
+    adapter.profiler = ConversionProfiler()
+    adapter.adapt(notebook_paths[0], test_config)
+
+    report = adapter.profiler.report()
+    magic = report['conversions']['magic_commands']
+    assert magic['calls'] == 1
+    assert magic['changed'] == 1
+    assert magic['skipped'] == 1  # the print() cell has no magic trigger
+    assert magic['seconds'] > 0
+    assert report['conversions']['storage']['cell_types']['markdown']['changed'] == 1
+    assert list(report['notebooks']) == [notebook_paths[0].name]
+    json.dumps(report)
+
+    calls = sum(m['calls'] for m in report['conversions'].values())
+    assert calls == adapter.stats['conversion_calls']
+    assert adapter.profiler.table()[1].split()[0] in report['conversions']
+
+
+def test_profiler_records_errors(templates_dir, test_config):
+    """Test that failing conversions are counted as errors."""
+    adapter = ColabToBrevAdapter(templates_dir)
+    adapter.profiler = ConversionProfiler()
+
+    def broken(code, config):
+        raise RuntimeError('boom')
+
+    adapter.register_conversion('broken', broken)
+    assert adapter._apply_conversions('x = 1', test_config) == 'x = 1'
+    assert adapter.profiler.report()['conversions']['broken']['errors'] == 1
+
+
+def test_parallel_profile_matches_serial(templates_dir, notebook_paths, tmp_path):
+    """Test that worker profiles are merged into the run's profiler."""
+    serial = ConversionProfiler()
+    parallel = ConversionProfiler()
+    convert_notebooks(notebook_paths, tmp_path / 'serial', templates_dir, jobs=1, profiler=serial)
+    convert_notebooks(notebook_paths, tmp_path / 'parallel', templates_dir, jobs=2, profiler=parallel)
+
+    def without_time(profiler):
+        return {key: value for key, value in profiler.counts.items() if key[3] != 'seconds'}
+
+    assert without_time(serial) == without_time(parallel)
+    assert set(serial.report()['notebooks']) == {p.name for p in notebook_paths}
@@ -0,0 +1,88 @@
+"""
+Stress and fuzz tests for the linear-time rewrite matchers.
+"""
+
+import random
+import re
+import pytest
+from pathlib import Path
+
+# Add parent directory to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adapters import ColabToBrevAdapter
+from adapters.colab_to_brev import REWRITE_RULES
+from benchmarks.bench_regex_stress import seconds_per_mb
+from benchmarks.synthetic import ADVERSARIAL_CELLS, adversarial_cell
+
+# Generous: linear matching runs at well under 0.2 s/MB, while the
+# backtracking patterns need minutes for a single megabyte
+BUDGET_SECONDS_PER_MB = 2.0
+
+MATCHER_RULES = [rule for rule in REWRITE_RULES if rule.matcher is not None]
+
+# Noise mixed into every fuzz case
+_NOISE = ['x', 'Q', ' ', '\n', '\n\n', '"', "'", '*', '[', ']', '(', ')', 'ſ', 'İ']
+
+# Fragments of each pattern, so fuzz cases contain many partial matches
+FUZZ_FRAGMENTS = {
+    'runtime_instructions': [
+        'To run this, press "*Runtime*" and press "*Run all*" on',
+        'TO RUN THIS,\npress Runtime and press Run all\n on',
+        'To run this,', 'Google Colab', 'colab', 'instance', 'NOTEBOOK',
+    ],
+    'runtime_press_run_all': ['press', 'press "Runtime', 'PRESS\n**runtime', 'Runtime', 'Run all', 'Google Colab', 'COLAB'],
+    'colab_drive_link': ['[', 'a', '](https://colab.research.google.com/drive/', '1abc', ')'],
+    'colab_badge_linked': ['[![', 'Open', '](https://colab.research.google.com/assets/colab-badge.svg)](', 'https://x', ')'],
+    'colab_links_section': ['Some other links:', 'Free Colab', 'free notebook', 'Free', '\n\nNext', '\n\n1.'],
+    'drive_import': ['from google.colab import drive', ' as d', '\n'],
+    'drive_mount': ['drive.mount(', "'/content/drive'", ')', '\n'],
+}
+
+
+@pytest.fixture(scope='module')
+def adapter():
+    """Create adapter instance."""
+    templates_dir = Path(__file__).parent.parent / 'templates'
+    return ColabToBrevAdapter(templates_dir)
+
+
+def test_every_matcher_is_fuzzed():
+    """Test that fuzz fragments stay in sync with the rules that use matchers."""
+    assert set(FUZZ_FRAGMENTS) == {rule.name for rule in MATCHER_RULES}
+    assert set(ADVERSARIAL_CELLS) == {rule.name for rule in MATCHER_RULES}
+
+
+@pytest.mark.parametrize('rule', MATCHER_RULES, ids=lambda rule: rule.name)
+def test_matcher_agrees_with_reference_pattern(rule):
+    """Test that a rule's matcher finds exactly what its regex finds."""
+    reference = re.compile(rule.pattern, rule.flags)
+    tokens = FUZZ_FRAGMENTS[rule.name] + _NOISE
+    rng = random.Random(rule.name)
+    matched = 0
+
+    for _ in range(3000):
+        text = ''.join(rng.choice(tokens) for _ in range(rng.randint(0, 25)))
+        expected = reference.subn(lambda m: f'<{m.group(0)}>', text)
+        assert rule.matcher.subn(lambda m: f'<{m.group(0)}>', text) == expected, text
+        assert rule.matcher.subn(rule.repl, text) == reference.subn(rule.repl, text), text
+        matched += expected[1] > 0
+
+    # The fragments must actually exercise the matching paths
+    assert matched > 100
+
+
+@pytest.mark.parametrize('kind', sorted(ADVERSARIAL_CELLS))
+def test_adversarial_cells_convert_in_linear_time(adapter, kind):
+    """Test conversion time per MB on pathological cells."""
+    # Small size first, so a regression fails fast instead of stalling
+    for size in (64_000, 1_000_000):
+        assert seconds_per_mb(adapter, kind, size) < BUDGET_SECONDS_PER_MB
+
+
+def test_adversarial_cell_size():
+    """Test that adversarial cells have roughly the requested size."""
+    for kind in ADVERSARIAL_CELLS:
+        source = adversarial_cell(kind, 10_000)
+        assert 9_000 <= len(source) <= 10_100
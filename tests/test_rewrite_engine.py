@@ -0,0 +1,129 @@
+"""
+Tests for the compiled rewrite engine.
+"""
+
+import re
+import pytest
+
+from adapters.colab_to_brev import REWRITE_RULES
+from adapters.rewrite_engine import ChainMatcher, LiteralScanner, RewriteEngine, RewriteRule, fold_case
+
+
+# One text per rule that the rule's regex matches
+RULE_SAMPLES = {
+    'colab_install': '!pip install  "UNSLOTH[colab-new] @ git+https://github.com/unslothai/unsloth.git"',
+    'capture_magic': '%%capture\n!pip install unsloth',
+    'runtime_instructions': 'To run this,\npress "*Runtime*" and press "*Run all*" on a free Tesla T4 Google Colab instance!',
+    'runtime_press_run_all': 'Press **RUNTIME** then **Run ALL** in colab',
+    'colab_github_link': '[x](https://colab.research.google.com/github/unslothai/notebooks/blob/main/x.ipynb)',
+    'colab_drive_link': '[Notebook](https://colab.research.google.com/drive/1abc)',
+    'colab_badge_markdown': '![open in colab](https://colab.research.google.com/assets/colab-badge.svg)',
+    'colab_badge_linked': '[![Colab](https://colab.research.google.com/assets/colab-badge.svg)](https://x)',
+    'colab_badge_html': '<A href="x" target="_parent"><img src="https://colab.research.google.com/assets/colab-badge.svg" alt="Open"></a>',
+    'colab_links_section': 'Some other links:\n1. FREE colab notebooks\n\nNext section',
+    'drive_import': 'from google.colab import drive\n',
+    'drive_mount': "drive.mount('/content/drive')\n",
+    'content_my_drive': '/content/drive/MyDrive/models',
+    'content_drive': '/content/drive',
+    'content_dir': '/content/outputs',
+    'from_pretrained_call': 'FastLanguageModel.from_pretrained (model_name="x")',
+    'output_dir': "output_dir = 'outputs'",
+    'batch_size': 'per_device_train_batch_size = 2',
+    'generation_call': 'trainer.generate(inputs)',
+}
+
+
+@pytest.fixture
+def engine():
+    """Create engine with the Colab to Brev rules."""
+    return RewriteEngine(REWRITE_RULES)
+
+
+def test_fold_case_matches_ignorecase():
+    """Test that folding exposes every ASCII literal re.IGNORECASE would match."""
+    for text in ['RUN ALL', 'Runtıme', 'RUNTİME', 'preſs']:
+        folded = fold_case(text)
+        for literal in ['run all', 'runtime', 'press']:
+            if re.search(re.escape(literal), text, re.IGNORECASE):
+                assert literal in folded
+
+
+def test_literal_scanner():
+    """Test scanning for literals."""
+    scanner = LiteralScanner(['Colab', '/content', 'colab', 'missing'])
+
+    assert scanner.scan('Open in COLAB at /content/x') == {'colab', '/content'}
+    assert scanner.scan('') == frozenset()
+
+    with pytest.raises(ValueError):
+        LiteralScanner(['café'])
+
+
+def test_every_rule_has_a_sample():
+    """Test that rule samples stay in sync with the rule set."""
+    assert set(RULE_SAMPLES) == {rule.name for rule in REWRITE_RULES}
+
+
+@pytest.mark.parametrize('rule', REWRITE_RULES, ids=lambda rule: rule.name)
+def test_rule_anchors_are_necessary(engine, rule):
+    """Test that a rule's prefilter never hides a real match."""
+    sample = RULE_SAMPLES[rule.name]
+
+    if rule.literal:
+        assert rule.pattern in sample
+    else:
+        assert re.search(rule.pattern, sample, rule.flags)
+    if rule.matcher is not None:
+        assert rule.matcher.search(sample)
+    assert rule.name in engine.candidates(sample)
+
+
+def test_engine_skips_rules_without_anchors(engine):
+    """Test that text without anchors returns the original object."""
+    code = 'import torch\nprint("hello")'
+
+    assert engine.candidates(code) == frozenset()
+    assert engine.sub('colab_github_link', code) is code
+    assert engine.subn('content_dir', code) == (code, 0)
+    assert engine.search('generation_call', code) is None
+
+
+def test_engine_rewrites(engine):
+    """Test regex and literal rules with default and explicit replacements."""
+    assert engine.sub('content_dir', 'p = "/content/x"') == 'p = "/workspace/x"'
+    assert engine.subn('batch_size', 'per_device_train_batch_size=2', 'per_device_train_batch_size=8') == (
+        'per_device_train_batch_size=8', 1
+    )
+
+
+def test_engine_rejects_duplicate_rules():
+    """Test duplicate rule names."""
+    with pytest.raises(ValueError):
+        RewriteEngine([RewriteRule('a', 'x', ''), RewriteRule('a', 'y', '')])
+
+
+def test_chain_matcher():
+    """Test lazy gaps, the until stop and the tail."""
+    matcher = ChainMatcher(r'start', steps=(r'a|b', r'c'), tail=r'!*')
+
+    match = matcher.search('x start b a c!! y')
+    assert match.span() == (2, 15)
+    assert match.group(0) == 'start b a c!!'
+    # Gaps do not cross newlines by default
+    assert matcher.search('start a\nc') is None
+    assert matcher.subn(lambda m: m.group(0).upper(), 'startac startbc') == ('STARTAC STARTBC', 2)
+    assert matcher.subn(r'[\g<0>]', 'startac startbc', count=1) == ('[startac] startbc', 1)
+
+    section = ChainMatcher(r'begin', until=r'\n\n[A-Z]', gap_excludes='')
+    assert section.sub('', 'begin\nx\n\nNext\n\nMore') == '\n\nNext\n\nMore'
+    assert section.sub('', 'text begin\nrest') == 'text '
+
+
+def test_engine_uses_rule_matcher():
+    """Test that a rule's matcher replaces its compiled pattern."""
+    engine = RewriteEngine([
+        RewriteRule('r', r'a.*?b', '-', anchors=('a',), matcher=ChainMatcher(r'a', steps=(r'b',)))
+    ])
+
+    assert engine.subn('r', 'a1b a2b') == ('- -', 2)
+    assert engine.search('r', 'xa\nb') is None
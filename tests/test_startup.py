@@ -0,0 +1,80 @@
+"""
+Tests for lazy package imports and lightweight script startup.
+"""
+
+import subprocess
+import sys
+import pytest
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import adapters
+from benchmarks.bench_startup import LIGHTWEIGHT_SCRIPTS, parse_importtime
+
+REPO_DIR = Path(__file__).parent.parent
+
+# Dependencies only the conversion itself needs
+HEAVY_MODULES = ('nbformat', 'jinja2', 'libcst', 'orjson')
+
+
+def loaded_heavy_modules(statement):
+    """Run a statement in a fresh interpreter and list the heavy modules it loaded."""
+    check = f"{statement}\nimport sys\nprint(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    result = subprocess.run(
+        [sys.executable, '-c', check],
+        cwd=REPO_DIR,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    return [module for module in result.stdout.strip().split(',') if module]
+
+
+def test_package_import_defers_heavy_dependencies():
+    """Test that importing the package and resolving a config stay light."""
+    assert loaded_heavy_modules(
+        "import adapters, adapters.build_time\n"
+        "adapters.get_config_for_notebook('Llama_3.1_(8B).ipynb')"
+    ) == []
+    assert 'nbformat' in loaded_heavy_modules('from adapters import AdapterSession')
+
+
+@pytest.mark.parametrize('script', LIGHTWEIGHT_SCRIPTS)
+def test_lightweight_scripts_defer_heavy_dependencies(script):
+    """Test that metadata scripts load without the conversion dependencies."""
+    assert loaded_heavy_modules(
+        f"import runpy; runpy.run_path('scripts/{script}', run_name='startup')"
+    ) == []
+
+
+def test_lazy_attributes():
+    """Test that public names resolve on access and unknown names still fail."""
+    from adapters.colab_to_brev import ColabToBrevAdapter
+
+    assert adapters.ColabToBrevAdapter is ColabToBrevAdapter
+    assert set(adapters.__all__) <= set(dir(adapters))
+    with pytest.raises(AttributeError):
+        adapters.NoSuchAdapter
+
+    namespace = {}
+    exec('from adapters import *', namespace)
+    assert set(adapters.__all__) <= set(namespace)
+
+
+def test_parse_importtime():
+    """Test parsing of the -X importtime report."""
+    report = (
+        "import time: self [us] | cumulative | imported package\n"
+        "import time:       120 |        120 |     _abc\n"
+        "import time:       850 |        970 |   abc\n"
+        "import time:      2300 |       3270 | adapters\n"
+        "unrelated output\n"
+    )
+
+    assert parse_importtime(report) == [
+        {'module': '_abc', 'depth': 2, 'self_us': 120, 'cumulative_us': 120},
+        {'module': 'abc', 'depth': 1, 'self_us': 850, 'cumulative_us': 970},
+        {'module': 'adapters', 'depth': 0, 'self_us': 2300, 'cumulative_us': 3270},
+    ]
@@ -0,0 +1,93 @@
+"""
+Tests for template bytecode caching and memoized rendering.
+"""
+
+import shutil
+import pytest
+from pathlib import Path
+
+# Add parent directory to path for imports
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from adapters import AdapterSession, ColabToBrevAdapter
+from adapters.colab_to_brev import TEMPLATE_NAMES
+from adapters.template_cache import TEMPLATE_OPTIONS, options_key
+
+
+@pytest.fixture
+def templates_dir(tmp_path):
+    """Copy the templates so tests can edit them."""
+    target = tmp_path / 'templates'
+    shutil.copytree(Path(__file__).parent.parent / 'templates', target)
+    return target
+
+
+@pytest.fixture
+def test_config():
+    """Test configuration."""
+    return {
+        'model_name': 'Test Model',
+        'launchable_name': 'test-model',
+        'recommended_gpu': 'L4',
+        'categories': ['fine-tuning'],
+    }
+
+
+def test_templates_compile_once(templates_dir, tmp_path, test_config):
+    """Test that a second adapter loads every template from the cache."""
+    cache_dir = tmp_path / 'cache'
+    first = ColabToBrevAdapter(templates_dir, cache_dir)
+    second = ColabToBrevAdapter(templates_dir, cache_dir)
+
+    assert first.stats['templates_compiled'] == len(TEMPLATE_NAMES)
+    assert second.stats['templates_compiled'] == 0
+    assert second.stats['templates_loaded'] == len(TEMPLATE_NAMES)
+    assert second._generate_readme(test_config) == first._generate_readme(test_config)
+    assert second._generate_readme(test_config) == ColabToBrevAdapter(templates_dir)._generate_readme(test_config)
+
+
+def test_changed_template_is_recompiled(templates_dir, tmp_path, test_config):
+    """Test that only an edited template is recompiled, and its new text is used."""
+    cache_dir = tmp_path / 'cache'
+    ColabToBrevAdapter(templates_dir, cache_dir)
+
+    readme = templates_dir / 'README.md.jinja2'
+    readme.write_text(readme.read_text(encoding='utf-8') + '\nEdited for {{ model_name }}\n', encoding='utf-8')
+    adapter = ColabToBrevAdapter(templates_dir, cache_dir)
+
+    assert adapter.stats['templates_compiled'] == 1
+    assert adapter.stats['templates_loaded'] == len(TEMPLATE_NAMES) - 1
+    assert 'Edited for Test Model' in adapter._generate_readme(test_config)
+
+
+def test_session_reports_template_stats(templates_dir, tmp_path):
+    """Test that template loading shows up in the session statistics."""
+    session = AdapterSession(templates_dir, template_cache_dir=tmp_path / 'cache')
+
+    assert session.drain_stats()['templates_compiled'] == len(TEMPLATE_NAMES)
+
+
+def test_cache_entries_are_namespaced_by_options():
+    """Test that environments with different options never share bytecode."""
+    assert options_key(TEMPLATE_OPTIONS) == options_key(dict(reversed(list(TEMPLATE_OPTIONS.items()))))
+    assert options_key(TEMPLATE_OPTIONS) != options_key({**TEMPLATE_OPTIONS, 'trim_blocks': False})
+
+
+def test_renders_are_memoized_on_template_variables(templates_dir, test_config):
+    """Test that identical template variables reuse the rendered text."""
+    adapter = ColabToBrevAdapter(templates_dir)
+    first = adapter._generate_readme(test_config)
+
+    assert adapter._generate_readme(dict(test_config)) is first
+    assert adapter.stats['template_renders'] == 1
+    assert adapter.stats['template_render_hits'] == 1
+
+    # Fields the template does not read do not split the cache
+    adapter._generate_docker_compose(test_config)
+    adapter._generate_docker_compose({**test_config, 'recommended_gpu': 'H100'})
+    assert adapter.stats['template_renders'] == 2
+
+    other = adapter._generate_readme({**test_config, 'recommended_gpu': 'H100'})
+    assert 'H100' in other and other != first
+    assert adapter.stats['template_renders'] == 3